@@ -235,23 +235,7 @@ def _handle_array_job(
     """Handle array job submission."""
     from hpc_runner.core.job_array import JobArray
 
-    # Parse array spec (e.g., "1-100", "1-100:10", "1-100%5")
-    # Basic parsing - could be enhanced
-    parts = array_spec.replace("%", ":").split(":")
-    range_parts = parts[0].split("-")
-
-    start = int(range_parts[0])
-    end = int(range_parts[1]) if len(range_parts) > 1 else start
-    step = int(parts[1]) if len(parts) > 1 else 1
-    max_concurrent = int(parts[2]) if len(parts) > 2 else None
-
-    array_job = JobArray(
-        job=job,
-        start=start,
-        end=end,
-        step=step,
-        max_concurrent=max_concurrent,
-    )
+    array_job = JobArray.from_spec(job, array_spec)
 
     if dry_run:
         console.print(f"[bold]Array job:[/bold] {array_job.range_str} ({array_job.count} tasks)")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import copy
 import os
 import re
 import sys
@@ -18,6 +19,12 @@ else:
 # Environment variable for site/system config
 HPC_CONFIG_ENV_VAR = "HPC_RUNNER_CONFIG"
 
+# ${VAR} (group 1) or $VAR (group 2, word characters only)
+_ENV_VAR_RE = re.compile(r"\$\{([^}]+)\}|\$([A-Za-z_][A-Za-z0-9_]*)")
+
+# Parsed TOML per resolved path, validated against (st_mtime_ns, st_size)
+_toml_cache: dict[Path, tuple[int, int, dict[str, Any]]] = {}
+
 
 @dataclass
 class HPCConfig:
@@ -30,6 +37,12 @@ class HPCConfig:
 
     _source_paths: list[Path] = field(default_factory=list, repr=False)
 
+    # Merged defaults + tool/type entry per (namespace, name). The sections
+    # above are treated as read-only once loaded.
+    _job_config_cache: dict[tuple[str, str], dict[str, Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
     def get_type_config(self, job_type: str) -> dict[str, Any]:
         """Get configuration for a job type.
 
@@ -48,8 +61,9 @@ class HPCConfig:
         Extracts tool name from command, looks up base config, then checks
         for option-specific overrides by matching against command arguments.
         """
-        parts = command.split()
-        tool = Path(parts[0]).name
+        # Only the first word names the tool; the rest is split on demand.
+        head, *rest = command.split(None, 1) or [""]
+        tool = head.rsplit("/", 1)[-1]
 
         # Start with defaults merged with base tool config.
         config = self._get_job_config(tool, namespace="tools")
@@ -57,8 +71,8 @@ class HPCConfig:
         # Check for option specialisation.
         tool_section = self.tools.get(tool, {})
         options = tool_section.get("options")
-        if options and len(parts) > 1:
-            cmd_tokens = _normalise_tokens(parts[1:])
+        if options and rest:
+            cmd_tokens = _normalise_tokens(rest[0].split())
             for option_key, option_config in options.items():
                 key_tokens = _normalise_tokens(option_key)
                 if _match_contiguous(cmd_tokens, key_tokens):
@@ -79,16 +93,25 @@ class HPCConfig:
             Defaults merged with the matching tool/type entry, or just
             defaults if *name* is not found in the requested namespace.
         """
-        config = self.defaults.copy()
-
-        section = self.types if namespace == "types" else self.tools
-        if name in section:
-            # Shallow copy to avoid mutating the original.
-            tool_config = section[name].copy()
-            tool_config.pop("options", None)  # Handled separately by get_tool_config
-            config = _merge(config, tool_config)
-
-        return config
+        key = (namespace, name)
+        config = self._job_config_cache.get(key)
+        if config is None:
+            config = self.defaults.copy()
+
+            section = self.types if namespace == "types" else self.tools
+            if name in section:
+                # Shallow copy to avoid mutating the original.
+                tool_config = section[name].copy()
+                tool_config.pop("options", None)  # Handled separately by get_tool_config
+                config = _merge(config, tool_config)
+
+            # Detach from the loaded sections so nothing aliases them
+            config = copy.deepcopy(config)
+            self._job_config_cache[key] = config
+
+        # Callers (e.g. Job) mutate the result and keep its lists, so each
+        # gets its own deep copy
+        return copy.deepcopy(config)
 
     def get_scheduler_config(self, scheduler: str) -> dict[str, Any]:
         """Get scheduler-specific configuration."""
@@ -142,9 +165,16 @@ def _merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
                 seen: set[Any] = set()
                 merged: list[Any] = []
                 for item in result[key] + value:
-                    if item not in seen:
+                    try:
+                        if item in seen:
+                            continue
                         seen.add(item)
-                        merged.append(item)
+                    except TypeError:
+                        # Unhashable entries (e.g. resource tables) fall back
+                        # to a linear scan of what has been kept so far
+                        if item in merged:
+                            continue
+                    merged.append(item)
                 result[key] = merged
         else:
             result[key] = value
@@ -154,24 +184,14 @@ def _merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
 def _expand_env_vars(path_str: str) -> str:
     """Expand environment variables in a path string.
 
-    Supports ${VAR} and $VAR syntax.
+    Supports ${VAR} and $VAR syntax. Undefined variables are left as-is.
     """
 
-    # Handle ${VAR} syntax
-    def replace_braced(match: re.Match[str]) -> str:
-        var_name = match.group(1)
-        return os.environ.get(var_name, match.group(0))
-
-    result = re.sub(r"\$\{([^}]+)\}", replace_braced, path_str)
-
-    # Handle $VAR syntax (word characters only)
-    def replace_simple(match: re.Match[str]) -> str:
-        var_name = match.group(1)
+    def replace(match: re.Match[str]) -> str:
+        var_name = match.group(1) or match.group(2)
         return os.environ.get(var_name, match.group(0))
 
-    result = re.sub(r"\$([A-Za-z_][A-Za-z0-9_]*)", replace_simple, result)
-
-    return result
+    return _ENV_VAR_RE.sub(replace, path_str)
 
 
 def _resolve_extends(config_path: Path, seen: set[Path] | None = None) -> list[Path]:
@@ -191,8 +211,7 @@ def _resolve_extends(config_path: Path, seen: set[Path] | None = None) -> list[P
     seen.add(config_path)
 
     try:
-        with open(config_path, "rb") as f:
-            data = tomllib.load(f)
+        data = _read_toml(config_path)
     except Exception:
         return [config_path]
 
@@ -207,8 +226,7 @@ def _resolve_extends(config_path: Path, seen: set[Path] | None = None) -> list[P
     if not extends_path.is_absolute():
         extends_path = config_path.parent / extends_path
 
-    extends_path = extends_path.resolve()
-
+    # The recursive call canonicalises extends_path itself
     if not extends_path.exists():
         # Warning but don't fail - the extends target might not exist yet
         return [config_path]
@@ -291,18 +309,41 @@ def find_config_file() -> Path | None:
 
 def _find_git_root(start: Path) -> Path | None:
     """Find git repository root."""
-    current = start.resolve()
-    while current != current.parent:
-        if (current / ".git").exists():
-            return current
-        current = current.parent
+    # Walk with plain strings; this runs for every config discovery and
+    # Path objects per ancestor add up on deep working directories.
+    current = os.path.realpath(start)
+    parent = os.path.dirname(current)
+    while current != parent:
+        if os.path.exists(os.path.join(current, ".git")):
+            return Path(current)
+        current, parent = parent, os.path.dirname(parent)
     return None
 
 
-def _load_single_config(path: Path) -> dict[str, Any]:
-    """Load a single config file and return its data dict."""
+def _read_toml(path: Path) -> dict[str, Any]:
+    """Parse a TOML file, reusing the previous parse if the file is unchanged.
+
+    Discovery reads every file twice (once for ``extends``, once to merge)
+    and ``reload_config()`` repeats the whole chain, so the parse is
+    memoised on the file's modification time and size. The returned dict
+    is shared with the cache and must not be mutated.
+    """
+    path = path.resolve()
+    st = path.stat()
+    cached = _toml_cache.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
     with open(path, "rb") as f:
         data: dict[str, Any] = tomllib.load(f)
+    _toml_cache[path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
+def _load_single_config(path: Path) -> dict[str, Any]:
+    """Load a single config file and return its data dict."""
+    # Deep copy so merged configs never alias the parse cache
+    data = copy.deepcopy(_read_toml(path))
 
     # Remove 'extends' key - it's metadata, not config
     data.pop("extends", None)
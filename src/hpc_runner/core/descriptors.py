@@ -1,5 +1,6 @@
 """Descriptor pattern for job attributes and scheduler arguments."""
 
+import sys
 from abc import ABC, abstractmethod
 from typing import Any, Generic, TypeVar, overload
 
@@ -34,10 +35,10 @@ class JobAttribute(Generic[T]):
     def __init__(self, name: str, *, default: T | None = None):
         self.public_name = name
         self.default = default
-        self._private_name: str = f"_{name}"
+        self._private_name: str = sys.intern(f"_{name}")
 
     def __set_name__(self, owner: type, name: str) -> None:
-        self._private_name = f"_{name}"
+        self._private_name = sys.intern(f"_{name}")
 
     @overload
     def __get__(self, obj: None, objtype: type) -> "JobAttribute[T]": ...
@@ -48,7 +49,9 @@ class JobAttribute(Generic[T]):
     def __get__(self, obj: Any, objtype: type | None = None) -> "T | None | JobAttribute[T]":
         if obj is None:
             return self
-        return getattr(obj, self._private_name, self.default)
+        # Read the instance dict directly: most attributes are never set, and
+        # getattr() with a default pays for a raised-and-caught AttributeError.
+        return obj.__dict__.get(self._private_name, self.default)  # type: ignore[no-any-return]
 
     def __set__(self, obj: Any, value: T | None) -> None:
         setattr(obj, self._private_name, value)
@@ -87,7 +90,7 @@ class SchedulerArg(ABC, Generic[T]):
         *,
         doc: str = "",
     ):
-        self.flag = flag
+        self.flag = sys.intern(flag)
         self.doc = doc
 
     @abstractmethod
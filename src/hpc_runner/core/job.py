@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import os
+import shlex
 from collections.abc import Iterator
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from hpc_runner.core.descriptors import JobAttribute
 from hpc_runner.core.resources import ResourceSet
@@ -100,6 +101,10 @@ class Job:
         "stderr",
     ]
 
+    # (name, descriptor) pairs for RENDERABLE_ATTRIBUTES, built per class on
+    # first use by _renderable_descriptors()
+    _renderable_cache: ClassVar[tuple[tuple[str, JobAttribute[Any]], ...]]
+
     # =========================================================================
     # Initialization
     # =========================================================================
@@ -138,9 +143,12 @@ class Job:
         pbs_args: list[str] | None = None,
         dependency: str | None = None,
     ):
-        # Command handling
+        # Command handling. A list command is kept alongside its joined form
+        # so backends that exec argv directly need not re-split the string.
+        self._argv: tuple[str, list[str]] | None = None
         if isinstance(command, list):
             self.command = " ".join(command)
+            self._argv = (self.command, list(command))
         else:
             self.command = command
 
@@ -335,7 +343,7 @@ class Job:
             The iteration order follows RENDERABLE_ATTRIBUTES, which is
             designed to produce sensible directive ordering.
         """
-        for attr_name in self.RENDERABLE_ATTRIBUTES:
+        for attr_name, descriptor in self._renderable_descriptors():
             value = getattr(self, attr_name)
 
             # Skip None values
@@ -344,12 +352,26 @@ class Job:
 
             # Skip False for boolean attributes (they're opt-in)
             # Exception: use_cwd and inherit_env default True, so False means explicit opt-out
-            descriptor = getattr(self.__class__, attr_name)
             if isinstance(value, bool) and value is False and descriptor.default is not True:
                 continue
 
             yield attr_name, value
 
+    @classmethod
+    def _renderable_descriptors(cls) -> tuple[tuple[str, JobAttribute[Any]], ...]:
+        """Return (name, descriptor) pairs for RENDERABLE_ATTRIBUTES.
+
+        Resolved once per class so rendering does not walk the MRO for every
+        attribute of every job. Subclasses get their own table.
+        """
+        table: tuple[tuple[str, JobAttribute[Any]], ...] | None = cls.__dict__.get(
+            "_renderable_cache"
+        )
+        if table is None:
+            table = tuple((name, getattr(cls, name)) for name in cls.RENDERABLE_ATTRIBUTES)
+            cls._renderable_cache = table
+        return table
+
     # =========================================================================
     # Properties
     # =========================================================================
@@ -359,6 +381,18 @@ class Job:
         """Whether to merge stderr into stdout."""
         return self.stderr is None
 
+    @property
+    def argv(self) -> list[str]:
+        """Command as an argument list.
+
+        Returns the list the job was created with, unless ``command`` has
+        since been reassigned, in which case the string is split with
+        shell-style quoting.
+        """
+        if self._argv is not None and self._argv[0] is self.command:
+            return list(self._argv[1])
+        return shlex.split(self.command)
+
     # =========================================================================
     # Helper Methods
     # =========================================================================
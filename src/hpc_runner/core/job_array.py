@@ -30,6 +30,30 @@ class JobArray:
     step: int = 1
     max_concurrent: int | None = None
 
+    @classmethod
+    def from_spec(cls, job: Job, spec: str) -> JobArray:
+        """Build an array job from a range specification.
+
+        Args:
+            job: Base job specification
+            spec: ``start[-end][:step][%max_concurrent]``, e.g. ``"1-100"``,
+                ``"1-100:10"`` or ``"1-100%5"``
+
+        Raises:
+            ValueError: If any part of *spec* is not an integer.
+        """
+        range_part, _, throttle = spec.partition("%")
+        range_part, _, step = range_part.partition(":")
+        start_str, _, end_str = range_part.partition("-")
+        start = int(start_str)
+        return cls(
+            job=job,
+            start=start,
+            end=int(end_str) if end_str else start,
+            step=int(step) if step else 1,
+            max_concurrent=int(throttle) if throttle else None,
+        )
+
     @property
     def range_str(self) -> str:
         """Format as scheduler range string."""
@@ -4,7 +4,7 @@ from collections.abc import Iterator
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Resource:
     """A scheduler resource request.
 
@@ -22,23 +22,32 @@ class Resource:
     _slurm_gres: str | None = field(default=None, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceSet:
     """Collection of resources for a job."""
 
     resources: list[Resource] = field(default_factory=list)
 
+    # Name index for get(); first resource with a given name wins, matching
+    # the order-preserving list. Kept in sync by add().
+    _by_name: dict[str, Resource] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        for r in self.resources:
+            self._by_name.setdefault(r.name, r)
+
     def add(self, name: str, value: int | str) -> "ResourceSet":
         """Add a resource to the set."""
-        self.resources.append(Resource(name, value))
+        r = Resource(name, value)
+        self.resources.append(r)
+        self._by_name.setdefault(name, r)
         return self
 
     def get(self, name: str) -> Resource | None:
         """Get a resource by name."""
-        for r in self.resources:
-            if r.name == name:
-                return r
-        return None
+        return self._by_name.get(name)
 
     def __iter__(self) -> Iterator[Resource]:
         return iter(self.resources)
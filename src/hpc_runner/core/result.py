@@ -22,6 +22,23 @@ class JobStatus(Enum):
     TIMEOUT = auto()  # Hit time limit
     UNKNOWN = auto()  # Cannot determine
 
+    @property
+    def display_label(self) -> str:
+        """Short label for tabular display (e.g. 'COMPLETE', 'CANCEL')."""
+        return _DISPLAY_LABELS[self]
+
+
+# Labels kept short to fit narrow status columns
+_DISPLAY_LABELS: dict[JobStatus, str] = {
+    JobStatus.RUNNING: "RUNNING",
+    JobStatus.PENDING: "PENDING",
+    JobStatus.COMPLETED: "COMPLETE",
+    JobStatus.FAILED: "FAILED",
+    JobStatus.CANCELLED: "CANCEL",
+    JobStatus.TIMEOUT: "TIMEOUT",
+    JobStatus.UNKNOWN: "UNKNOWN",
+}
+
 
 @dataclass
 class JobResult:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import itertools
 import os
 import subprocess
 import tempfile
@@ -27,7 +28,8 @@ class LocalScheduler(BaseScheduler):
 
     name = "local"
 
-    _job_counter: int = 0
+    # next() on a count is atomic, so concurrent submits get distinct IDs
+    _job_counter = itertools.count(1)
 
     def __init__(self) -> None:
         """Initialize local scheduler with config-driven settings."""
@@ -45,8 +47,8 @@ class LocalScheduler(BaseScheduler):
 
     def submit(self, job: Job, interactive: bool = False, keep_script: bool = False) -> JobResult:
         """Run job as local subprocess."""
-        LocalScheduler._job_counter += 1
-        job_id = f"local_{LocalScheduler._job_counter}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        job_num = next(LocalScheduler._job_counter)
+        job_id = f"local_{job_num}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
 
         # Set up environment
         env = os.environ.copy() if job.inherit_env else {}
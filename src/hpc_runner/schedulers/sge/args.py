@@ -4,6 +4,8 @@ Each class knows how to render a single job attribute to SGE syntax,
 both as a script directive (#$ ...) and as command-line arguments.
 """
 
+import sys
+
 from hpc_runner.core.descriptors import SchedulerArg
 
 
@@ -15,15 +17,21 @@ class SGEArg(SchedulerArg[str]):
     - CLI args: -flag value
     """
 
+    def __init__(self, flag: str, *, doc: str = ""):
+        super().__init__(flag, doc=doc)
+        # Rendered once here rather than on every job submission
+        self._option = sys.intern(f"-{flag}")
+        self._directive_prefix = f"#$ -{flag} "
+
     def to_args(self, value: str | None) -> list[str]:
         if value is None:
             return []
-        return [f"-{self.flag}", str(value)]
+        return [self._option, str(value)]
 
     def to_directive(self, value: str | None) -> str | None:
         if value is None:
             return None
-        return f"#$ -{self.flag} {value}"
+        return f"{self._directive_prefix}{value}"
 
 
 # =============================================================================
@@ -45,6 +45,9 @@ from hpc_runner.templates import render_template
 
 logger = logging.getLogger(__name__)
 
+# Job attributes qrsh accepts; qsub-only options (-S, -o/-e, -j, -N) are dropped
+QRSH_COMPATIBLE = frozenset({"inherit_env", "use_cwd", "cpu", "mem", "time", "queue"})
+
 if TYPE_CHECKING:
     from hpc_runner.core.job import Job
     from hpc_runner.core.job_array import JobArray
@@ -231,13 +234,8 @@ class SGEScheduler(BaseScheduler):
         - Does NOT support: -S (shell), -o/-e (output), -j (join), -N (name)
         - Does support: -V, -pe, -l, -q, -cwd
         """
-        import shlex
-
         cmd = ["qrsh"]
 
-        # Only include qrsh-compatible options
-        QRSH_COMPATIBLE = {"inherit_env", "use_cwd", "cpu", "mem", "time", "queue"}
-
         for attr_name, value in job.iter_attributes():
             if attr_name not in QRSH_COMPATIBLE:
                 continue
@@ -248,9 +246,9 @@ class SGEScheduler(BaseScheduler):
         cmd.extend(job.raw_args)
         cmd.extend(job.sge_args)
 
-        # Add the command - split it back into parts for proper argument handling
-        # This preserves quoting: "bash -c 'echo hello'" -> ['bash', '-c', 'echo hello']
-        cmd.extend(shlex.split(job.command))
+        # Add the command as separate arguments. String commands are split
+        # with shell quoting: "bash -c 'echo hello'" -> ['bash', '-c', 'echo hello']
+        cmd.extend(job.argv)
 
         return cmd
 
@@ -358,9 +356,6 @@ class SGEScheduler(BaseScheduler):
         """Build qrsh command to run wrapper script."""
         cmd = ["qrsh"]
 
-        # Only include qrsh-compatible options
-        QRSH_COMPATIBLE = {"inherit_env", "use_cwd", "cpu", "mem", "time", "queue"}
-
         for attr_name, value in job.iter_attributes():
             if attr_name not in QRSH_COMPATIBLE:
                 continue
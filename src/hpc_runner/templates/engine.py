@@ -11,6 +11,10 @@ _PACKAGE_DIR = Path(__file__).parent
 
 _env: jinja2.Environment | None = None
 
+# Compiled templates by name. Templates ship with the package and do not
+# change at runtime, so each is loaded and compiled at most once.
+_template_cache: dict[str, jinja2.Template] = {}
+
 
 def _get_env() -> jinja2.Environment:
     """Get or create the Jinja2 environment."""
@@ -21,6 +25,7 @@ def _get_env() -> jinja2.Environment:
             trim_blocks=True,
             lstrip_blocks=True,
             keep_trailing_newline=True,
+            auto_reload=False,
         )
     return _env
 
@@ -35,8 +40,10 @@ def render_template(name: str, **context: Any) -> str:
     Returns:
         Rendered template content
     """
-    env = _get_env()
-    template = env.get_template(name)
+    template = _template_cache.get(name)
+    if template is None:
+        template = _get_env().get_template(name)
+        _template_cache[name] = template
     return template.render(**context)
 
 
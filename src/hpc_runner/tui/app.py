@@ -7,6 +7,7 @@ Uses modern Textual patterns:
 - Message-based event handling
 """
 
+import asyncio
 import os
 import socket
 from pathlib import Path
@@ -311,17 +312,25 @@ class HpcMonitorApp(App[None]):
         """Handle job selection in the table.
 
         Fetches detailed job info (including output paths) when a job is selected.
+        The fetch runs as an exclusive worker, so selecting another job cancels
+        a lookup that is still in flight.
         """
-        # Start with basic info from the event
-        job_info = event.job_info
-        if job_info is None:
+        if event.job_info is None:
             return
+        self.run_worker(
+            self._fetch_job_details(event.job_info),
+            exclusive=True,
+            group="job-details",
+        )
+
+    async def _fetch_job_details(self, job_info: JobInfo) -> None:
+        """Worker to fetch job details and update the detail panel."""
         self._selected_job_extra = {}
         self._last_detail_error: str | None = None
 
         # Try to get detailed info (including stdout/stderr paths)
         try:
-            result = self._scheduler.get_job_details(job_info.job_id)
+            result = await asyncio.to_thread(self._scheduler.get_job_details, job_info.job_id)
             # Handle tuple return (JobInfo, extra_details)
             if isinstance(result, tuple):
                 job_info, self._selected_job_extra = result
@@ -330,7 +339,6 @@ class HpcMonitorApp(App[None]):
         except (NotImplementedError, Exception) as exc:
             # Scheduler doesn't support details or call failed - use basic info
             self._last_detail_error = f"{type(exc).__name__}: {exc}"
-            pass
 
         try:
             detail_panel = self.query_one("#detail-panel", DetailPanel)
@@ -379,7 +387,12 @@ class HpcMonitorApp(App[None]):
             self.query_one("#active-jobs", JobTable).focus()
 
         title = f"{stream}: {job.name}"
-        self.push_screen(LogViewerScreen(file_path=path, title=title), refocus_table)
+        # Follow the log live while the job may still be writing to it
+        provider = self._job_provider if job.is_active else None
+        self.push_screen(
+            LogViewerScreen(file_path=path, title=title, provider=provider),
+            refocus_table,
+        )
 
     def on_detail_panel_cancel_job(self, event: DetailPanel.CancelJob) -> None:
         """Handle request to cancel a job."""
@@ -410,14 +423,7 @@ class HpcMonitorApp(App[None]):
         """Worker to cancel job in background."""
         try:
             # Run cancel in thread pool to avoid blocking
-            import asyncio
-
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                self._scheduler.cancel,
-                job.job_id,
-            )
+            await asyncio.to_thread(self._scheduler.cancel, job.job_id)
             self.notify(f"Job {job.job_id} cancelled", severity="information", timeout=3)
             # Refresh the job list
             self._refresh_active_jobs()
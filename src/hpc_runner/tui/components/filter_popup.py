@@ -13,6 +13,9 @@ from textual.message import Message
 from textual.widgets import Input, OptionList, Static
 from textual.widgets.option_list import Option
 
+# Marker for "no FilterChanged posted yet" (None is a valid filter value)
+_NOT_POSTED = object()
+
 
 class HelpPopup(Static, can_focus=True):
     """Centered help popup with keybindings."""
@@ -219,6 +222,7 @@ class FilterPanel(Static, can_focus=True):
         self._current_index = 0
         self._title = title
         self._popup: FilterPanelPopup | None = None
+        self._last_posted_value: str | None | object = _NOT_POSTED
 
     def on_mount(self) -> None:
         """Set border title and create popup on mount."""
@@ -263,10 +267,16 @@ class FilterPanel(Static, can_focus=True):
             self._popup.show_popup(self.region)
 
     def _update_display(self) -> None:
-        """Update the displayed value and emit change event."""
+        """Update the displayed value and emit change event.
+
+        The event is only posted when the value differs from the last one
+        posted, so landing on the same option doesn't trigger a re-filter.
+        """
         label, value = self._options[self._current_index]
         self.update(label)
-        self.post_message(self.FilterChanged(self._filter_type, value))
+        if value != self._last_posted_value:
+            self._last_posted_value = value
+            self.post_message(self.FilterChanged(self._filter_type, value))
 
     def set_options(self, options: list[tuple[str, str | None]]) -> None:
         """Update available options."""
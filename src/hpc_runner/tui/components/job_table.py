@@ -1,11 +1,13 @@
 """Job table widget for displaying HPC jobs."""
 
+from functools import partial
+
 from textual.events import Resize
 from textual.message import Message
+from textual.timer import Timer
 from textual.widgets import DataTable
 
 from hpc_runner.core.job_info import JobInfo
-from hpc_runner.core.result import JobStatus
 
 
 class JobTable(DataTable[str]):
@@ -37,6 +39,9 @@ class JobTable(DataTable[str]):
         ("slots", "Slots", 6),
     ]
     NAME_COL_MIN = 15  # Minimum width for name column
+    SELECT_DEBOUNCE = 0.05  # Seconds the cursor must rest before JobSelected
+    # Column keys in display order (name sits after job_id)
+    _COLUMN_KEYS = ("job_id", "name", "user", "queue", "status", "runtime", "slots")
 
     def __init__(
         self,
@@ -62,6 +67,10 @@ class JobTable(DataTable[str]):
             classes=classes,
         )
         self._jobs: dict[str, JobInfo] = {}
+        self._row_index: dict[str, int] = {}
+        # Rendered cell values per job ID, in table row order
+        self._rendered: dict[str, tuple[str, ...]] = {}
+        self._select_timer: Timer | None = None
         self._name_col_width = 20  # Default, will be recalculated
 
     def on_mount(self) -> None:
@@ -159,74 +168,134 @@ class JobTable(DataTable[str]):
     def update_jobs(self, jobs: list[JobInfo]) -> None:
         """Update the table with a new list of jobs.
 
+        Rows are diffed against what is currently displayed: vanished jobs
+        are removed, new jobs appended and only changed cells rewritten.
+        If the surviving rows would end up in a different order the table
+        is rebuilt from scratch instead.
+
+        All rows are kept in the DataTable rather than only a visible
+        window: DataTable already renders just the lines in the viewport,
+        so with diffing the per-refresh table work scales with the number
+        of changed jobs, and native scrolling/cursor movement keep working.
+
         Args:
             jobs: List of JobInfo objects to display.
         """
-        # Save current selection to restore after update
-        selected_job_id: str | None = None
+        new_rows = {job.job_id: self._render_row(job) for job in jobs}
+        new_jobs = {job.job_id: job for job in jobs}
+
+        # Diffing keeps existing rows in place and appends new ones at the end
+        kept = [job_id for job_id in self._rendered if job_id in new_rows]
+        added = [job_id for job_id in new_rows if job_id not in self._rendered]
+        if kept + added != list(new_rows):
+            self._rebuild_rows(new_rows, new_jobs)
+            return
+
+        selected_job_id = self._selected_job_id()
+        structure_changed = len(kept) != len(self._rendered) or bool(added)
+
+        for job_id in [job_id for job_id in self._rendered if job_id not in new_rows]:
+            self.remove_row(job_id)
+            del self._rendered[job_id]
+
+        for job_id in kept:
+            old_cells = self._rendered[job_id]
+            cells = new_rows[job_id]
+            if cells != old_cells:
+                for column_key, old, new in zip(self._COLUMN_KEYS, old_cells, cells):
+                    if old != new:
+                        self.update_cell(job_id, column_key, new)
+                self._rendered[job_id] = cells
+
+        for job_id in added:
+            self.add_row(*new_rows[job_id], key=job_id)
+            self._rendered[job_id] = new_rows[job_id]
+
+        self._jobs = new_jobs
+        if structure_changed:
+            self._row_index = {job_id: i for i, job_id in enumerate(self._rendered)}
+            self._restore_selection(selected_job_id)
+
+    def _rebuild_rows(self, new_rows: dict[str, tuple[str, ...]], jobs: dict[str, JobInfo]) -> None:
+        """Clear the table and re-add every row in the given order."""
+        selected_job_id = self._selected_job_id()
+
+        self.clear()
+        self._jobs = jobs
+        self._rendered = {}
+        self._row_index = {}
+
+        for i, (job_id, cells) in enumerate(new_rows.items()):
+            self._rendered[job_id] = cells
+            self._row_index[job_id] = i
+            self.add_row(*cells, key=job_id)
+
+        self._restore_selection(selected_job_id)
+
+    def _render_row(self, job: JobInfo) -> tuple[str, ...]:
+        """Return the display values for a job, in column order.
+
+        Called for every job on every refresh, so the common cases avoid
+        extra method calls: names are only truncated when too long and the
+        status label is read straight off the enum.
+        """
+        name = job.name
+        if len(name) > self._name_col_width:
+            name = self._truncate_name(name)
+        return (
+            job.job_id,
+            name,
+            job.user,
+            job.queue or "—",
+            job.status.display_label,
+            job.runtime_display,
+            str(job.cpu) if job.cpu is not None else "—",
+        )
+
+    def _selected_job_id(self) -> str | None:
+        """Return the job ID under the cursor, if any."""
         if self.cursor_row is not None and self.cursor_row >= 0:
             try:
                 row_key = self.get_row_at(self.cursor_row)
                 if row_key:
-                    selected_job_id = str(row_key[0])
+                    return str(row_key[0])
             except Exception:
                 pass
+        return None
 
-        # Clear existing data
-        self.clear()
-        self._jobs.clear()
-
-        # Add new rows
-        for job in jobs:
-            self._jobs[job.job_id] = job
-            self.add_row(
-                job.job_id,
-                self._truncate_name(job.name),
-                job.user,
-                job.queue or "—",
-                self._format_status(job.status),
-                job.runtime_display,
-                str(job.cpu) if job.cpu is not None else "—",
-                key=job.job_id,
-            )
-
-        # Restore selection if the job still exists
-        if selected_job_id and selected_job_id in self._jobs:
+    def _restore_selection(self, job_id: str | None) -> None:
+        """Move the cursor back onto a job if it is still displayed."""
+        if job_id is None:
+            return
+        row_index = self._get_row_index(job_id)
+        if row_index is not None and row_index != self.cursor_row:
             try:
-                self.move_cursor(row=self._get_row_index(selected_job_id))
+                self.move_cursor(row=row_index)
             except Exception:
                 pass
 
     def _get_row_index(self, job_id: str) -> int | None:
         """Get the row index for a job ID."""
-        for idx, row_key in enumerate(self.rows.keys()):
-            if str(row_key.value) == job_id:
-                return idx
-        return None
+        return self._row_index.get(job_id)
 
-    def _format_status(self, status: JobStatus) -> str:
-        """Format status for display with color hints.
+    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        """Handle row highlight - emit JobSelected message.
 
-        The actual coloring is done via CSS classes, but we return
-        a clean status string here.
+        The message is debounced so holding an arrow key only selects the
+        row the cursor finally settles on.
         """
-        status_map = {
-            JobStatus.RUNNING: "RUNNING",
-            JobStatus.PENDING: "PENDING",
-            JobStatus.COMPLETED: "COMPLETE",
-            JobStatus.FAILED: "FAILED",
-            JobStatus.CANCELLED: "CANCEL",
-            JobStatus.TIMEOUT: "TIMEOUT",
-            JobStatus.UNKNOWN: "UNKNOWN",
-        }
-        return status_map.get(status, str(status.name))
-
-    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
-        """Handle row highlight - emit JobSelected message."""
         if event.row_key is not None:
-            job_id = str(event.row_key.value)
-            job_info = self._jobs.get(job_id)
-            self.post_message(self.JobSelected(job_id, job_info))
+            if self._select_timer is not None:
+                self._select_timer.stop()
+            self._select_timer = self.set_timer(
+                self.SELECT_DEBOUNCE,
+                partial(self._post_job_selected, str(event.row_key.value)),
+            )
+
+    def _post_job_selected(self, job_id: str) -> None:
+        """Emit JobSelected for a job once the cursor has settled."""
+        self._select_timer = None
+        self.post_message(self.JobSelected(job_id, self._jobs.get(job_id)))
 
     def get_selected_job(self) -> JobInfo | None:
         """Get the currently selected job.
@@ -7,11 +7,17 @@ to avoid blocking the UI.
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO
 
 from hpc_runner.core.exceptions import AccountingNotAvailable
 from hpc_runner.core.job_info import JobInfo
@@ -22,8 +28,109 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_EXECUTOR_WORKERS = 4
+
+
+def _executor_workers() -> int:
+    """Return the scheduler thread pool size.
+
+    Overridable via the HPC_TUI_EXECUTOR_WORKERS environment variable.
+    """
+    value = os.environ.get("HPC_TUI_EXECUTOR_WORKERS")
+    if value:
+        try:
+            return max(1, int(value))
+        except ValueError:
+            logger.warning(f"Ignoring invalid HPC_TUI_EXECUTOR_WORKERS={value!r}")
+    return _DEFAULT_EXECUTOR_WORKERS
+
+
 # Shared thread pool for scheduler calls
-_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="hpc-provider")
+_executor = ThreadPoolExecutor(max_workers=_executor_workers(), thread_name_prefix="hpc-provider")
+
+# Completed-job query cache: accounting queries are slow and rarely change
+_COMPLETED_CACHE_TTL = 30.0  # seconds
+_COMPLETED_CACHE_SIZE = 32
+
+# Live log following: how often to check for appended output, read size
+LOG_POLL_INTERVAL = 1.0  # seconds
+LOG_READ_CHUNK = 64 * 1024
+
+
+class _LogFollower:
+    """Single reader tailing one log file for any number of subscribers.
+
+    Holds the file open, polls it for appended bytes and broadcasts each
+    complete line to every subscriber queue. The file is only opened, read
+    and closed on executor threads, under a lock, so closing never races a
+    read that is still running after the polling task was cancelled.
+    """
+
+    def __init__(self, path: Path, offset: int) -> None:
+        self.path = path
+        self.offset = offset
+        self.subscribers: set[asyncio.Queue[str]] = set()
+        self._file: BinaryIO | None = None
+        self._buffer = b""
+        # Guards _file and _closed across executor threads
+        self._lock = threading.Lock()
+        self._closed = False
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start the polling task."""
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        """Stop the polling task."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _read_lines(self) -> list[str]:
+        """Read appended bytes and return the complete lines (runs in a thread)."""
+        with self._lock:
+            if self._closed:
+                # Stopped while this read was queued
+                return []
+            if self._file is None:
+                self._file = open(self.path, "rb")
+                self._file.seek(self.offset)
+            while chunk := self._file.read(LOG_READ_CHUNK):
+                self._buffer += chunk
+        complete, sep, self._buffer = self._buffer.rpartition(b"\n")
+        if not sep:
+            return []
+        return complete.decode("utf-8", errors="replace").split("\n")
+
+    def _close(self) -> None:
+        """Close the file once any read in progress has finished (runs in a thread)."""
+        with self._lock:
+            self._closed = True
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    async def _run(self) -> None:
+        """Poll the file and broadcast new lines until stopped."""
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                lines = await loop.run_in_executor(_executor, self._read_lines)
+                for line in lines:
+                    for queue in self.subscribers:
+                        queue.put_nowait(line)
+                await asyncio.sleep(LOG_POLL_INTERVAL)
+        except OSError as e:
+            logger.error(f"Error following log {self.path}: {e}")
+        finally:
+            # A cancelled read may still be running in the executor; closing
+            # there, behind it, also covers a file it opens after this point.
+            try:
+                _executor.submit(self._close)
+            except RuntimeError:
+                # Executor already shut down (interpreter exit): no reads left
+                self._close()
 
 
 class JobProvider:
@@ -45,6 +152,41 @@ class JobProvider:
         """
         self.scheduler = scheduler
         self.current_user = os.environ.get("USER", "unknown")
+        # Scheduler calls currently running, keyed on their arguments
+        self._inflight: dict[Hashable, asyncio.Future[Any]] = {}
+        # Accounting availability doesn't change while the TUI is running
+        self._has_accounting: bool | None = None
+        # Completed-job results keyed on query arguments: (timestamp, jobs)
+        self._completed_cache: OrderedDict[Hashable, tuple[float, list[JobInfo]]] = OrderedDict()
+        # Live log followers shared by all viewers of the same path
+        self._log_followers: dict[Path, _LogFollower] = {}
+
+    async def _coalesce(self, key: Hashable, call: Callable[[], Any]) -> Any:
+        """Run a scheduler call in the pool, sharing it with identical callers.
+
+        If a call with the same key is already in flight, await its result
+        instead of issuing another scheduler round-trip.
+
+        Args:
+            key: Hashable identity of the call (method name plus arguments).
+            call: Zero-argument callable performing the scheduler query.
+
+        Returns:
+            The result of the (possibly shared) call.
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(_executor, call)
+            self._inflight[key] = future
+
+            def _forget(done: asyncio.Future[Any]) -> None:
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+
+            future.add_done_callback(_forget)
+        # Shield so one cancelled waiter doesn't cancel the call for the others
+        return await asyncio.shield(future)
 
     async def get_active_jobs(
         self,
@@ -65,12 +207,19 @@ class JobProvider:
         # Determine user parameter
         user = self.current_user if user_filter == "me" else None
 
+        key = (
+            "active",
+            user,
+            frozenset(status_filter) if status_filter is not None else None,
+            queue_filter,
+        )
+
         try:
             # Run scheduler call in thread pool
-            loop = asyncio.get_event_loop()
-            jobs = await loop.run_in_executor(
-                _executor,
-                lambda: self.scheduler.list_active_jobs(
+            jobs: list[JobInfo] = await self._coalesce(
+                key,
+                functools.partial(
+                    self.scheduler.list_active_jobs,
                     user=user,
                     status=status_filter,
                     queue=queue_filter,
@@ -111,11 +260,21 @@ class JobProvider:
         """
         user = self.current_user if user_filter == "me" else None
 
+        key = ("completed", user, since, until, exit_code, queue_filter, limit)
+
+        cached = self._completed_cache.get(key)
+        if cached is not None:
+            stored_at, cached_jobs = cached
+            if time.monotonic() - stored_at < _COMPLETED_CACHE_TTL:
+                self._completed_cache.move_to_end(key)
+                return list(cached_jobs)
+            del self._completed_cache[key]
+
         try:
-            loop = asyncio.get_event_loop()
-            jobs = await loop.run_in_executor(
-                _executor,
-                lambda: self.scheduler.list_completed_jobs(
+            jobs: list[JobInfo] = await self._coalesce(
+                key,
+                functools.partial(
+                    self.scheduler.list_completed_jobs,
                     user=user,
                     since=since,
                     until=until,
@@ -124,6 +283,9 @@ class JobProvider:
                     limit=limit,
                 ),
             )
+            self._completed_cache[key] = (time.monotonic(), list(jobs))
+            while len(self._completed_cache) > _COMPLETED_CACHE_SIZE:
+                self._completed_cache.popitem(last=False)
             return jobs
         except AccountingNotAvailable:
             # Re-raise so caller can show appropriate message
@@ -149,10 +311,9 @@ class JobProvider:
             JobInfo with details, or None if not found/error.
         """
         try:
-            loop = asyncio.get_event_loop()
-            job = await loop.run_in_executor(
-                _executor,
-                lambda: self.scheduler.get_job_details(job_id),
+            job: tuple[JobInfo, dict[str, object]] = await self._coalesce(
+                ("details", job_id),
+                functools.partial(self.scheduler.get_job_details, job_id),
             )
             return job
         except Exception as e:
@@ -162,15 +323,21 @@ class JobProvider:
     async def has_accounting(self) -> bool:
         """Check if job accounting/history is available.
 
+        The first successful answer is cached for the lifetime of the
+        provider; errors are not cached so a transient failure can recover.
+
         Returns:
             True if completed job history is available.
         """
+        if self._has_accounting is not None:
+            return self._has_accounting
         try:
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(
+            loop = asyncio.get_running_loop()
+            self._has_accounting = await loop.run_in_executor(
                 _executor,
                 self.scheduler.has_accounting,
             )
+            return self._has_accounting
         except Exception as e:
             logger.error(f"Error checking accounting availability: {e}")
             return False
@@ -178,6 +345,9 @@ class JobProvider:
     async def cancel_job(self, job_id: str) -> bool:
         """Cancel a job.
 
+        A successful cancellation invalidates the completed-jobs cache, since
+        the job will shortly appear in the accounting records.
+
         Args:
             job_id: The job ID to cancel.
 
@@ -185,11 +355,53 @@ class JobProvider:
             True if cancellation succeeded.
         """
         try:
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(
+            loop = asyncio.get_running_loop()
+            cancelled: bool = await loop.run_in_executor(
                 _executor,
-                lambda: self.scheduler.cancel(job_id),
+                self.scheduler.cancel,
+                job_id,
             )
+            if cancelled:
+                self._completed_cache.clear()
+            return cancelled
         except Exception as e:
             logger.error(f"Error cancelling job {job_id}: {e}")
             return False
+
+    def watch_log(self, path: Path, offset: int = 0) -> asyncio.Queue[str]:
+        """Subscribe to lines appended to a log file.
+
+        All subscribers of a path share one reader. The reader is started by
+        the first subscriber, from its byte offset, and stopped when the
+        last one unsubscribes.
+
+        Args:
+            path: Log file to follow.
+            offset: Byte offset to start reading from if no reader exists yet.
+
+        Returns:
+            Queue receiving each new complete line (without line ending).
+        """
+        follower = self._log_followers.get(path)
+        if follower is None:
+            follower = _LogFollower(path, offset)
+            follower.start()
+            self._log_followers[path] = follower
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        follower.subscribers.add(queue)
+        return queue
+
+    def unwatch_log(self, path: Path, queue: asyncio.Queue[str]) -> None:
+        """Unsubscribe a queue returned by :meth:`watch_log`.
+
+        Args:
+            path: Log file being followed.
+            queue: The subscriber's queue.
+        """
+        follower = self._log_followers.get(path)
+        if follower is None:
+            return
+        follower.subscribers.discard(queue)
+        if not follower.subscribers:
+            follower.stop()
+            del self._log_followers[path]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import io
 from typing import TYPE_CHECKING, Any
 
 from textual.app import ComposeResult
@@ -44,6 +45,10 @@ class JobDetailsScreen(ModalScreen[None]):
         super().__init__(**kwargs)
         self._job = job
         self._extra = extra_details or {}
+        # Sorted once here rather than on every content build
+        self._sorted_resources: tuple[tuple[str, Any], ...] = tuple(
+            sorted(self._extra.get("resources", {}).items())
+        )
 
     def compose(self) -> ComposeResult:
         """Create the modal content."""
@@ -59,71 +64,62 @@ class JobDetailsScreen(ModalScreen[None]):
 
         # Build and display content
         content = self._build_content()
-        text_area = self.query_one("#job-details-content", TextArea)
-        text_area.load_text(content)
-        text_area.focus()
+        self._text_area = self.query_one("#job-details-content", TextArea)
+        self._text_area.load_text(content)
+        self._text_area.focus()
 
     def _build_content(self) -> str:
-        """Build the formatted job details content."""
+        """Build the formatted job details content.
+
+        Sections with nothing to show (no timing, resources or paths
+        known) are skipped entirely.
+        """
         job = self._job
-        lines: list[str] = []
+        out = io.StringIO()
+        w = out.write
         resources = self._extra.get("resources", {})
 
         # Section: Basic Info
-        lines.append("═══ Basic Information ═══")
-        lines.append("")
-        lines.append(f"  Job ID:      {job.job_id}")
-        lines.append(f"  Name:        {job.name}")
-        lines.append(f"  User:        {job.user}")
-        lines.append(f"  Status:      {job.status.name}")
-        lines.append(f"  Queue:       {job.queue or '—'}")
-        lines.append(f"  Node:        {job.node or '—'}")
-        lines.append("")
+        w("═══ Basic Information ═══\n\n")
+        w(f"  Job ID:      {job.job_id}\n")
+        w(f"  Name:        {job.name}\n")
+        w(f"  User:        {job.user}\n")
+        w(f"  Status:      {job.status.name}\n")
+        w(f"  Queue:       {job.queue or '—'}\n")
+        w(f"  Node:        {job.node or '—'}\n\n")
 
         # Section: Command
         job_args = self._extra.get("job_args", [])
         script = self._extra.get("script_file")
         command = self._extra.get("command")  # For qrsh interactive jobs
         if job_args or script or command:
-            lines.append("═══ Command ═══")
-            lines.append("")
+            w("═══ Command ═══\n\n")
             if command:
                 # Interactive job command (from QRSH_COMMAND)
-                lines.append(f"  Command:     {command}")
+                w(f"  Command:     {command}\n")
             elif script:
-                lines.append(f"  Script:      {script}")
+                w(f"  Script:      {script}\n")
                 if job_args:
-                    lines.append(f"  Arguments:   {' '.join(job_args)}")
-            lines.append("")
+                    w(f"  Arguments:   {' '.join(job_args)}\n")
+            w("\n")
 
         # Section: Timing
-        lines.append("═══ Timing ═══")
-        lines.append("")
-        if job.submit_time:
-            lines.append(f"  Submitted:   {job.submit_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        else:
-            lines.append("  Submitted:   —")
-        if job.start_time:
-            lines.append(f"  Started:     {job.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        else:
-            lines.append("  Started:     —")
-        if job.end_time:
-            lines.append(f"  Ended:       {job.end_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"  Runtime:     {job.runtime_display}")
-        lines.append("")
+        if job.submit_time or job.start_time or job.end_time or job.runtime is not None:
+            w("═══ Timing ═══\n\n")
+            if job.submit_time:
+                w(f"  Submitted:   {job.submit_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+            else:
+                w("  Submitted:   —\n")
+            if job.start_time:
+                w(f"  Started:     {job.start_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+            else:
+                w("  Started:     —\n")
+            if job.end_time:
+                w(f"  Ended:       {job.end_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+            w(f"  Runtime:     {job.runtime_display}\n\n")
 
         # Section: Resources
-        lines.append("═══ Resources ═══")
-        lines.append("")
-
-        # Slots from PE
         pe_name = self._extra.get("pe_name")
-        pe_range = self._extra.get("pe_range")
-        if pe_name:
-            lines.append(f"  PE:          {pe_name} ({pe_range or job.cpu or '?'} slots)")
-        else:
-            lines.append(f"  Slots/CPUs:  {job.cpu or '—'}")
-
         # Memory - check resources dict for common memory keys
         memory = job.memory
         if not memory:
@@ -131,64 +127,62 @@ class JobDetailsScreen(ModalScreen[None]):
                 if key in resources:
                     memory = resources[key]
                     break
-        if memory:
-            lines.append(f"  Memory:      {memory}")
-
-        # GPU
-        if job.gpu:
-            lines.append(f"  GPUs:        {job.gpu}")
+        if pe_name or job.cpu or memory or job.gpu or self._sorted_resources:
+            w("═══ Resources ═══\n\n")
 
-        # All requested resources
-        if resources:
-            lines.append("")
-            lines.append("  All Requested Resources:")
-            for name, value in sorted(resources.items()):
-                lines.append(f"    {name}: {value}")
-        lines.append("")
+            # Slots from PE
+            if pe_name:
+                pe_range = self._extra.get("pe_range")
+                w(f"  PE:          {pe_name} ({pe_range or job.cpu or '?'} slots)\n")
+            else:
+                w(f"  Slots/CPUs:  {job.cpu or '—'}\n")
+            if memory:
+                w(f"  Memory:      {memory}\n")
+            if job.gpu:
+                w(f"  GPUs:        {job.gpu}\n")
+
+            # All requested resources
+            if self._sorted_resources:
+                w("\n  All Requested Resources:\n")
+                for name, value in self._sorted_resources:
+                    w(f"    {name}: {value}\n")
+            w("\n")
 
         # Section: Paths
-        lines.append("═══ Paths ═══")
-        lines.append("")
         cwd = self._extra.get("cwd")
-        if cwd:
-            lines.append(f"  Working Dir: {cwd}")
-        lines.append(f"  Stdout:      {job.stdout_path or '—'}")
-        lines.append(f"  Stderr:      {job.stderr_path or '—'}")
-        lines.append("")
+        if cwd or job.stdout_path or job.stderr_path:
+            w("═══ Paths ═══\n\n")
+            if cwd:
+                w(f"  Working Dir: {cwd}\n")
+            w(f"  Stdout:      {job.stdout_path or '—'}\n")
+            w(f"  Stderr:      {job.stderr_path or '—'}\n\n")
 
         # Section: Dependencies
-        deps = self._extra.get("dependencies", [])
-        if deps or job.dependencies:
-            lines.append("═══ Dependencies ═══")
-            lines.append("")
-            all_deps = deps or job.dependencies or []
-            if all_deps:
-                for dep in all_deps:
-                    lines.append(f"  • {dep}")
-            else:
-                lines.append("  None")
-            lines.append("")
+        all_deps = self._extra.get("dependencies", []) or job.dependencies
+        if all_deps:
+            w("═══ Dependencies ═══\n\n")
+            for dep in all_deps:
+                w(f"  • {dep}\n")
+            w("\n")
 
         # Section: Array Job Info
         if job.array_task_id is not None:
-            lines.append("═══ Array Job ═══")
-            lines.append("")
-            lines.append(f"  Task ID:     {job.array_task_id}")
-            lines.append("")
+            w("═══ Array Job ═══\n\n")
+            w(f"  Task ID:     {job.array_task_id}\n\n")
 
         # Section: Other
         project = self._extra.get("project")
         department = self._extra.get("department")
         if project or department:
-            lines.append("═══ Other ═══")
-            lines.append("")
+            w("═══ Other ═══\n\n")
             if project:
-                lines.append(f"  Project:     {project}")
+                w(f"  Project:     {project}\n")
             if department:
-                lines.append(f"  Department:  {department}")
-            lines.append("")
+                w(f"  Department:  {department}\n")
+            w("\n")
 
-        return "\n".join(lines)
+        # Match the previous "\n".join() output, which had no trailing newline
+        return out.getvalue()[:-1]
 
     def action_close(self) -> None:
         """Close the details viewer."""
@@ -196,12 +190,11 @@ class JobDetailsScreen(ModalScreen[None]):
 
     def action_go_top(self) -> None:
         """Scroll to top."""
-        text_area = self.query_one("#job-details-content", TextArea)
-        text_area.cursor_location = (0, 0)
+        self._text_area.cursor_location = (0, 0)
 
     def action_go_bottom(self) -> None:
         """Scroll to bottom."""
-        text_area = self.query_one("#job-details-content", TextArea)
+        text_area = self._text_area
         text_area.cursor_location = (len(text_area.document.lines) - 1, 0)
 
     def action_screenshot(self) -> None:
@@ -2,23 +2,114 @@
 
 from __future__ import annotations
 
+import asyncio
+import mmap
+from collections import OrderedDict, deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, BinaryIO
 
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Vertical
 from textual.screen import ModalScreen
-from textual.widgets import Static, TextArea
+from textual.widgets import RichLog, Static
+
+if TYPE_CHECKING:
+    from hpc_runner.tui.providers import JobProvider
 
 # Maximum lines to read from large files
 MAX_LINES = 5000
 
+# Lines kept by the log widget: the tail plus the truncation banner, the
+# blank line after it and an unfinished last line. Followed output past
+# this drops the oldest lines.
+VIEW_MAX_LINES = MAX_LINES + 3
+
+# Files above this size only have their tail mapped and scanned
+LARGE_FILE_BYTES = 1_000_000
+
+# Bytes of tail mapped per requested line when reading large files
+TAIL_BYTES_PER_LINE = 200
+
+# Number of log files whose tail is kept between viewer opens
+LOG_CACHE_SIZE = 8
+
+
+@dataclass
+class _LogTail:
+    """Cached tail of an append-only log file.
+
+    Lines are kept as raw bytes (with line endings) and only decoded when
+    rendered. ``offset`` is the file position just after the last complete
+    line, so an unfinished final line is re-read on the next update.
+    """
+
+    total_lines: int | None
+    inode: int = 0
+    offset: int = 0
+    lines: deque[bytes] = field(default_factory=lambda: deque(maxlen=MAX_LINES))
+    partial: bytes = b""
+    # Last complete line, used to check the file was appended to, not rewritten
+    last_line: bytes = b""
+
+    def still_matches(self, f: BinaryIO) -> bool:
+        """Check the file still ends its known content with ``last_line``.
+
+        Leaves ``f`` positioned at ``offset`` ready for :meth:`consume`.
+        """
+        f.seek(self.offset - len(self.last_line))
+        return f.read(len(self.last_line)) == self.last_line
+
+    def consume(self, f: BinaryIO) -> None:
+        """Append lines read from binary file ``f`` (from its current position)."""
+        self.lines.extend(self._counted(f))
+        if self.lines and not self.lines[-1].endswith(b"\n"):
+            self.partial = self.lines.pop()
+            if self.total_lines is not None:
+                self.total_lines -= 1
+        else:
+            self.partial = b""
+        self.offset = f.tell() - len(self.partial)
+        self.last_line = self.lines[-1] if self.lines else b""
+
+    def _counted(self, lines: Iterable[bytes]) -> Iterable[bytes]:
+        """Yield lines, adding them to the running total line count."""
+        n = 0
+        for n, line in enumerate(lines, 1):
+            yield line
+        if self.total_lines is not None:
+            self.total_lines += n
+
+    def render(self, include_partial: bool = True) -> str:
+        """Return the displayed text, with a banner if it was truncated.
+
+        Args:
+            include_partial: Whether to show an unfinished final line. A
+                followed log leaves it out, as it arrives once completed.
+        """
+        partial = self.partial if include_partial else b""
+        text = (b"".join(self.lines) + partial).decode("utf-8", errors="replace")
+        text = text.removesuffix("\n")
+        shown = len(self.lines) + (1 if partial else 0)
+        if self.total_lines is None:
+            return f"[Large file - showing last {shown} lines]\n\n" + text
+        total = self.total_lines + (1 if partial else 0)
+        if total > shown:
+            return f"[Showing last {shown} of {total} lines]\n\n" + text
+        return text
+
+
+# Tails of recently viewed logs, keyed by path (least recently used first)
+_log_cache: OrderedDict[Path, _LogTail] = OrderedDict()
+
 
 class LogViewerScreen(ModalScreen[None]):
     """Modal screen for viewing job log files.
 
-    Displays file content in a scrollable text area.
+    Displays file content in a read-only, append-only log widget (no
+    editable document model is built for the text).
     Styles are defined in monitor.tcss.
     """
 
@@ -34,19 +125,39 @@ class LogViewerScreen(ModalScreen[None]):
         self,
         file_path: Path | str,
         title: str = "Log Viewer",
+        provider: JobProvider | None = None,
         **kwargs: Any,
     ) -> None:
+        """Initialize the log viewer.
+
+        Args:
+            file_path: Log file to display.
+            title: Dialog border title.
+            provider: If given, follow the log live through the provider's
+                shared tail reader (for jobs that are still running).
+        """
         super().__init__(**kwargs)
         self._file_path = Path(file_path) if isinstance(file_path, str) else file_path
         self._title = title
+        self._provider = provider
         self._content: str = ""
         self._error: str | None = None
+        # Byte offset the displayed content ends at, and the follow queue
+        self._follow_offset = 0
+        self._follow_queue: asyncio.Queue[str] | None = None
 
     def compose(self) -> ComposeResult:
         """Create the modal content."""
         with Vertical(id="log-viewer-dialog"):
             yield Static(str(self._file_path), id="log-viewer-path")
-            yield TextArea(id="log-viewer-content", read_only=True)
+            yield RichLog(
+                id="log-viewer-content",
+                max_lines=VIEW_MAX_LINES,
+                highlight=False,
+                markup=False,
+                wrap=False,
+                auto_scroll=True,
+            )
             yield Static("q/Esc close | g top | G bottom", id="log-viewer-hint")
 
     def on_mount(self) -> None:
@@ -54,99 +165,132 @@ class LogViewerScreen(ModalScreen[None]):
         dialog = self.query_one("#log-viewer-dialog", Vertical)
         dialog.border_title = self._title
 
-        # Load file content
-        self._load_file()
+        # Show a placeholder while the file is read off the UI thread
+        self._log_view = self.query_one("#log-viewer-content", RichLog)
+        self._log_view.write("Loading...")
+        self._log_view.focus()
+        self.run_worker(self._load_and_display(), exclusive=True)
 
-        # Update text area with content
-        text_area = self.query_one("#log-viewer-content", TextArea)
-        if self._error:
-            text_area.load_text(self._error)
-        else:
-            text_area.load_text(self._content)
-            # Scroll to bottom by default (most recent output)
-            text_area.action_cursor_line_end()
-            self.call_after_refresh(self._scroll_to_bottom)
+    async def _load_and_display(self) -> None:
+        """Read the log file in a thread, then display its content."""
+        await asyncio.to_thread(self._load_file)
+
+        # Content is written in one go and auto-scrolls to the end
+        # (most recent output)
+        self._log_view.clear()
+        self._log_view.write(self._error or self._content)
 
-        text_area.focus()
+        if self._provider is not None and self._error is None:
+            self._follow_queue = self._provider.watch_log(self._file_path, self._follow_offset)
+            self.run_worker(self._follow(self._follow_queue), group="follow")
 
-    def _scroll_to_bottom(self) -> None:
-        """Scroll text area to bottom."""
-        text_area = self.query_one("#log-viewer-content", TextArea)
-        # Move cursor to end of document
-        text_area.cursor_location = (len(text_area.document.lines) - 1, 0)
+    async def _follow(self, queue: asyncio.Queue[str]) -> None:
+        """Append lines from the provider's tail reader as they arrive."""
+        while True:
+            self._log_view.write(await queue.get())
+
+    def on_unmount(self) -> None:
+        """Stop following the log when the viewer closes."""
+        if self._provider is not None and self._follow_queue is not None:
+            self._provider.unwatch_log(self._file_path, self._follow_queue)
+            self._follow_queue = None
 
     def _load_file(self) -> None:
-        """Load content from the log file."""
+        """Load content from the log file.
+
+        Job logs are append-only, so the tail read for each path is cached
+        and re-opening the same log only reads the bytes appended since.
+        """
         if not self._file_path.exists():
             self._error = f"File not found:\n{self._file_path}"
             return
 
         try:
             # Check file size first
-            file_size = self._file_path.stat().st_size
+            st = self._file_path.stat()
 
-            if file_size == 0:
+            if st.st_size == 0:
                 self._content = "(empty file)"
                 return
 
-            # For large files, read only the last N lines
-            if file_size > 1_000_000:  # 1MB threshold
-                self._content = self._read_tail()
-            else:
-                self._content = self._file_path.read_text(encoding="utf-8", errors="replace")
-
-                # Truncate if too many lines
-                lines = self._content.splitlines()
-                if len(lines) > MAX_LINES:
-                    self._content = (
-                        f"[Showing last {MAX_LINES} of {len(lines)} lines]\n\n"
-                        + "\n".join(lines[-MAX_LINES:])
-                    )
+            tail = _log_cache.get(self._file_path)
+            if tail is None or tail.inode != st.st_ino or st.st_size < tail.offset:
+                # New, replaced or truncated file: read the tail from scratch
+                tail = self._read_tail(st.st_size)
+                tail.inode = st.st_ino
+            elif st.st_size > tail.offset:
+                with open(self._file_path, "rb") as f:
+                    if tail.still_matches(f):
+                        tail.consume(f)
+                    else:
+                        # Rewritten in place rather than appended to
+                        tail = self._read_tail(st.st_size)
+                        tail.inode = st.st_ino
+
+            _log_cache[self._file_path] = tail
+            _log_cache.move_to_end(self._file_path)
+            while len(_log_cache) > LOG_CACHE_SIZE:
+                _log_cache.popitem(last=False)
+
+            # When following, the unfinished last line is left for the
+            # follower to deliver once it is complete
+            following = self._provider is not None
+            self._content = tail.render(include_partial=not following)
+            self._follow_offset = tail.offset
 
         except PermissionError:
             self._error = f"Permission denied:\n{self._file_path}"
         except Exception as e:
             self._error = f"Error reading file:\n{e}"
 
-    def _read_tail(self) -> str:
-        """Read the last N lines of a large file efficiently."""
-        lines: list[str] = []
-        try:
-            with open(self._file_path, "rb") as f:
-                # Seek to end
-                f.seek(0, 2)
-                file_size = f.tell()
-
-                # Read chunks from end
-                chunk_size = 8192
-                position = file_size
-                remaining = b""
-
-                while position > 0 and len(lines) < MAX_LINES:
-                    read_size = min(chunk_size, position)
-                    position -= read_size
-                    f.seek(position)
-                    chunk = f.read(read_size) + remaining
-
-                    # Split into lines
-                    chunk_lines = chunk.split(b"\n")
-                    remaining = chunk_lines[0]
-                    lines = [
-                        line.decode("utf-8", errors="replace") for line in chunk_lines[1:]
-                    ] + lines
-
-                # Add any remaining content
-                if remaining and len(lines) < MAX_LINES:
-                    lines.insert(0, remaining.decode("utf-8", errors="replace"))
-
-            # Trim to MAX_LINES
-            if len(lines) > MAX_LINES:
-                lines = lines[-MAX_LINES:]
-
-            return f"[Large file - showing last {len(lines)} lines]\n\n" + "\n".join(lines)
-
-        except Exception as e:
-            return f"Error reading file: {e}"
+    def _read_tail(self, file_size: int) -> _LogTail:
+        """Read the last N lines of the file.
+
+        Small files are streamed line by line. For large files only the
+        tail region is mapped and walked backwards over newlines to find
+        where the last MAX_LINES lines start.
+        """
+        with open(self._file_path, "rb") as f:
+            # For small files, read everything and count the lines
+            if file_size <= LARGE_FILE_BYTES:
+                tail = _LogTail(total_lines=0)
+                tail.consume(f)
+                return tail
+
+            window = min(file_size, MAX_LINES * TAIL_BYTES_PER_LINE)
+            # mmap offsets must be aligned to the allocation granularity
+            granularity = mmap.ALLOCATIONGRANULARITY
+            offset = (file_size - window) // granularity * granularity
+
+            with mmap.mmap(
+                f.fileno(),
+                length=file_size - offset,
+                offset=offset,
+                access=mmap.ACCESS_READ,
+            ) as mm:
+                # Ignore a trailing newline when counting lines
+                cut = len(mm)
+                if mm[cut - 1 : cut] == b"\n":
+                    cut -= 1
+                found = 0
+                while found < MAX_LINES:
+                    pos = mm.rfind(b"\n", 0, cut)
+                    if pos < 0:
+                        break
+                    found += 1
+                    cut = pos
+
+                # Drop a partial first line if the window started mid-file
+                if found and (found == MAX_LINES or offset > 0):
+                    start = cut + 1
+                else:
+                    start = 0
+
+            # Total line count is unknown for large files
+            tail = _LogTail(total_lines=None)
+            f.seek(offset + start)
+            tail.consume(f)
+            return tail
 
     def action_close(self) -> None:
         """Close the log viewer."""
@@ -154,13 +298,11 @@ class LogViewerScreen(ModalScreen[None]):
 
     def action_go_top(self) -> None:
         """Scroll to top of file."""
-        text_area = self.query_one("#log-viewer-content", TextArea)
-        text_area.cursor_location = (0, 0)
+        self._log_view.scroll_home(animate=False)
 
     def action_go_bottom(self) -> None:
         """Scroll to bottom of file."""
-        text_area = self.query_one("#log-viewer-content", TextArea)
-        text_area.cursor_location = (len(text_area.document.lines) - 1, 0)
+        self._log_view.scroll_end(animate=False)
 
     def action_screenshot(self) -> None:
         """Save a screenshot."""
@@ -12,9 +12,17 @@ import sys
 from pathlib import Path
 
 from textual.color import Color
+from textual.containers import HorizontalGroup
+from textual.widgets import Header, Tab, TabbedContent
 
 from .app import HpcMonitorApp
 
+# Two-digit lowercase hex for each channel value, indexed 0-255.
+_HEX = tuple(f"{i:02x}" for i in range(256))
+
+# Expected active-tab background: the theme primary (#88C0D0)
+_PRIMARY_RGB = (136, 192, 208)
+
 
 def _is_transparent(color: Color | None) -> bool:
     """Check if a color is transparent."""
@@ -22,7 +30,7 @@ def _is_transparent(color: Color | None) -> bool:
         return True
     if color.a == 0:
         return True
-    if hasattr(color, "ansi") and color.ansi == -1:
+    if color.ansi == -1:
         return True
     return False
 
@@ -31,11 +39,11 @@ def _color_hex(color: Color | None) -> str:
     """Convert color to hex string for display."""
     if color is None:
         return "None"
-    if hasattr(color, "ansi") and color.ansi == -1:
+    if color.ansi == -1:
         return "ANSI_DEFAULT (transparent)"
     if color.a == 0:
         return "transparent (a=0)"
-    return f"#{color.r:02x}{color.g:02x}{color.b:02x}"
+    return "#" + _HEX[color.r] + _HEX[color.g] + _HEX[color.b]
 
 
 async def capture_and_review() -> bool:
@@ -44,110 +52,124 @@ async def capture_and_review() -> bool:
     Returns:
         True if all checks pass, False otherwise.
     """
-    from textual.containers import HorizontalGroup
-    from textual.widgets import Header, Tab, TabbedContent
-
     app = HpcMonitorApp()
     all_passed = True
+    # Collect the report and write it once at the end rather than paying a
+    # locked, line-buffered print() per status line.
+    report: list[str] = []
+    emit = report.append
+
+    try:
+        async with app.run_test(size=(80, 24)) as pilot:
+            await pilot.pause()
+
+            # Save screenshot
+            screenshot_path = Path("tui_snapshot.svg")
+            screenshot_path.write_bytes(app.export_screenshot().encode("utf-8"))
+
+            emit("=" * 60)
+            emit("TUI SNAPSHOT REVIEW")
+            emit("=" * 60)
+            emit(f"\nScreenshot saved to: {screenshot_path.absolute()}")
+            emit(f"Theme: {app.theme}")
+            emit(f"ANSI mode: {app.ansi_color}")
+
+            # Check Screen background
+            emit("\n--- Background Transparency ---")
+            screen_bg = app.screen.styles.background
+            screen_ok = _is_transparent(screen_bg)
+            status = "✓ PASS" if screen_ok else "✗ FAIL"
+            emit(f"  Screen background: {_color_hex(screen_bg)} {status}")
+            if not screen_ok:
+                all_passed = False
+                emit("    ^ Should be transparent for terminal background to show")
+
+            # Check Header
+            header = app.query_one(Header)
+            header_bg = header.styles.background
+            header_ok = _is_transparent(header_bg)
+            status = "✓ PASS" if header_ok else "✗ FAIL"
+            emit(f"  Header background: {_color_hex(header_bg)} {status}")
+            if not header_ok:
+                all_passed = False
 
-    async with app.run_test(size=(80, 24)) as pilot:
-        await pilot.pause()
-
-        # Save screenshot
-        screenshot_path = Path("tui_snapshot.svg")
-        app.save_screenshot(str(screenshot_path))
-
-        print("=" * 60)
-        print("TUI SNAPSHOT REVIEW")
-        print("=" * 60)
-        print(f"\nScreenshot saved to: {screenshot_path.absolute()}")
-        print(f"Theme: {app.theme}")
-        print(f"ANSI mode: {app.ansi_color}")
-
-        # Check Screen background
-        print("\n--- Background Transparency ---")
-        screen_bg = app.screen.styles.background
-        screen_ok = _is_transparent(screen_bg)
-        status = "✓ PASS" if screen_ok else "✗ FAIL"
-        print(f"  Screen background: {_color_hex(screen_bg)} {status}")
-        if not screen_ok:
-            all_passed = False
-            print("    ^ Should be transparent for terminal background to show")
-
-        # Check Header
-        header = app.query_one(Header)
-        header_bg = header.styles.background
-        header_ok = _is_transparent(header_bg)
-        status = "✓ PASS" if header_ok else "✗ FAIL"
-        print(f"  Header background: {_color_hex(header_bg)} {status}")
-        if not header_ok:
-            all_passed = False
-
-        # Check custom footer (#footer HorizontalGroup)
-        footer = app.query_one("#footer", HorizontalGroup)
-        footer_bg = footer.styles.background
-        footer_ok = _is_transparent(footer_bg)
-        status = "✓ PASS" if footer_ok else "✗ FAIL"
-        print(f"  Footer background: {_color_hex(footer_bg)} {status}")
-        if not footer_ok:
-            all_passed = False
-
-        # Check footer children (all should be transparent)
-        for child in footer.children:
-            child_bg = child.styles.background
-            child_ok = _is_transparent(child_bg)
-            status = "✓ PASS" if child_ok else "✗ FAIL"
-            child_classes = " ".join(child.classes) if child.classes else "(no class)"
-            print(f"    Footer child ({child_classes}): {_color_hex(child_bg)} {status}")
-            if not child_ok:
+            # Check custom footer (#footer HorizontalGroup)
+            footer = app.query_one("#footer", HorizontalGroup)
+            footer_bg = footer.styles.background
+            footer_ok = _is_transparent(footer_bg)
+            status = "✓ PASS" if footer_ok else "✗ FAIL"
+            emit(f"  Footer background: {_color_hex(footer_bg)} {status}")
+            if not footer_ok:
                 all_passed = False
 
-        # Check TabbedContent
-        tabbed = app.query_one(TabbedContent)
-        tabbed_bg = tabbed.styles.background
-        tabbed_ok = _is_transparent(tabbed_bg)
-        status = "✓ PASS" if tabbed_ok else "✗ FAIL"
-        print(f"  TabbedContent background: {_color_hex(tabbed_bg)} {status}")
-        if not tabbed_ok:
-            all_passed = False
-
-        # Check tabs
-        print("\n--- Tab Styling ---")
-        tabs = app.query(Tab)
-        for tab in tabs:
-            is_active = tab.has_class("-active")
-            bg = tab.styles.background
-
-            if is_active:
-                # Active tab should have primary color (#88C0D0)
-                active_ok = bg is not None and bg.r == 136 and bg.g == 192 and bg.b == 208
-                status = "✓ PASS" if active_ok else "✗ FAIL"
-                print(f"  Active tab '{tab.label.plain}': {_color_hex(bg)} {status}")
-                if not active_ok:
-                    all_passed = False
-                    print("    ^ Should be #88c0d0 (muted teal)")
-            else:
-                # Inactive tab should be transparent
-                inactive_ok = _is_transparent(bg)
-                status = "✓ PASS" if inactive_ok else "✗ FAIL"
-                print(f"  Inactive tab '{tab.label.plain}': {_color_hex(bg)} {status}")
-                if not inactive_ok:
+            # Check footer children (all should be transparent)
+            for child in footer.children:
+                child_bg = child.styles.background
+                child_ok = _is_transparent(child_bg)
+                status = "✓ PASS" if child_ok else "✗ FAIL"
+                child_classes = " ".join(child.classes) if child.classes else "(no class)"
+                emit(f"    Footer child ({child_classes}): {_color_hex(child_bg)} {status}")
+                if not child_ok:
                     all_passed = False
 
-        # Summary
-        print("\n" + "=" * 60)
-        if all_passed:
-            print("RESULT: ✓ All visual checks passed")
-        else:
-            print("RESULT: ✗ Some checks failed - review needed!")
-        print("=" * 60)
+            # Check TabbedContent
+            tabbed = app.query_one(TabbedContent)
+            tabbed_bg = tabbed.styles.background
+            tabbed_ok = _is_transparent(tabbed_bg)
+            status = "✓ PASS" if tabbed_ok else "✗ FAIL"
+            emit(f"  TabbedContent background: {_color_hex(tabbed_bg)} {status}")
+            if not tabbed_ok:
+                all_passed = False
 
+            # Check tabs
+            emit("\n--- Tab Styling ---")
+            tabs = app.query(Tab)
+            for tab in tabs:
+                is_active = tab.has_class("-active")
+                bg = tab.styles.background
+
+                if is_active:
+                    # Active tab should have primary color (#88C0D0)
+                    active_ok = bg is not None and (bg.r, bg.g, bg.b) == _PRIMARY_RGB
+                    status = "✓ PASS" if active_ok else "✗ FAIL"
+                    emit(f"  Active tab '{tab.label.plain}': {_color_hex(bg)} {status}")
+                    if not active_ok:
+                        all_passed = False
+                        emit("    ^ Should be #88c0d0 (muted teal)")
+                else:
+                    # Inactive tab should be transparent
+                    inactive_ok = _is_transparent(bg)
+                    status = "✓ PASS" if inactive_ok else "✗ FAIL"
+                    emit(f"  Inactive tab '{tab.label.plain}': {_color_hex(bg)} {status}")
+                    if not inactive_ok:
+                        all_passed = False
+
+            # Summary
+            emit("\n" + "=" * 60)
+            if all_passed:
+                emit("RESULT: ✓ All visual checks passed")
+            else:
+                emit("RESULT: ✗ Some checks failed - review needed!")
+            emit("=" * 60)
+    finally:
+        # Write whatever was collected, even if a check raised partway
+        if report:
+            sys.stdout.write("\n".join(report) + "\n")
     return all_passed
 
 
 def main() -> None:
     """Run snapshot review."""
-    passed = asyncio.run(capture_and_review())
+    # Prefer uvloop's faster event loop when it is installed.
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        uvloop = None
+    # uvloop.run() only exists from uvloop 0.18
+    if uvloop is not None and hasattr(uvloop, "run"):
+        passed = uvloop.run(capture_and_review())
+    else:
+        passed = asyncio.run(capture_and_review())
     sys.exit(0 if passed else 1)
 
 
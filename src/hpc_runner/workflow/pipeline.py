@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-from collections import deque
-from collections.abc import Iterator
+import asyncio
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 from hpc_runner.core.job import Job
+from hpc_runner.schedulers import get_scheduler
 from hpc_runner.workflow.dependency import DependencyType
 
 if TYPE_CHECKING:
@@ -15,7 +18,7 @@ if TYPE_CHECKING:
     from hpc_runner.schedulers.base import BaseScheduler
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineJob:
     """A job within a pipeline."""
 
@@ -24,6 +27,8 @@ class PipelineJob:
     depends_on: list[PipelineJob] = field(default_factory=list)
     dependency_type: DependencyType = field(default=DependencyType.AFTEROK)
     result: JobResult | None = None
+    # Position in the owning pipeline's job list, assigned by Pipeline.add()
+    _idx: int = field(default=-1, init=False, repr=False, compare=False)
 
 
 class Pipeline:
@@ -48,11 +53,22 @@ class Pipeline:
         results = p.submit(scheduler=my_scheduler)
     """
 
-    def __init__(self, name: str = "pipeline", scheduler: BaseScheduler | None = None) -> None:
+    def __init__(
+        self,
+        name: str = "pipeline",
+        scheduler: BaseScheduler | None = None,
+        max_in_flight: int | None = None,
+    ) -> None:
         self.name = name
         self.jobs: list[PipelineJob] = []
         self._name_map: dict[str, PipelineJob] = {}
         self._scheduler = scheduler
+        # Default cap on unfinished jobs during submit() (None = no cap)
+        self.max_in_flight = max_in_flight
+        # Dependency order, computed on first use and reset whenever add()
+        # changes the job graph.
+        self._topo_cache: list[PipelineJob] | None = None
+        self._level_cache: list[list[PipelineJob]] | None = None
 
     def add(
         self,
@@ -99,8 +115,11 @@ class Pipeline:
             depends_on=dependencies,
             dependency_type=dependency_type,
         )
+        pipeline_job._idx = len(self.jobs)
         self.jobs.append(pipeline_job)
         self._name_map[name] = pipeline_job
+        self._topo_cache = None
+        self._level_cache = None
 
         return pipeline_job
 
@@ -117,20 +136,54 @@ class Pipeline:
     def submit(
         self,
         scheduler: BaseScheduler | None = None,
+        *,
+        max_workers: int = 1,
+        max_in_flight: int | None = None,
+        poll_interval: float = 5.0,
+        timeout: float | None = None,
     ) -> dict[str, JobResult]:
         """Submit all jobs respecting dependencies.
 
         Jobs that were already submitted (from a previous partial attempt)
         are skipped.  Safe to call again after a partial failure.
 
+        By default jobs are submitted one at a time, in the order they were
+        added (or a dependency order if that is not one).  With
+        ``max_workers`` above 1, each dependency level is submitted
+        concurrently instead, since its jobs do not depend on each other.
+
         Args:
             scheduler: Scheduler to use (auto-detect if None).  Falls back
                 to the scheduler passed to ``__init__``, then auto-detect.
+            max_workers: Most ``scheduler.submit()`` calls in flight at once
+                within a dependency level.  The default of 1 submits
+                sequentially; only raise it for schedulers whose
+                ``submit()`` is safe to call from several threads.
+            max_in_flight: Most jobs from this call left unfinished at once,
+                to stay under a site's queued-job limit.  When the cap is
+                reached, submit() blocks, polling the unfinished jobs until
+                any of them completes.  Falls back to the value passed to
+                ``__init__``; None means no cap.
+            poll_interval: Seconds between status checks while waiting for
+                a free slot (only used with ``max_in_flight``).
+            timeout: Max seconds to wait for a free slot (None = forever).
 
         Returns:
             Dict mapping job names to results
+
+        Raises:
+            ValueError: If max_workers or max_in_flight is less than 1.
+            TimeoutError: If no job finished within ``timeout`` while the
+                cap was reached.  Jobs submitted so far keep their results,
+                so submit() can be called again to continue.
         """
-        from hpc_runner.schedulers import get_scheduler
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+        if max_in_flight is None:
+            max_in_flight = self.max_in_flight
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be at least 1, got {max_in_flight}")
 
         if not self.jobs:
             raise RuntimeError("Pipeline has no jobs to submit")
@@ -143,55 +196,155 @@ class Pipeline:
         if scheduler is None:
             scheduler = get_scheduler()
 
-        results: dict[str, JobResult] = {}
+        # Unfinished results submitted by this call (only when capped)
+        in_flight: list[JobResult] = []
 
-        for pjob in self._topological_sort():
+        # Each group holds mutually independent jobs whose dependencies are
+        # in earlier groups: one job per group unless submitting concurrently.
+        groups: Iterable[list[PipelineJob]]
+        if max_workers == 1:
+            groups = ([pjob] for pjob in self._topological_sort())
+        else:
+            groups = self._topological_levels()
+
+        for group in groups:
             # Skip already-submitted jobs (partial retry)
-            if pjob.result is not None:
-                results[pjob.name] = pjob.result
+            pending = [pjob for pjob in group if pjob.result is None]
+
+            for pjob in pending:
+                if pjob.depends_on:
+                    # Dependencies live in earlier groups, so each already
+                    # carries its result.
+                    pjob.job.dependencies = cast(
+                        "list[JobResult]", [d.result for d in pjob.depends_on]
+                    )
+                    pjob.job.dependency_type = pjob.dependency_type.value
+
+            if max_in_flight is None:
+                self._submit_level(scheduler, pending, max_workers)
                 continue
 
-            # Set up dependencies
-            if pjob.depends_on:
-                dep_results = [results[d.name] for d in pjob.depends_on]
-                pjob.job.dependencies = dep_results
-                pjob.job.dependency_type = str(pjob.dependency_type)
-
-            # Submit
-            result = scheduler.submit(pjob.job)
-            pjob.result = result
-            results[pjob.name] = result
+            while pending:
+                if len(in_flight) >= max_in_flight:
+                    self._wait_for_slot(in_flight, max_in_flight, poll_interval, timeout)
+                batch = pending[: max_in_flight - len(in_flight)]
+                self._submit_level(scheduler, batch, max_workers)
+                in_flight.extend(cast("JobResult", pjob.result) for pjob in batch)
+                pending = pending[len(batch) :]
 
-        return results
+        return cast("dict[str, JobResult]", {pj.name: pj.result for pj in self._topological_sort()})
 
-    def _topological_sort(self) -> list[PipelineJob]:
-        """Sort jobs by dependency order (Kahn's algorithm)."""
-        # Build in-degree map and forward adjacency list
-        in_degree: dict[str, int] = {}
-        dependents: dict[str, list[PipelineJob]] = {pj.name: [] for pj in self.jobs}
+    @staticmethod
+    def _wait_for_slot(
+        in_flight: list[JobResult], limit: int, poll_interval: float, timeout: float | None
+    ) -> None:
+        """Block until fewer than ``limit`` of the in-flight jobs are unfinished.
 
-        for pj in self.jobs:
-            in_degree[pj.name] = len(pj.depends_on)
-            for dep in pj.depends_on:
-                dependents[dep.name].append(pj)
+        Finished jobs are removed from ``in_flight``.  Every job's own
+        dependencies were submitted before it, so any of them can finish.
+        """
+        start = time.monotonic()
+        while True:
+            in_flight[:] = [r for r in in_flight if not r.is_complete]
+            if len(in_flight) < limit:
+                return
+            if timeout is not None and time.monotonic() - start >= timeout:
+                raise TimeoutError(
+                    f"No submitted job finished within {timeout}s "
+                    f"({len(in_flight)} still unfinished)"
+                )
+            time.sleep(poll_interval)
+
+    @staticmethod
+    def _submit_level(
+        scheduler: BaseScheduler, pending: list[PipelineJob], max_workers: int
+    ) -> None:
+        """Submit mutually independent jobs, concurrently when there are several.
+
+        Every successful submission is recorded on its PipelineJob before the
+        first failure (if any) is re-raised, so a retry never resubmits a job.
+        """
+        if len(pending) <= 1 or max_workers == 1:
+            for pjob in pending:
+                pjob.result = scheduler.submit(pjob.job)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as pool:
+            futures = [pool.submit(scheduler.submit, pjob.job) for pjob in pending]
+
+        error: BaseException | None = None
+        for pjob, future in zip(pending, futures):
+            exc = future.exception()
+            if exc is None:
+                pjob.result = future.result()
+            elif error is None:
+                error = exc
+        if error is not None:
+            raise error
 
-        # Process jobs with no remaining dependencies
-        queue = deque(pj for pj in self.jobs if in_degree[pj.name] == 0)
-        result: list[PipelineJob] = []
+    def _topological_sort(self) -> list[PipelineJob]:
+        """Sort jobs by dependency order.
 
-        while queue:
-            pj = queue.popleft()
-            result.append(pj)
+        Insertion order is kept whenever every job was added after its
+        dependencies (always the case unless ``depends_on`` was edited
+        directly).  The order is cached until the next call to :meth:`add`.
+        """
+        if self._topo_cache is None:
+            # Validates the graph and detects cycles
+            levels = self._topological_levels()
+            if all(dep._idx < pj._idx for pj in self.jobs for dep in pj.depends_on):
+                self._topo_cache = list(self.jobs)
+            else:
+                self._topo_cache = [pj for level in levels for pj in level]
+        return self._topo_cache
+
+    def _topological_levels(self) -> list[list[PipelineJob]]:
+        """Group jobs into dependency levels (Kahn's algorithm, layer by layer).
+
+        Every job's dependencies sit in earlier levels. The grouping is
+        cached until the next call to :meth:`add`.
+        """
+        if self._level_cache is not None:
+            return self._level_cache
 
-            for dependent in dependents[pj.name]:
-                in_degree[dependent.name] -= 1
-                if in_degree[dependent.name] == 0:
-                    queue.append(dependent)
+        # Build in-degree counts and forward adjacency over job positions
+        jobs = self.jobs
+        n = len(jobs)
+        in_degree = [0] * n
+        dependents: list[list[int]] = [[] for _ in range(n)]
 
-        if len(result) != len(self.jobs):
+        for pj in jobs:
+            in_degree[pj._idx] = len(pj.depends_on)
+            for dep in pj.depends_on:
+                d = dep._idx
+                if not 0 <= d < n or jobs[d] is not dep:
+                    raise ValueError(
+                        f"Dependency '{dep.name}' of '{pj.name}' is not part of this pipeline"
+                    )
+                dependents[d].append(pj._idx)
+
+        # Peel off all jobs with no remaining dependencies, one level at a time
+        levels: list[list[PipelineJob]] = []
+        level = [i for i in range(n) if in_degree[i] == 0]
+        placed = 0
+
+        while level:
+            levels.append([jobs[i] for i in level])
+            placed += len(level)
+
+            next_level: list[int] = []
+            for i in level:
+                for j in dependents[i]:
+                    in_degree[j] -= 1
+                    if in_degree[j] == 0:
+                        next_level.append(j)
+            level = next_level
+
+        if placed != n:
             raise ValueError("Circular dependency detected in pipeline")
 
-        return result
+        self._level_cache = levels
+        return levels
 
     def wait(self, poll_interval: float = 5.0) -> dict[str, JobResult]:
         """Wait for all submitted jobs to complete.
@@ -203,6 +356,36 @@ class Pipeline:
             RuntimeError: If no jobs have been submitted.
             RuntimeError: If some jobs were never submitted (partial failure).
         """
+        submitted = self._submitted_results()
+
+        for result in submitted.values():
+            result.wait(poll_interval=poll_interval)
+
+        return submitted
+
+    async def wait_async(self, poll_interval: float = 5.0) -> dict[str, JobResult]:
+        """Wait for all submitted jobs to complete, polling them concurrently.
+
+        Each job is polled in a worker thread so the event loop stays free
+        and every job's completion is seen within one poll interval.
+
+        Returns:
+            Dict mapping job names to results
+
+        Raises:
+            RuntimeError: If no jobs have been submitted.
+            RuntimeError: If some jobs were never submitted (partial failure).
+        """
+        submitted = self._submitted_results()
+
+        await asyncio.gather(
+            *(asyncio.to_thread(r.wait, poll_interval=poll_interval) for r in submitted.values())
+        )
+
+        return submitted
+
+    def _submitted_results(self) -> dict[str, JobResult]:
+        """Return results for all jobs, raising if any job was never submitted."""
         submitted = {pj.name: pj.result for pj in self.jobs if pj.result is not None}
 
         if not submitted:
@@ -215,10 +398,6 @@ class Pipeline:
                 "Call submit() again to retry."
             )
 
-        for pjob in self.jobs:
-            if pjob.result:
-                pjob.result.wait(poll_interval=poll_interval)
-
         return submitted
 
     def get_job(self, name: str) -> PipelineJob | None:
@@ -1,51 +1,36 @@
 # ruff: noqa: E501
 """Pytest configuration and fixtures."""
 
-import os
-import tempfile
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+import subprocess
+from types import SimpleNamespace
 
 import pytest
 
 import hpc_runner.core.config as _config_mod
 
+_SAMPLE_CONFIG_TOML = """
+[defaults]
+cpu = 2
+mem = "8G"
+time = "2:00:00"
 
-@pytest.fixture(autouse=True)
-def _isolate_config_cache():
-    """Clear the global config cache before and after every test.
-
-    Prevents any test from polluting others via the cached HPCConfig.
-    """
-    _config_mod._cached_config = None
-    yield
-    _config_mod._cached_config = None
+[schedulers.sge]
+parallel_environment = "mpi"
+memory_resource = "h_vmem"
 
+[tools.python]
+cpu = 4
+modules = ["python/3.11"]
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+[types.gpu]
+queue = "gpu"
+resources = [{name = "gpu", value = 1}]
+"""
 
+# Canned SGE command output served by mock_sge_commands
+_QSUB_OUTPUT = 'Your job 12345 ("test_job") has been submitted\n'
 
-@pytest.fixture
-def mock_sge_commands():
-    """Mock SGE commands (qsub, qstat, etc.)."""
-    with patch("subprocess.run") as mock_run:
-
-        def side_effect(cmd, *args, **kwargs):
-            result = MagicMock()
-            result.returncode = 0
-            result.stdout = ""
-            result.stderr = ""
-
-            if cmd[0] == "qsub":
-                result.stdout = 'Your job 12345 ("test_job") has been submitted\n'
-            elif cmd[0] == "qstat":
-                if "-xml" in cmd:
-                    # XML output for list_active_jobs
-                    result.stdout = """<?xml version='1.0'?>
+_QSTAT_XML_OUTPUT = """<?xml version='1.0'?>
 <job_info>
   <queue_info>
     <job_list state="running">
@@ -79,17 +64,13 @@ def mock_sge_commands():
   </job_info>
 </job_info>
 """
-                elif "-j" in cmd:
-                    result.stdout = "job_number: 12345\n"
-                else:
-                    result.stdout = """job-ID  prior   name       user         state submit/start at     queue                          slots ja-task-ID
+
+_QSTAT_PLAIN_OUTPUT = """job-ID  prior   name       user         state submit/start at     queue                          slots ja-task-ID
 -----------------------------------------------------------------------------------------------------------------
 12345   0.55500 test_job   user         r     01/01/2024 10:00:00 all.q@node1                    1
 """
-            elif cmd[0] == "qdel":
-                result.stdout = "user has deleted job 12345\n"
-            elif cmd[0] == "qacct":
-                result.stdout = """==============================================================
+
+_QACCT_OUTPUT = """==============================================================
 qname        all.q
 hostname     node1
 owner        user
@@ -98,52 +79,109 @@ jobnumber    12345
 exit_status  0
 """
 
-            return result
 
-        mock_run.side_effect = side_effect
-        yield mock_run
+def _completed(stdout: str = "") -> SimpleNamespace:
+    """Stand-in for a successful subprocess.CompletedProcess."""
+    return SimpleNamespace(returncode=0, stdout=stdout, stderr="")
+
+
+# One shared result per command; the fixture only picks a key per call.
+_SGE_RESULTS = {
+    "qsub": _completed(_QSUB_OUTPUT),
+    "qstat_xml": _completed(_QSTAT_XML_OUTPUT),
+    "qstat_j": _completed("job_number: 12345\n"),
+    "qstat": _completed(_QSTAT_PLAIN_OUTPUT),
+    "qdel": _completed("user has deleted job 12345\n"),
+    "qacct": _completed(_QACCT_OUTPUT),
+}
+_SGE_DEFAULT_RESULT = _completed()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow",
+        action="store_true",
+        default=False,
+        help="Run tests marked slow (real local-scheduler subprocesses)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test: pass --runslow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(autouse=True)
+def _isolate_config_cache():
+    """Clear the global config cache before and after every test.
+
+    Prevents any test from polluting others via the cached HPCConfig.
+    Resetting only drops a reference: the TOML is parsed lazily, and only
+    by tests that call get_config(), which rely on fresh discovery from
+    their own working directory and config files.
+    """
+    _config_mod._cached_config = None
+    yield
+    _config_mod._cached_config = None
 
 
 @pytest.fixture
-def sample_config(temp_dir):
-    """Create a sample configuration file."""
-    config_content = """
-[defaults]
-cpu = 2
-mem = "8G"
-time = "2:00:00"
+def temp_dir(tmp_path):
+    """Create a temporary directory for tests.
 
-[schedulers.sge]
-parallel_environment = "mpi"
-memory_resource = "h_vmem"
+    Alias for pytest's tmp_path, which is cleaned up lazily across runs
+    rather than with an rmtree at the end of every test.
+    """
+    return tmp_path
 
-[tools.python]
-cpu = 4
-modules = ["python/3.11"]
 
-[types.gpu]
-queue = "gpu"
-resources = [{name = "gpu", value = 1}]
-"""
-    config_file = temp_dir / "hpc-runner.toml"
-    config_file.write_text(config_content)
+@pytest.fixture
+def mock_sge_commands(monkeypatch):
+    """Mock SGE commands (qsub, qstat, etc.).
+
+    Returns:
+        List of the commands passed to subprocess.run, in call order.
+    """
+    calls: list[list[str]] = []
+
+    def fake_run(cmd, *args, **kwargs):
+        calls.append(cmd)
+        key = cmd[0]
+        if key == "qstat":
+            if "-xml" in cmd:
+                key = "qstat_xml"
+            elif "-j" in cmd:
+                key = "qstat_j"
+        return _SGE_RESULTS.get(key, _SGE_DEFAULT_RESULT)
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    return calls
+
+
+@pytest.fixture(scope="session")
+def _sample_config_path(tmp_path_factory):
+    """Write the sample configuration file once per session."""
+    config_file = tmp_path_factory.mktemp("config") / "hpc-runner.toml"
+    config_file.write_text(_SAMPLE_CONFIG_TOML)
     return config_file
 
 
 @pytest.fixture
-def clean_env():
-    """Clean environment variables that might affect tests."""
-    env_vars = ["HPC_SCHEDULER", "SGE_ROOT", "PBS_CONF_FILE"]
-    old_values = {var: os.environ.get(var) for var in env_vars}
+def sample_config(_sample_config_path):
+    """Path to a sample configuration file.
 
-    for var in env_vars:
-        if var in os.environ:
-            del os.environ[var]
+    The file is shared across the session; tests that need to modify it
+    should copy it into their own temporary directory first.
+    """
+    return _sample_config_path
 
-    yield
 
-    for var, value in old_values.items():
-        if value is not None:
-            os.environ[var] = value
-        elif var in os.environ:
-            del os.environ[var]
+@pytest.fixture
+def clean_env(monkeypatch):
+    """Clean environment variables that might affect tests."""
+    for var in ("HPC_SCHEDULER", "SGE_ROOT", "PBS_CONF_FILE"):
+        monkeypatch.delenv(var, raising=False)
@@ -0,0 +1,16 @@
+"""Fixtures shared by the CLI tests."""
+
+import pytest
+
+
+@pytest.fixture(scope="package", autouse=True)
+def _fixed_terminal_width():
+    """Render rich-click help at a fixed width for the whole package.
+
+    rich-click builds a console per render and sizes it from COLUMNS, so
+    pinning it skips terminal size detection and keeps help wrapping
+    independent of the terminal the tests are launched from.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("COLUMNS", "120")
+        yield
@@ -1,7 +1,9 @@
 """Tests for CLI status command."""
 
+import json
+from dataclasses import replace
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 from click.testing import CliRunner
@@ -10,31 +12,39 @@ from hpc_runner.cli.main import cli
 from hpc_runner.core.job_info import JobInfo
 from hpc_runner.core.result import JobStatus
 
+# Canonical jobs; tests hand the CLI a dataclasses.replace() copy with overrides
+_ACTIVE_JOB = JobInfo(job_id="100", name="my_sim", user="alice", status=JobStatus.RUNNING)
+_COMPLETED_JOB = JobInfo(
+    job_id="200", name="done_sim", user="alice", status=JobStatus.COMPLETED, exit_code=0
+)
+_SINGLE_JOB = JobInfo(job_id="300", name="my_job", user="alice", status=JobStatus.RUNNING)
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def runner():
     return CliRunner(env={"COLUMNS": "200"})
 
 
-@pytest.fixture
-def mock_scheduler():
-    """Return a mock scheduler with sensible defaults."""
+@pytest.fixture(scope="class")
+def _shared_scheduler():
+    """One MagicMock per test class; mock_scheduler resets it for each test."""
     sched = MagicMock()
     sched.name = "sge"
+    return sched
+
+
+@pytest.fixture
+def mock_scheduler(_shared_scheduler, monkeypatch):
+    """Return a mock scheduler with sensible defaults, installed as get_scheduler()."""
+    sched = _shared_scheduler
+    sched.reset_mock(return_value=True, side_effect=True)
     sched.has_accounting.return_value = True
     sched.list_active_jobs.return_value = []
     sched.list_completed_jobs.return_value = []
+    monkeypatch.setattr("hpc_runner.schedulers.get_scheduler", lambda *a, **k: sched)
     return sched
 
 
-def _patch_scheduler(mock_sched):
-    """Context manager that patches get_scheduler to return *mock_sched*."""
-    return patch(
-        "hpc_runner.schedulers.get_scheduler",
-        return_value=mock_sched,
-    )
-
-
 # ------------------------------------------------------------------ #
 # Help
 # ------------------------------------------------------------------ #
@@ -58,15 +68,13 @@ class TestStatusHelp:
 
 class TestStatusValidation:
     def test_history_with_job_id_errors(self, runner, mock_scheduler):
-        with _patch_scheduler(mock_scheduler):
-            result = runner.invoke(cli, ["status", "--history", "12345"])
+        result = runner.invoke(cli, ["status", "--history", "12345"])
         assert result.exit_code != 0
         assert "Cannot combine" in result.output
 
     def test_since_implies_history(self, runner, mock_scheduler):
         """--since without --history should implicitly enable history mode."""
-        with _patch_scheduler(mock_scheduler):
-            result = runner.invoke(cli, ["status", "--since", "30m"])
+        result = runner.invoke(cli, ["status", "--since", "30m"])
         assert result.exit_code == 0
         mock_scheduler.list_completed_jobs.assert_called_once()
 
@@ -79,24 +87,15 @@ class TestStatusValidation:
 class TestActiveJobs:
     def test_no_active_jobs(self, runner, mock_scheduler):
         mock_scheduler.list_active_jobs.return_value = []
-        with _patch_scheduler(mock_scheduler):
-            result = runner.invoke(cli, ["status"])
+        result = runner.invoke(cli, ["status"])
         assert result.exit_code == 0
         assert "No active jobs" in result.output
 
     def test_active_jobs_table(self, runner, mock_scheduler):
         mock_scheduler.list_active_jobs.return_value = [
-            JobInfo(
-                job_id="100",
-                name="my_sim",
-                user="alice",
-                status=JobStatus.RUNNING,
-                queue="batch.q",
-                submit_time=datetime(2026, 2, 23, 10, 0, 0),
-            ),
+            replace(_ACTIVE_JOB, queue="batch.q", submit_time=datetime(2026, 2, 23, 10, 0, 0)),
         ]
-        with _patch_scheduler(mock_scheduler):
-            result = runner.invoke(cli, ["status"])
+        result = runner.invoke(cli, ["status"])
         assert result.exit_code == 0
         assert "100" in result.output
         assert "my_sim" in result.output
@@ -105,44 +104,32 @@ class TestActiveJobs:
     def test_active_jobs_shows_all_columns(self, runner, mock_scheduler):
         """Default output includes queue, node, cpu, runtime columns."""
         mock_scheduler.list_active_jobs.return_value = [
-            JobInfo(
-                job_id="100",
-                name="my_sim",
-                user="alice",
-                status=JobStatus.RUNNING,
+            replace(
+                _ACTIVE_JOB,
                 queue="batch.q",
                 node="node1",
                 cpu=4,
                 runtime=timedelta(minutes=10),
             ),
         ]
-        with _patch_scheduler(mock_scheduler):
-            result = runner.invoke(cli, ["status"])
+        result = runner.invoke(cli, ["status"])
         assert result.exit_code == 0
         assert "batch.q" in result.output
         assert "node1" in result.output
 
     def test_active_jobs_all_users(self, runner, mock_scheduler):
         mock_scheduler.list_active_jobs.return_value = []
-        with _patch_scheduler(mock_scheduler):
-            result = runner.invoke(cli, ["status", "--all"])
+        result = runner.invoke(cli, ["status", "--all"])
         assert result.exit_code == 0
         mock_scheduler.list_active_jobs.assert_called_once_with(user=None)
 
     def test_active_jobs_json(self, runner, mock_scheduler):
-        mock_scheduler.list_active_jobs.return_value = [
-            JobInfo(
-                job_id="100",
-                name="my_sim",
-                user="alice",
-                status=JobStatus.RUNNING,
-            ),
-        ]
-        with _patch_scheduler(mock_scheduler):
-            result = runner.invoke(cli, ["status", "--json"])
+        mock_scheduler.list_active_jobs.return_value = [replace(_ACTIVE_JOB)]
+        result = runner.invoke(cli, ["status", "--json"])
         assert result.exit_code == 0
-        assert '"job_id"' in result.output
-        assert '"100"' in result.output
+        data = json.loads(result.output)
+        assert [job["job_id"] for job in data] == ["100"]
+        assert data[0]["status"] == "RUNNING"
 
 
 # ------------------------------------------------------------------ #
@@ -153,24 +140,15 @@ class TestActiveJobs:
 class TestHistory:
     def test_no_completed_jobs(self, runner, mock_scheduler):
         mock_scheduler.list_completed_jobs.return_value = []
-        with _patch_scheduler(mock_scheduler):
-            result = runner.invoke(cli, ["status", "--history"])
+        result = runner.invoke(cli, ["status", "--history"])
         assert result.exit_code == 0
         assert "No completed jobs" in result.output
 
     def test_completed_jobs_table(self, runner, mock_scheduler):
         mock_scheduler.list_completed_jobs.return_value = [
-            JobInfo(
-                job_id="200",
-                name="done_sim",
-                user="alice",
-                status=JobStatus.COMPLETED,
-                exit_code=0,
-                end_time=datetime(2026, 2, 23, 12, 0, 0),
-            ),
+            replace(_COMPLETED_JOB, end_time=datetime(2026, 2, 23, 12, 0, 0)),
         ]
-        with _patch_scheduler(mock_scheduler):
-            result = runner.invoke(cli, ["status", "--history"])
+        result = runner.invoke(cli, ["status", "--history"])
         assert result.exit_code == 0
         assert "200" in result.output
         assert "done_sim" in result.output
@@ -178,29 +156,23 @@ class TestHistory:
 
     def test_history_with_since(self, runner, mock_scheduler):
         mock_scheduler.list_completed_jobs.return_value = []
-        with _patch_scheduler(mock_scheduler):
-            result = runner.invoke(cli, ["status", "--history", "--since", "2h"])
+        result = runner.invoke(cli, ["status", "--history", "--since", "2h"])
         assert result.exit_code == 0
 
     def test_history_json(self, runner, mock_scheduler):
         mock_scheduler.list_completed_jobs.return_value = [
-            JobInfo(
-                job_id="200",
-                name="done_sim",
-                user="alice",
-                status=JobStatus.FAILED,
-                exit_code=1,
-            ),
+            replace(_COMPLETED_JOB, status=JobStatus.FAILED, exit_code=1),
         ]
-        with _patch_scheduler(mock_scheduler):
-            result = runner.invoke(cli, ["status", "--history", "--json"])
+        result = runner.invoke(cli, ["status", "--history", "--json"])
         assert result.exit_code == 0
-        assert '"exit_code"' in result.output
+        data = json.loads(result.output)
+        assert data[0]["job_id"] == "200"
+        assert data[0]["status"] == "FAILED"
+        assert data[0]["exit_code"] == 1
 
     def test_history_accounting_not_available(self, runner, mock_scheduler):
         mock_scheduler.has_accounting.return_value = False
-        with _patch_scheduler(mock_scheduler):
-            result = runner.invoke(cli, ["status", "--history"])
+        result = runner.invoke(cli, ["status", "--history"])
         assert result.exit_code != 0
 
 
@@ -212,18 +184,10 @@ class TestHistory:
 class TestSingleJob:
     def test_single_job_detail(self, runner, mock_scheduler):
         mock_scheduler.get_job_details.return_value = (
-            JobInfo(
-                job_id="300",
-                name="my_job",
-                user="alice",
-                status=JobStatus.RUNNING,
-                queue="batch.q",
-                cpu=8,
-            ),
+            replace(_SINGLE_JOB, queue="batch.q", cpu=8),
             {},
         )
-        with _patch_scheduler(mock_scheduler):
-            result = runner.invoke(cli, ["status", "300"])
+        result = runner.invoke(cli, ["status", "300"])
         assert result.exit_code == 0
         assert "300" in result.output
         assert "my_job" in result.output
@@ -234,41 +198,29 @@ class TestSingleJob:
         mock_scheduler.get_job_details.side_effect = NotImplementedError
         mock_scheduler.get_status.return_value = JobStatus.COMPLETED
         mock_scheduler.get_exit_code.return_value = 0
-        with _patch_scheduler(mock_scheduler):
-            result = runner.invoke(cli, ["status", "300"])
+        result = runner.invoke(cli, ["status", "300"])
         assert result.exit_code == 0
         assert "COMPLETED" in result.output
 
     def test_single_job_json(self, runner, mock_scheduler):
         mock_scheduler.get_job_details.return_value = (
-            JobInfo(
-                job_id="300",
-                name="my_job",
-                user="alice",
-                status=JobStatus.FAILED,
-                exit_code=42,
-            ),
+            replace(_SINGLE_JOB, status=JobStatus.FAILED, exit_code=42),
             {"cwd": "/home/alice/work"},
         )
-        with _patch_scheduler(mock_scheduler):
-            result = runner.invoke(cli, ["status", "300", "--json"])
+        result = runner.invoke(cli, ["status", "300", "--json"])
         assert result.exit_code == 0
-        assert '"300"' in result.output
-        assert '"cwd"' in result.output
+        data = json.loads(result.output)
+        assert data["job_id"] == "300"
+        assert data["exit_code"] == 42
+        assert data["details"] == {"cwd": "/home/alice/work"}
 
     def test_single_job_verbose_with_extra(self, runner, mock_scheduler):
         """--verbose on single job shows extra scheduler details."""
         mock_scheduler.get_job_details.return_value = (
-            JobInfo(
-                job_id="300",
-                name="my_job",
-                user="alice",
-                status=JobStatus.RUNNING,
-            ),
+            replace(_SINGLE_JOB),
             {"pe_name": "smp", "pe_range": "4"},
         )
-        with _patch_scheduler(mock_scheduler):
-            result = runner.invoke(cli, ["status", "300", "--verbose"])
+        result = runner.invoke(cli, ["status", "300", "--verbose"])
         assert result.exit_code == 0
         assert "smp" in result.output
 
@@ -280,7 +232,6 @@ class TestSingleJob:
 
 class TestWatch:
     def test_watch_not_yet_implemented(self, runner, mock_scheduler):
-        with _patch_scheduler(mock_scheduler):
-            result = runner.invoke(cli, ["status", "--watch"])
+        result = runner.invoke(cli, ["status", "--watch"])
         assert result.exit_code == 0
         assert "not yet implemented" in result.output
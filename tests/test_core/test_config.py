@@ -1,13 +1,12 @@
 """Tests for configuration system."""
 
-import os
-
 import pytest
 
 from hpc_runner.core.config import (
     HPC_CONFIG_ENV_VAR,
     HPCConfig,
     _expand_env_vars,
+    _find_git_root,
     _match_contiguous,
     _merge,
     _normalise_tokens,
@@ -48,6 +47,19 @@ class TestHPCConfig:
         assert job_config["mem"] == "4G"  # From defaults
         assert job_config["modules"] == ["python/3.11"]
 
+    def test_job_config_lists_not_shared_between_jobs(self, monkeypatch):
+        """Mutating one Job's config-derived list does not leak into the next."""
+        from hpc_runner.core.job import Job
+
+        config = HPCConfig(defaults={"modules": ["base"]}, tools={"python": {"modules": ["py"]}})
+        monkeypatch.setattr("hpc_runner.core.config.get_config", lambda: config)
+
+        Job("python a.py").modules.append("extra")
+
+        assert Job("python b.py").modules == ["base", "py"]
+        assert config.defaults == {"modules": ["base"]}
+        assert config.tools == {"python": {"modules": ["py"]}}
+
     def test_get_type_config(self):
         """Test getting type config for a type."""
         config = HPCConfig(
@@ -143,6 +155,15 @@ class TestMerge:
         assert result["args"].count("-v") == 1
         assert "-x" in result["args"]
 
+    def test_list_merge_unhashable_items(self):
+        """Lists of tables (e.g. resources) dedupe without raising."""
+        gpu = {"name": "gpu", "value": 1}
+        base = {"resources": [gpu]}
+        override = {"resources": [dict(gpu), {"name": "license", "value": 2}]}
+        result = _merge(base, override)
+
+        assert result["resources"] == [gpu, {"name": "license", "value": 2}]
+
     def test_dict_merge_deep(self):
         """Nested dicts should merge recursively."""
         base = {"schedulers": {"sge": {"pe": "smp", "mem": "mem_free"}}}
@@ -182,88 +203,95 @@ class TestLoadConfig:
         assert config.defaults["mem"] == "8G"
         assert config.schedulers["sge"]["parallel_environment"] == "mpi"
 
-    def test_load_config_returns_empty_when_no_config(self, temp_dir):
+    def test_load_config_sees_file_changes(self, temp_dir):
+        """Rewriting a config file invalidates its cached parse."""
+        config_file = temp_dir / "hpc-runner.toml"
+        config_file.write_text("[defaults]\ncpu = 2\n")
+        assert load_config(config_file).defaults["cpu"] == 2
+
+        config_file.write_text("[defaults]\ncpu = 16\n")
+        assert load_config(config_file).defaults["cpu"] == 16
+
+    def test_load_config_results_are_independent(self, sample_config):
+        """Mutating one loaded config does not leak into the next load."""
+        first = load_config(sample_config)
+        first.tools["python"]["modules"].append("extra/1.0")
+
+        second = load_config(sample_config)
+        assert second.tools["python"]["modules"] == ["python/3.11"]
+
+    def test_load_config_returns_empty_when_no_config(self, temp_dir, monkeypatch):
         """Test that loading returns empty config when no config files found."""
         # Change to temp dir where there's no user config
-        old_cwd = os.getcwd()
-        os.chdir(temp_dir)
-        try:
-            config = load_config()
-            # No package defaults - should return empty config
-            assert config.defaults == {}
-            assert config.tools == {}
-            assert config.types == {}
-            assert config.schedulers == {}
-        finally:
-            os.chdir(old_cwd)
+        monkeypatch.chdir(temp_dir)
+        config = load_config()
+        # No package defaults - should return empty config
+        assert config.defaults == {}
+        assert config.tools == {}
+        assert config.types == {}
+        assert config.schedulers == {}
 
 
 class TestFindConfigFile:
     """Tests for config file discovery."""
 
-    def test_find_config_in_current_dir(self, temp_dir):
+    def test_find_config_in_current_dir(self, temp_dir, monkeypatch):
         """Test finding config in current directory."""
         config_file = temp_dir / "hpc-runner.toml"
         config_file.write_text("[defaults]\ncpu = 1\n")
 
-        old_cwd = os.getcwd()
-        os.chdir(temp_dir)
-        try:
-            found = find_config_file()
-            assert found == config_file
-        finally:
-            os.chdir(old_cwd)
+        monkeypatch.chdir(temp_dir)
+        found = find_config_file()
+        assert found == config_file
 
-    def test_pyproject_toml_is_ignored(self, temp_dir):
+    def test_pyproject_toml_is_ignored(self, temp_dir, monkeypatch):
         """Test that pyproject.toml is ignored even with [tool.hpc-runner]."""
         pyproject = temp_dir / "pyproject.toml"
         pyproject.write_text("[tool.hpc-runner]\n[tool.hpc-runner.defaults]\ncpu = 1\n")
 
-        old_cwd = os.getcwd()
-        os.chdir(temp_dir)
-        try:
-            found = find_config_file()
-            assert found is None
-        finally:
-            os.chdir(old_cwd)
+        monkeypatch.chdir(temp_dir)
+        found = find_config_file()
+        assert found is None
+
+    def test_git_root_config_found_from_subdirectory(self, temp_dir, monkeypatch):
+        """The git-root config is discovered from a nested working directory."""
+        (temp_dir / ".git").mkdir()
+        git_config = temp_dir / "hpc-runner.toml"
+        git_config.write_text("[defaults]\ncpu = 1\n")
+        nested = temp_dir / "a" / "b"
+        nested.mkdir(parents=True)
+
+        assert _find_git_root(nested) == temp_dir.resolve()
+        monkeypatch.chdir(nested)
+        assert find_config_file() == git_config.resolve()
 
 
 class TestEnvVarExpansion:
     """Tests for environment variable expansion in paths."""
 
-    def test_expand_braced_env_var(self):
+    def test_expand_braced_env_var(self, monkeypatch):
         """Test ${VAR} syntax expansion."""
-        os.environ["TEST_HPC_PATH"] = "/test/path"
-        try:
-            result = _expand_env_vars("${TEST_HPC_PATH}/config.toml")
-            assert result == "/test/path/config.toml"
-        finally:
-            del os.environ["TEST_HPC_PATH"]
-
-    def test_expand_simple_env_var(self):
+        monkeypatch.setenv("TEST_HPC_PATH", "/test/path")
+        result = _expand_env_vars("${TEST_HPC_PATH}/config.toml")
+        assert result == "/test/path/config.toml"
+
+    def test_expand_simple_env_var(self, monkeypatch):
         """Test $VAR syntax expansion."""
-        os.environ["TEST_HPC_PATH"] = "/test/path"
-        try:
-            result = _expand_env_vars("$TEST_HPC_PATH/config.toml")
-            assert result == "/test/path/config.toml"
-        finally:
-            del os.environ["TEST_HPC_PATH"]
+        monkeypatch.setenv("TEST_HPC_PATH", "/test/path")
+        result = _expand_env_vars("$TEST_HPC_PATH/config.toml")
+        assert result == "/test/path/config.toml"
 
     def test_undefined_env_var_unchanged(self):
         """Test that undefined env vars are left unchanged."""
         result = _expand_env_vars("${UNDEFINED_VAR}/config.toml")
         assert result == "${UNDEFINED_VAR}/config.toml"
 
-    def test_multiple_env_vars(self):
+    def test_multiple_env_vars(self, monkeypatch):
         """Test multiple env vars in one path."""
-        os.environ["TEST_BASE"] = "/base"
-        os.environ["TEST_SUB"] = "subdir"
-        try:
-            result = _expand_env_vars("${TEST_BASE}/${TEST_SUB}/config.toml")
-            assert result == "/base/subdir/config.toml"
-        finally:
-            del os.environ["TEST_BASE"]
-            del os.environ["TEST_SUB"]
+        monkeypatch.setenv("TEST_BASE", "/base")
+        monkeypatch.setenv("TEST_SUB", "subdir")
+        result = _expand_env_vars("${TEST_BASE}/${TEST_SUB}/config.toml")
+        assert result == "/base/subdir/config.toml"
 
 
 class TestExtendsResolution:
@@ -325,24 +353,21 @@ class TestExtendsResolution:
         with pytest.raises(ValueError, match="Circular extends"):
             _resolve_extends(config_a)
 
-    def test_resolve_extends_with_env_var(self, temp_dir):
+    def test_resolve_extends_with_env_var(self, temp_dir, monkeypatch):
         """Test resolving extends with env var in path."""
         base_config = temp_dir / "base.toml"
         base_config.write_text("[defaults]\ncpu = 1\n")
 
-        os.environ["TEST_CONFIG_DIR"] = str(temp_dir)
-        try:
-            child_config = temp_dir / "child.toml"
-            child_config.write_text(
-                'extends = "${TEST_CONFIG_DIR}/base.toml"\n[defaults]\nmem = "8G"\n'
-            )
+        monkeypatch.setenv("TEST_CONFIG_DIR", str(temp_dir))
+        child_config = temp_dir / "child.toml"
+        child_config.write_text(
+            'extends = "${TEST_CONFIG_DIR}/base.toml"\n[defaults]\nmem = "8G"\n'
+        )
 
-            chain = _resolve_extends(child_config)
+        chain = _resolve_extends(child_config)
 
-            assert len(chain) == 2
-            assert chain[0] == base_config.resolve()
-        finally:
-            del os.environ["TEST_CONFIG_DIR"]
+        assert len(chain) == 2
+        assert chain[0] == base_config.resolve()
 
 
 class TestConfigMerging:
@@ -371,7 +396,7 @@ class TestConfigMerging:
         # tools from child
         assert config.tools["python"]["modules"] == ["python/3.11"]
 
-    def test_find_config_files_from_env_var(self, temp_dir):
+    def test_find_config_files_from_env_var(self, temp_dir, monkeypatch):
         """Test that HPC_RUNNER_CONFIG env var replaces git root (mutually exclusive)."""
         # Create a fake git root with its own config
         git_dir = temp_dir / ".git"
@@ -389,20 +414,15 @@ class TestConfigMerging:
         subdir = temp_dir / "subdir"
         subdir.mkdir()
 
-        os.environ[HPC_CONFIG_ENV_VAR] = str(env_config)
-        old_cwd = os.getcwd()
-        os.chdir(subdir)
-        try:
-            configs = find_config_files()
-            # env var config should be used
-            assert env_config.resolve() in configs
-            # git root config should NOT be included (env var replaces it)
-            assert git_config.resolve() not in configs
-        finally:
-            del os.environ[HPC_CONFIG_ENV_VAR]
-            os.chdir(old_cwd)
-
-    def test_env_var_with_cwd_override(self, temp_dir):
+        monkeypatch.setenv(HPC_CONFIG_ENV_VAR, str(env_config))
+        monkeypatch.chdir(subdir)
+        configs = find_config_files()
+        # env var config should be used
+        assert env_config.resolve() in configs
+        # git root config should NOT be included (env var replaces it)
+        assert git_config.resolve() not in configs
+
+    def test_env_var_with_cwd_override(self, temp_dir, monkeypatch):
         """Test two-level model: env var config + cwd local override."""
         # Create env var config
         env_config = temp_dir / "site" / "site.toml"
@@ -415,19 +435,14 @@ class TestConfigMerging:
         local_config = subdir / "hpc-runner.toml"
         local_config.write_text('[defaults]\nmem = "16G"\n')
 
-        os.environ[HPC_CONFIG_ENV_VAR] = str(env_config)
-        old_cwd = os.getcwd()
-        os.chdir(subdir)
-        try:
-            configs = find_config_files()
-            # Both configs should be present
-            assert env_config.resolve() in configs
-            assert local_config.resolve() in configs
-            # env var config should come first (lower priority)
-            assert configs.index(env_config.resolve()) < configs.index(local_config.resolve())
-        finally:
-            del os.environ[HPC_CONFIG_ENV_VAR]
-            os.chdir(old_cwd)
+        monkeypatch.setenv(HPC_CONFIG_ENV_VAR, str(env_config))
+        monkeypatch.chdir(subdir)
+        configs = find_config_files()
+        # Both configs should be present
+        assert env_config.resolve() in configs
+        assert local_config.resolve() in configs
+        # env var config should come first (lower priority)
+        assert configs.index(env_config.resolve()) < configs.index(local_config.resolve())
 
     def test_config_tracks_source_paths(self, temp_dir):
         """Test that loaded config tracks its source paths."""
@@ -1,12 +1,32 @@
 """Tests for Job model."""
 
 import os
+from types import SimpleNamespace
 from unittest.mock import patch
 
+import pytest
+
 from hpc_runner.core.config import HPCConfig
 from hpc_runner.core.job import Job
 from hpc_runner.core.resources import ResourceSet
 
+# Prefix Job uses for auto-generated names
+_USER = os.environ.get("USER", "user")
+
+# Shared by tests that need no config at all; it has no sections to mutate
+# and get_tool_config() hands out copies of its memoised lookups.
+_EMPTY_CFG = HPCConfig()
+
+
+@pytest.fixture
+def use_config(monkeypatch):
+    """Return a setter that makes get_config() return the given HPCConfig."""
+
+    def install(cfg: HPCConfig) -> None:
+        monkeypatch.setattr("hpc_runner.core.config.get_config", lambda: cfg)
+
+    return install
+
 
 class TestJob:
     """Tests for Job class."""
@@ -17,40 +37,68 @@ class TestJob:
         assert job.command == "echo hello"
         assert job.name is not None  # Auto-generated
 
-    def test_job_with_list_command(self):
-        """Test job with command as list."""
-        job = Job(command=["python", "script.py", "--arg", "value"])
-        assert job.command == "python script.py --arg value"
+    @pytest.mark.parametrize(
+        ("kwargs", "attr", "expected"),
+        [
+            pytest.param(
+                {"command": ["python", "script.py", "--arg", "value"]},
+                "command",
+                "python script.py --arg value",
+                id="list_command",
+            ),
+            pytest.param({"name": "my_job"}, "name", "my_job", id="explicit_name"),
+            pytest.param({"cpu": 4}, "cpu", 4, id="cpu"),
+            pytest.param({"mem": "16G"}, "mem", "16G", id="mem"),
+            pytest.param({"time": "2:00:00"}, "time", "2:00:00", id="time"),
+            pytest.param({"queue": "gpu"}, "queue", "gpu", id="queue"),
+            pytest.param(
+                {"modules": ["python/3.11", "cuda/12.0"]},
+                "modules",
+                ["python/3.11", "cuda/12.0"],
+                id="modules",
+            ),
+            pytest.param(
+                {"raw_args": ["-l", "scratch=10G"]},
+                "raw_args",
+                ["-l", "scratch=10G"],
+                id="raw_args",
+            ),
+            pytest.param(
+                {"sge_args": ["-l", "exclusive=true"]},
+                "sge_args",
+                ["-l", "exclusive=true"],
+                id="sge_args",
+            ),
+        ],
+    )
+    def test_job_attribute_from_kwarg(self, kwargs, attr, expected):
+        """Each constructor keyword lands on the matching attribute."""
+        job = Job(**{"command": "echo test", **kwargs})
+        assert getattr(job, attr) == expected
+
+    def test_job_argv_from_list_command(self):
+        """A list command keeps its original arguments, spaces included."""
+        job = Job(command=["bash", "-c", "echo hello"])
+        assert job.command == "bash -c echo hello"
+        assert job.argv == ["bash", "-c", "echo hello"]
+
+    def test_job_argv_from_string_command(self):
+        """A string command is split with shell quoting."""
+        job = Job(command="bash -c 'echo hello'")
+        assert job.argv == ["bash", "-c", "echo hello"]
+
+    def test_job_argv_follows_reassigned_command(self):
+        """Reassigning command discards the original argument list."""
+        job = Job(command=["echo", "a b"])
+        job.command = "echo c"
+        assert job.argv == ["echo", "c"]
 
     def test_job_name_generation(self):
         """Test automatic job name generation."""
         job = Job(command="python script.py")
-        user = os.environ.get("USER", "user")
-        assert job.name.startswith(f"{user}_")
+        assert job.name.startswith(f"{_USER}_")
         assert "python" in job.name
 
-    def test_job_with_explicit_name(self):
-        """Test job with explicit name."""
-        job = Job(command="echo test", name="my_job")
-        assert job.name == "my_job"
-
-    def test_job_with_resources(self):
-        """Test job with resources."""
-        job = Job(command="echo test", cpu=4, mem="16G", time="2:00:00")
-        assert job.cpu == 4
-        assert job.mem == "16G"
-        assert job.time == "2:00:00"
-
-    def test_job_with_queue(self):
-        """Test job with queue."""
-        job = Job(command="echo test", queue="gpu")
-        assert job.queue == "gpu"
-
-    def test_job_with_modules(self):
-        """Test job with modules."""
-        job = Job(command="python script.py", modules=["python/3.11", "cuda/12.0"])
-        assert job.modules == ["python/3.11", "cuda/12.0"]
-
     def test_job_merge_output_default(self):
         """Test that merge_output is True by default (stderr=None)."""
         job = Job(command="echo test")
@@ -72,15 +120,10 @@ class TestJob:
         job = Job(command="echo test", resources=resources)
         assert len(job.resources) == 2
 
-    def test_job_with_raw_args(self):
-        """Test job with raw scheduler arguments."""
-        job = Job(command="echo test", raw_args=["-l", "scratch=10G"])
-        assert job.raw_args == ["-l", "scratch=10G"]
 
-    def test_job_with_sge_args(self):
-        """Test job with SGE-specific arguments."""
-        job = Job(command="echo test", sge_args=["-l", "exclusive=true"])
-        assert job.sge_args == ["-l", "exclusive=true"]
+# after() only stores the results, so a bare job_id holder stands in for JobResult
+_RESULT_123 = SimpleNamespace(job_id="123")
+_RESULT_456 = SimpleNamespace(job_id="456")
 
 
 class TestJobDependencies:
@@ -88,27 +131,16 @@ class TestJobDependencies:
 
     def test_after_method(self):
         """Test after() method for adding dependencies."""
-        from unittest.mock import MagicMock
-
-        # Create mock job results
-        result1 = MagicMock()
-        result1.job_id = "123"
-        result2 = MagicMock()
-        result2.job_id = "456"
-
         job = Job(command="echo test")
-        job.after(result1, result2, type="afterok")
+        job.after(_RESULT_123, _RESULT_456, type="afterok")
 
         assert len(job.dependencies) == 2
         assert job.dependency_type == "afterok"
 
     def test_after_returns_self(self):
         """Test that after() returns the job for chaining."""
-        from unittest.mock import MagicMock
-
-        result = MagicMock()
         job = Job(command="echo test")
-        returned = job.after(result)
+        returned = job.after(_RESULT_123)
 
         assert returned is job
 
@@ -128,110 +160,108 @@ class TestJobConfigAware:
             types=types or {},
         )
 
-    def test_defaults_applied(self):
+    def test_defaults_applied(self, use_config):
         """[defaults] are picked up by Job()."""
         cfg = self._make_config(defaults={"cpu": 2, "mem": "8G", "queue": "batch"})
-        with patch("hpc_runner.core.config.get_config", return_value=cfg):
-            job = Job(command="echo hello")
+        use_config(cfg)
+        job = Job(command="echo hello")
         assert job.cpu == 2
         assert job.mem == "8G"
         assert job.queue == "batch"
 
-    def test_tool_auto_detected(self):
+    def test_tool_auto_detected(self, use_config):
         """Tool extracted from command is matched to [tools.*]."""
         cfg = self._make_config(
             tools={"python": {"cpu": 4, "modules": ["python/3.11"]}},
         )
-        with patch("hpc_runner.core.config.get_config", return_value=cfg):
-            job = Job(command="python train.py")
+        use_config(cfg)
+        job = Job(command="python train.py")
         assert job.cpu == 4
         assert job.modules == ["python/3.11"]
 
-    def test_tool_with_path_stripped(self):
+    def test_tool_with_path_stripped(self, use_config):
         """/usr/bin/python → python for tool lookup."""
         cfg = self._make_config(
             tools={"python": {"cpu": 8}},
         )
-        with patch("hpc_runner.core.config.get_config", return_value=cfg):
-            job = Job(command="/usr/bin/python script.py")
+        use_config(cfg)
+        job = Job(command="/usr/bin/python script.py")
         assert job.cpu == 8
 
-    def test_job_type_config_applied(self):
+    def test_job_type_config_applied(self, use_config):
         """job_type= pulls [types.*] config."""
         cfg = self._make_config(
             types={"gpu": {"queue": "gpu.q", "resources": [{"name": "gpu", "value": 1}]}},
         )
-        with patch("hpc_runner.core.config.get_config", return_value=cfg):
-            job = Job(command="python train.py", job_type="gpu")
+        use_config(cfg)
+        job = Job(command="python train.py", job_type="gpu")
         assert job.queue == "gpu.q"
         assert len(job.resources) == 1
 
-    def test_job_type_skips_tool_matching(self):
+    def test_job_type_skips_tool_matching(self, use_config):
         """When job_type is given, tool auto-detect is skipped."""
         cfg = self._make_config(
             tools={"python": {"cpu": 99}},
             types={"sim": {"cpu": 2}},
         )
-        with patch("hpc_runner.core.config.get_config", return_value=cfg):
-            job = Job(command="python run.py", job_type="sim")
+        use_config(cfg)
+        job = Job(command="python run.py", job_type="sim")
         assert job.cpu == 2  # from types.sim, not tools.python
 
-    def test_kwargs_override_config(self):
+    def test_kwargs_override_config(self, use_config):
         """Explicit kwargs beat config values."""
         cfg = self._make_config(
             defaults={"cpu": 2, "mem": "4G"},
         )
-        with patch("hpc_runner.core.config.get_config", return_value=cfg):
-            job = Job(command="echo hello", cpu=16, mem="64G")
+        use_config(cfg)
+        job = Job(command="echo hello", cpu=16, mem="64G")
         assert job.cpu == 16
         assert job.mem == "64G"
 
-    def test_descriptor_defaults_survive(self):
+    def test_descriptor_defaults_survive(self, use_config):
         """No config + no kwargs → descriptor defaults."""
-        cfg = self._make_config()
-        with patch("hpc_runner.core.config.get_config", return_value=cfg):
-            job = Job(command="echo hello")
+        use_config(_EMPTY_CFG)
+        job = Job(command="echo hello")
         assert job.inherit_env is True
         assert job.shell == "/bin/bash"
         assert job.use_cwd is True
 
-    def test_config_overrides_descriptor_defaults(self):
+    def test_config_overrides_descriptor_defaults(self, use_config):
         """Config can override shell, inherit_env, use_cwd."""
         cfg = self._make_config(
             defaults={"shell": "/bin/zsh", "inherit_env": False, "use_cwd": False},
         )
-        with patch("hpc_runner.core.config.get_config", return_value=cfg):
-            job = Job(command="echo hello")
+        use_config(cfg)
+        job = Job(command="echo hello")
         assert job.shell == "/bin/zsh"
         assert job.inherit_env is False
         assert job.use_cwd is False
 
-    def test_no_config_files_is_fine(self):
+    def test_no_config_files_is_fine(self, use_config):
         """Works with completely empty config."""
-        cfg = self._make_config()
-        with patch("hpc_runner.core.config.get_config", return_value=cfg):
-            job = Job(command="echo hello")
+        use_config(_EMPTY_CFG)
+        job = Job(command="echo hello")
         assert job.command == "echo hello"
         assert job.name is not None
 
-    def test_config_command_key_ignored(self):
+    def test_config_command_key_ignored(self, use_config):
         """A 'command' key in config is stripped — command always comes from caller."""
         cfg = self._make_config(
             defaults={"command": "should be ignored", "cpu": 2},
         )
-        with patch("hpc_runner.core.config.get_config", return_value=cfg):
-            job = Job(command="echo real")
+        use_config(cfg)
+        job = Job(command="echo real")
         assert job.command == "echo real"
         assert job.cpu == 2
 
-    def test_unknown_tool_gets_defaults_only(self):
+    def test_unknown_tool_gets_defaults_only(self, use_config):
         """Unrecognised tool falls back to [defaults]."""
         cfg = self._make_config(
             defaults={"cpu": 1},
             tools={"python": {"cpu": 8}},
         )
-        with patch("hpc_runner.core.config.get_config", return_value=cfg):
-            job = Job(command="unknown_tool arg1")
+        use_config(cfg)
+        job = Job(command="unknown_tool arg1")
         assert job.cpu == 1
 
 
@@ -320,13 +350,13 @@ class TestJobEnvVarExpansion:
             job = Job(command="echo hello")
         assert job.env_append["PYTHONPATH"] == "/tools/lib"
 
-    def test_plain_values_unchanged(self):
+    def test_plain_values_unchanged(self, use_config):
         """Values without $VAR references are not modified."""
         cfg = self._make_config(
             defaults={"env_vars": {"FOO": "/a/plain/path", "BAR": "literal"}},
         )
-        with patch("hpc_runner.core.config.get_config", return_value=cfg):
-            job = Job(command="echo hello")
+        use_config(cfg)
+        job = Job(command="echo hello")
         assert job.env_vars["FOO"] == "/a/plain/path"
         assert job.env_vars["BAR"] == "literal"
 
@@ -366,76 +396,75 @@ class TestExtraModules:
             types=kwargs.get("types", {}),
         )
 
-    def test_extra_modules_appended_to_config(self):
+    def test_extra_modules_appended_to_config(self, use_config):
         """extra_modules appends to config-defined modules."""
         cfg = self._make_config(
             tools={"python": {"modules": ["python/3.11"]}},
         )
-        with patch("hpc_runner.core.config.get_config", return_value=cfg):
-            job = Job(command="python train.py", extra_modules=["cuda/12.0"])
+        use_config(cfg)
+        job = Job(command="python train.py", extra_modules=["cuda/12.0"])
         assert job.modules == ["python/3.11", "cuda/12.0"]
 
-    def test_extra_modules_deduplicates(self):
+    def test_extra_modules_deduplicates(self, use_config):
         """Duplicate modules are removed, preserving order."""
         cfg = self._make_config(
             tools={"python": {"modules": ["python/3.11", "numpy/1.25"]}},
         )
-        with patch("hpc_runner.core.config.get_config", return_value=cfg):
-            job = Job(command="python train.py", extra_modules=["python/3.11", "cuda/12.0"])
+        use_config(cfg)
+        job = Job(command="python train.py", extra_modules=["python/3.11", "cuda/12.0"])
         assert job.modules == ["python/3.11", "numpy/1.25", "cuda/12.0"]
 
-    def test_extra_modules_no_config_modules(self):
+    def test_extra_modules_no_config_modules(self, use_config):
         """extra_modules works when config defines no modules."""
-        cfg = self._make_config()
-        with patch("hpc_runner.core.config.get_config", return_value=cfg):
-            job = Job(command="echo hello", extra_modules=["gcc/13"])
+        use_config(_EMPTY_CFG)
+        job = Job(command="echo hello", extra_modules=["gcc/13"])
         assert job.modules == ["gcc/13"]
 
-    def test_modules_override_with_extra(self):
+    def test_modules_override_with_extra(self, use_config):
         """modules= overrides config; extra_modules appends to that override."""
         cfg = self._make_config(
             defaults={"modules": ["default/1.0"]},
         )
-        with patch("hpc_runner.core.config.get_config", return_value=cfg):
-            job = Job(
-                command="echo hello",
-                modules=["override/2.0"],
-                extra_modules=["extra/3.0"],
-            )
+        use_config(cfg)
+        job = Job(
+            command="echo hello",
+            modules=["override/2.0"],
+            extra_modules=["extra/3.0"],
+        )
         assert job.modules == ["override/2.0", "extra/3.0"]
 
-    def test_extra_modules_path_appended(self):
+    def test_extra_modules_path_appended(self, use_config):
         """extra_modules_path appends to config-defined modules_path."""
         cfg = self._make_config(
             defaults={"modules_path": ["/opt/modules"]},
         )
-        with patch("hpc_runner.core.config.get_config", return_value=cfg):
-            job = Job(command="echo hello", extra_modules_path=["/my/modules"])
+        use_config(cfg)
+        job = Job(command="echo hello", extra_modules_path=["/my/modules"])
         assert job.modules_path == ["/opt/modules", "/my/modules"]
 
-    def test_extra_modules_path_deduplicates(self):
+    def test_extra_modules_path_deduplicates(self, use_config):
         """Duplicate module paths are removed."""
         cfg = self._make_config(
             defaults={"modules_path": ["/opt/modules"]},
         )
-        with patch("hpc_runner.core.config.get_config", return_value=cfg):
-            job = Job(command="echo hello", extra_modules_path=["/opt/modules", "/my/modules"])
+        use_config(cfg)
+        job = Job(command="echo hello", extra_modules_path=["/opt/modules", "/my/modules"])
         assert job.modules_path == ["/opt/modules", "/my/modules"]
 
-    def test_no_extras_preserves_config(self):
+    def test_no_extras_preserves_config(self, use_config):
         """Without extra_modules, config modules are unchanged."""
         cfg = self._make_config(
             defaults={"modules": ["a", "b"]},
         )
-        with patch("hpc_runner.core.config.get_config", return_value=cfg):
-            job = Job(command="echo hello")
+        use_config(cfg)
+        job = Job(command="echo hello")
         assert job.modules == ["a", "b"]
 
-    def test_modules_override_without_extra(self):
+    def test_modules_override_without_extra(self, use_config):
         """modules= alone still fully overrides config."""
         cfg = self._make_config(
             defaults={"modules": ["default/1.0"]},
         )
-        with patch("hpc_runner.core.config.get_config", return_value=cfg):
-            job = Job(command="echo hello", modules=["override/2.0"])
+        use_config(cfg)
+        job = Job(command="echo hello", modules=["override/2.0"])
         assert job.modules == ["override/2.0"]
@@ -0,0 +1,37 @@
+"""Tests for JobArray."""
+
+import pytest
+
+from hpc_runner.core.job import Job
+from hpc_runner.core.job_array import JobArray
+
+
+class TestJobArrayFromSpec:
+    """Tests for parsing array range specifications."""
+
+    @pytest.mark.parametrize(
+        ("spec", "start", "end", "step", "max_concurrent", "count"),
+        [
+            ("1-10", 1, 10, 1, None, 10),
+            ("5", 5, 5, 1, None, 1),
+            ("1-100:10", 1, 100, 10, None, 10),
+            ("1-100%5", 1, 100, 1, 5, 100),
+            ("1-100:10%5", 1, 100, 10, 5, 10),
+        ],
+    )
+    def test_from_spec(self, spec, start, end, step, max_concurrent, count):
+        """Each spec form sets the matching fields."""
+        array = JobArray.from_spec(Job(command="echo task"), spec)
+        assert (array.start, array.end, array.step) == (start, end, step)
+        assert array.max_concurrent == max_concurrent
+        assert array.count == count
+
+    def test_range_str_round_trips(self):
+        """range_str renders the spec that was parsed."""
+        array = JobArray.from_spec(Job(command="echo task"), "1-100:10%5")
+        assert array.range_str == "1-100:10%5"
+
+    def test_invalid_spec(self):
+        """Non-integer parts raise ValueError."""
+        with pytest.raises(ValueError):
+            JobArray.from_spec(Job(command="echo task"), "a-b")
@@ -69,3 +69,21 @@ class TestResourceSet:
         names = [r.name for r in rs]
         assert "gpu" in names
         assert "license" in names
+
+    def test_get_from_constructor_list(self):
+        """Resources passed to the constructor are found by get()."""
+        rs = ResourceSet([Resource("gpu", 2), Resource("mem", "8G")])
+
+        mem = rs.get("mem")
+        assert mem is not None
+        assert mem.value == "8G"
+
+    def test_get_returns_first_duplicate(self):
+        """get() returns the first resource added under a name."""
+        rs = ResourceSet()
+        rs.add("license", 1).add("license", 2)
+
+        lic = rs.get("license")
+        assert lic is not None
+        assert lic.value == 1
+        assert len(rs) == 2
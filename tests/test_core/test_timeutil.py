@@ -10,48 +10,21 @@ from hpc_runner.core.timeutil import parse_since
 class TestParseSince:
     """Tests for parse_since()."""
 
-    def test_relative_seconds(self):
+    @pytest.mark.parametrize(
+        ("spec", "delta"),
+        [
+            ("90s", timedelta(seconds=90)),
+            ("30m", timedelta(minutes=30)),
+            ("2h", timedelta(hours=2)),
+            ("1d", timedelta(days=1)),
+        ],
+    )
+    def test_relative(self, spec, delta):
         before = datetime.now()
-        result = parse_since("90s")
+        result = parse_since(spec)
         after = datetime.now()
 
-        assert before - timedelta(seconds=91) < result < after - timedelta(seconds=89)
-
-    def test_relative_minutes(self):
-        before = datetime.now()
-        result = parse_since("30m")
-        after = datetime.now()
-
-        expected = timedelta(minutes=30)
-        assert (
-            before - expected - timedelta(seconds=1)
-            < result
-            < after - expected + timedelta(seconds=1)
-        )
-
-    def test_relative_hours(self):
-        before = datetime.now()
-        result = parse_since("2h")
-        after = datetime.now()
-
-        expected = timedelta(hours=2)
-        assert (
-            before - expected - timedelta(seconds=1)
-            < result
-            < after - expected + timedelta(seconds=1)
-        )
-
-    def test_relative_days(self):
-        before = datetime.now()
-        result = parse_since("1d")
-        after = datetime.now()
-
-        expected = timedelta(days=1)
-        assert (
-            before - expected - timedelta(seconds=1)
-            < result
-            < after - expected + timedelta(seconds=1)
-        )
+        assert before - delta - timedelta(seconds=1) < result < after - delta + timedelta(seconds=1)
 
     def test_absolute_iso_datetime(self):
         result = parse_since("2026-02-23T18:00:00")
@@ -1,5 +1,6 @@
 """Tests for local scheduler."""
 
+import re
 import shutil
 from pathlib import Path
 
@@ -11,6 +12,9 @@ from hpc_runner.schedulers.local import LocalScheduler
 
 MODULEFILES_DIR = str(Path(__file__).parent.parent / "modulefiles")
 
+# Shebang first, then ``set -e``, then the command, in that order
+_SCRIPT_RE = re.compile(r"\A#!/bin/bash\n.*^set -e$.*^echo hello$", re.DOTALL | re.MULTILINE)
+
 has_modules = (
     shutil.which("modulecmd") is not None
     or Path("/usr/share/Modules/init/bash").exists()
@@ -19,17 +23,21 @@ has_modules = (
 requires_modules = pytest.mark.skipif(not has_modules, reason="Environment Modules not installed")
 
 
+@pytest.fixture(scope="module")
+def scheduler():
+    """One LocalScheduler for the module; every submission gets its own job ID."""
+    return LocalScheduler()
+
+
 class TestLocalScheduler:
     """Tests for LocalScheduler."""
 
-    def test_scheduler_name(self):
+    def test_scheduler_name(self, scheduler):
         """Test scheduler name."""
-        scheduler = LocalScheduler()
         assert scheduler.name == "local"
 
-    def test_submit_job(self, temp_dir):
+    def test_submit_job(self, scheduler, temp_dir):
         """Test submitting a job."""
-        scheduler = LocalScheduler()
         job = Job(command="echo hello", workdir=temp_dir)
 
         result = scheduler.submit(job)
@@ -38,28 +46,25 @@ class TestLocalScheduler:
         assert result.scheduler is scheduler
         assert result.job is job
 
-    def test_submit_interactive_job(self, temp_dir):
+    def test_submit_interactive_job(self, scheduler, temp_dir):
         """Test submitting an interactive (blocking) job."""
-        scheduler = LocalScheduler()
         job = Job(command="echo hello", workdir=temp_dir)
 
         result = scheduler.submit(job, interactive=True)
 
         assert result.returncode == 0
 
-    def test_submit_failing_job(self, temp_dir):
+    def test_submit_failing_job(self, scheduler, temp_dir):
         """Test submitting a failing job."""
-        scheduler = LocalScheduler()
-        job = Job(command="exit 1", workdir=temp_dir)
+        job = Job(command="false", workdir=temp_dir)
 
         result = scheduler.submit(job, interactive=True)
 
         assert result.returncode == 1
 
-    def test_job_status_running(self, temp_dir):
+    def test_job_status_running(self, scheduler, temp_dir):
         """Test getting status of running job."""
-        scheduler = LocalScheduler()
-        job = Job(command="sleep 10", workdir=temp_dir)
+        job = Job(command="sleep 2", workdir=temp_dir)
 
         result = scheduler.submit(job, interactive=False)
         status = scheduler.get_status(result.job_id)
@@ -69,9 +74,8 @@ class TestLocalScheduler:
         # Clean up
         scheduler.cancel(result.job_id)
 
-    def test_job_status_completed(self, temp_dir):
+    def test_job_status_completed(self, scheduler, temp_dir):
         """Test getting status of completed job."""
-        scheduler = LocalScheduler()
         job = Job(command="echo done", workdir=temp_dir)
 
         result = scheduler.submit(job, interactive=True)
@@ -79,19 +83,17 @@ class TestLocalScheduler:
 
         assert status == JobStatus.COMPLETED
 
-    def test_cancel_job(self, temp_dir):
+    def test_cancel_job(self, scheduler, temp_dir):
         """Test cancelling a job."""
-        scheduler = LocalScheduler()
-        job = Job(command="sleep 60", workdir=temp_dir)
+        job = Job(command="sleep 2", workdir=temp_dir)
 
         result = scheduler.submit(job, interactive=False)
         success = scheduler.cancel(result.job_id)
 
         assert success is True
 
-    def test_generate_script(self, temp_dir):
+    def test_generate_script(self, scheduler, temp_dir):
         """Test script generation."""
-        scheduler = LocalScheduler()
         job = Job(
             command="echo hello",
             modules=["python/3.11"],
@@ -100,13 +102,10 @@ class TestLocalScheduler:
 
         script = scheduler.generate_script(job)
 
-        assert "#!/bin/bash" in script
-        assert "echo hello" in script
-        assert "set -e" in script
+        assert _SCRIPT_RE.search(script)
 
-    def test_output_path(self, temp_dir):
+    def test_output_path(self, scheduler, temp_dir):
         """Test output file creation."""
-        scheduler = LocalScheduler()
         job = Job(command="echo hello", workdir=temp_dir, stdout="out.log")
 
         result = scheduler.submit(job, interactive=True)
@@ -114,11 +113,10 @@ class TestLocalScheduler:
         stdout_path = scheduler.get_output_path(result.job_id, "stdout")
         assert stdout_path is not None
         assert stdout_path.exists()
-        assert "hello" in stdout_path.read_text()
+        assert b"hello" in stdout_path.read_bytes()
 
-    def test_merged_output(self, temp_dir):
+    def test_merged_output(self, scheduler, temp_dir):
         """Test merged stdout/stderr."""
-        scheduler = LocalScheduler()
         job = Job(
             command="echo stdout; echo stderr >&2",
             workdir=temp_dir,
@@ -128,14 +126,13 @@ class TestLocalScheduler:
         result = scheduler.submit(job, interactive=True)
 
         stdout_path = scheduler.get_output_path(result.job_id, "stdout")
-        content = stdout_path.read_text()
+        content = stdout_path.read_bytes()
 
-        assert "stdout" in content
-        assert "stderr" in content  # Merged
+        assert b"stdout" in content
+        assert b"stderr" in content  # Merged
 
-    def test_passthrough_mode(self, temp_dir):
+    def test_passthrough_mode(self, scheduler, temp_dir):
         """Test passthrough mode: no stdout/stderr means no output files."""
-        scheduler = LocalScheduler()
         job = Job(command="echo passthrough", workdir=temp_dir)
 
         result = scheduler.submit(job, interactive=True)
@@ -145,9 +142,8 @@ class TestLocalScheduler:
         stdout_path = scheduler.get_output_path(result.job_id, "stdout")
         assert stdout_path is None
 
-    def test_generate_script_with_modules(self, temp_dir):
+    def test_generate_script_with_modules(self, scheduler, temp_dir):
         """Test that generated script includes module commands."""
-        scheduler = LocalScheduler()
         job = Job(
             command="echo hello",
             modules=["python/3.11", "gcc/12.2"],
@@ -162,9 +158,8 @@ class TestLocalScheduler:
         assert "module load gcc/12.2" in script
 
     @requires_modules
-    def test_module_loading(self, temp_dir):
+    def test_module_loading(self, scheduler, temp_dir):
         """Test that a module is actually loaded and sets env vars."""
-        scheduler = LocalScheduler()
         job = Job(
             command="echo $DUMMY_TOOL_LOADED",
             modules=["dummy_tool/1.0"],
@@ -177,13 +172,12 @@ class TestLocalScheduler:
 
         assert result.returncode == 0
         stdout_path = scheduler.get_output_path(result.job_id, "stdout")
-        content = stdout_path.read_text().strip()
-        assert content == "true"
+        content = stdout_path.read_bytes().strip()
+        assert content == b"true"
 
     @requires_modules
-    def test_multiple_modules(self, temp_dir):
+    def test_multiple_modules(self, scheduler, temp_dir):
         """Test loading multiple modules sets all env vars."""
-        scheduler = LocalScheduler()
         job = Job(
             command="echo $DUMMY_TOOL_LOADED $DUMMY_LIB_LOADED",
             modules=["dummy_tool/1.0", "dummy_lib/2.5"],
@@ -196,13 +190,12 @@ class TestLocalScheduler:
 
         assert result.returncode == 0
         stdout_path = scheduler.get_output_path(result.job_id, "stdout")
-        content = stdout_path.read_text().strip()
-        assert content == "true true"
+        content = stdout_path.read_bytes().strip()
+        assert content == b"true true"
 
     @requires_modules
-    def test_module_sets_env_var(self, temp_dir):
+    def test_module_sets_env_var(self, scheduler, temp_dir):
         """Test that module sets specific version string in environment."""
-        scheduler = LocalScheduler()
         job = Job(
             command="echo $DUMMY_TOOL_VERSION",
             modules=["dummy_tool/1.0"],
@@ -215,5 +208,5 @@ class TestLocalScheduler:
 
         assert result.returncode == 0
         stdout_path = scheduler.get_output_path(result.job_id, "stdout")
-        content = stdout_path.read_text().strip()
-        assert content == "1.0"
+        content = stdout_path.read_bytes().strip()
+        assert content == b"1.0"
@@ -1,11 +1,11 @@
 """Tests for SGE scheduler."""
 
-from unittest.mock import MagicMock, patch
+import re
+from unittest.mock import patch
 
 import pytest
 
 from hpc_runner.core.job import Job
-from hpc_runner.core.job_info import JobInfo
 from hpc_runner.core.result import JobStatus
 from hpc_runner.schedulers.sge import SGEScheduler
 from hpc_runner.schedulers.sge.parser import (
@@ -16,21 +16,90 @@ from hpc_runner.schedulers.sge.parser import (
     state_to_status,
 )
 
+# qstat -xml documents for TestSGEParserXML
+_XML_RUNNING = """<?xml version='1.0'?>
+<job_info>
+  <queue_info>
+    <job_list state="running">
+      <JB_job_number>99999</JB_job_number>
+      <JB_name>my_job</JB_name>
+      <JB_owner>alice</JB_owner>
+      <state>r</state>
+      <queue_name>compute.q@node5</queue_name>
+      <slots>8</slots>
+    </job_list>
+  </queue_info>
+</job_info>
+"""
+
+_XML_PENDING = """<?xml version='1.0'?>
+<job_info>
+  <job_info>
+    <job_list state="pending">
+      <JB_job_number>88888</JB_job_number>
+      <JB_name>waiting_job</JB_name>
+      <JB_owner>bob</JB_owner>
+      <state>qw</state>
+      <slots>1</slots>
+    </job_list>
+  </job_info>
+</job_info>
+"""
+
+_XML_EMPTY = """<?xml version='1.0'?>
+<job_info>
+  <queue_info>
+  </queue_info>
+  <job_info>
+  </job_info>
+</job_info>
+"""
+
+_XML_TIMESTAMPS = """<?xml version='1.0'?>
+<job_info>
+  <queue_info>
+    <job_list state="running">
+      <JB_job_number>77777</JB_job_number>
+      <JB_name>timed_job</JB_name>
+      <JB_owner>charlie</JB_owner>
+      <state>r</state>
+      <slots>2</slots>
+      <JB_submission_time>1704110400</JB_submission_time>
+      <JAT_start_time>1704110460</JAT_start_time>
+    </job_list>
+  </queue_info>
+</job_info>
+"""
+
+
+def _missing(text: str, needles: list[str]) -> set[str]:
+    """Return the needles that do not occur in text, found in a single scan."""
+    found = re.findall("|".join(map(re.escape, needles)), text)
+    return set(needles) - set(found)
+
+
+@pytest.fixture(scope="module")
+def scheduler():
+    """One SGEScheduler for the module; the tests never change its settings."""
+    return SGEScheduler()
 
+
+@pytest.mark.parser
 class TestSGEParser:
     """Tests for SGE output parsers."""
 
-    def test_parse_qsub_output(self):
-        """Test parsing qsub output."""
-        output = 'Your job 12345 ("test_job") has been submitted\n'
-        job_id = parse_qsub_output(output)
-        assert job_id == "12345"
-
-    def test_parse_qsub_array_output(self):
-        """Test parsing qsub array job output."""
-        output = 'Your job-array 12345.1-10:1 ("test_job") has been submitted\n'
-        job_id = parse_qsub_output(output)
-        assert job_id == "12345"
+    @pytest.mark.parametrize(
+        "output",
+        [
+            pytest.param('Your job 12345 ("test_job") has been submitted\n', id="job"),
+            pytest.param(
+                'Your job-array 12345.1-10:1 ("test_job") has been submitted\n', id="array"
+            ),
+        ],
+    )
+    def test_parse_qsub_output(self, output):
+        """Test parsing qsub output for plain and array jobs."""
+        assert parse_qsub_output(output) == "12345"
 
     def test_parse_qstat_plain(self):
         """Test parsing plain qstat output."""
@@ -62,25 +131,29 @@ exit_status  0
         assert info["exit_status"] == "0"
         assert info["jobnumber"] == "12345"
 
-    def test_state_to_status(self):
+    @pytest.mark.parametrize(
+        ("state", "expected"),
+        [
+            ("r", JobStatus.RUNNING),
+            ("qw", JobStatus.PENDING),
+            ("Eqw", JobStatus.FAILED),
+            ("dr", JobStatus.CANCELLED),
+        ],
+    )
+    def test_state_to_status(self, state, expected):
         """Test SGE state to JobStatus mapping."""
-        assert state_to_status("r") == JobStatus.RUNNING
-        assert state_to_status("qw") == JobStatus.PENDING
-        assert state_to_status("Eqw") == JobStatus.FAILED
-        assert state_to_status("dr") == JobStatus.CANCELLED
+        assert state_to_status(state) == expected
 
 
 class TestSGEScheduler:
     """Tests for SGEScheduler."""
 
-    def test_scheduler_name(self):
+    def test_scheduler_name(self, scheduler):
         """Test scheduler name."""
-        scheduler = SGEScheduler()
         assert scheduler.name == "sge"
 
-    def test_generate_script(self):
+    def test_generate_script(self, scheduler):
         """Test script generation."""
-        scheduler = SGEScheduler()
         job = Job(
             command="echo hello",
             name="test_job",
@@ -92,23 +165,18 @@ class TestSGEScheduler:
 
         script = scheduler.generate_script(job)
 
-        assert "#!/bin/bash" in script
-        assert "#$ -N test_job" in script
-        assert "#$ -pe" in script
-        assert "echo hello" in script
+        assert not _missing(script, ["#!/bin/bash", "#$ -N test_job", "#$ -pe", "echo hello"])
 
-    def test_generate_script_merged_output(self):
+    def test_generate_script_merged_output(self, scheduler):
         """Test script generation with merged output."""
-        scheduler = SGEScheduler()
         job = Job(command="echo hello", name="test_job")
 
         script = scheduler.generate_script(job)
 
         assert "#$ -j y" in script  # Join stdout/stderr
 
-    def test_generate_script_separate_stderr(self):
+    def test_generate_script_separate_stderr(self, scheduler):
         """Test script generation with separate stderr."""
-        scheduler = SGEScheduler()
         job = Job(command="echo hello", name="test_job", stderr="error.log")
 
         script = scheduler.generate_script(job)
@@ -116,30 +184,27 @@ class TestSGEScheduler:
         assert "#$ -j y" not in script
         assert "#$ -e error.log" in script
 
-    def test_submit_job(self, mock_sge_commands):
+    def test_submit_job(self, scheduler, mock_sge_commands):
         """Test job submission with mocked qsub."""
-        scheduler = SGEScheduler()
         job = Job(command="echo hello", name="test_job")
 
         result = scheduler.submit(job)
 
         assert result.job_id == "12345"
 
-    def test_cancel_job(self, mock_sge_commands):
+    def test_cancel_job(self, scheduler, mock_sge_commands):
         """Test job cancellation."""
-        scheduler = SGEScheduler()
         success = scheduler.cancel("12345")
         assert success is True
+        assert mock_sge_commands == [["qdel", "12345"]]
 
-    def test_get_status(self, mock_sge_commands):
+    def test_get_status(self, scheduler, mock_sge_commands):
         """Test getting job status."""
-        scheduler = SGEScheduler()
         status = scheduler.get_status("12345")
         assert status == JobStatus.RUNNING
 
-    def test_build_submit_command(self):
+    def test_build_submit_command(self, scheduler):
         """Test building qsub command."""
-        scheduler = SGEScheduler()
         job = Job(
             command="echo hello",
             name="test_job",
@@ -156,9 +221,17 @@ class TestSGEScheduler:
         assert "-pe" in cmd
         assert "-q" in cmd
 
-    def test_generate_script_env_prepend(self):
+    def test_build_interactive_command_list_argv(self, scheduler):
+        """qrsh receives list commands argument-for-argument."""
+        job = Job(command=["bash", "-c", "echo hello"], queue="batch")
+
+        cmd = scheduler.build_interactive_command(job)
+
+        assert cmd[0] == "qrsh"
+        assert cmd[-3:] == ["bash", "-c", "echo hello"]
+
+    def test_generate_script_env_prepend(self, scheduler):
         """Test script generation with env_prepend."""
-        scheduler = SGEScheduler()
         job = Job(
             command="echo hello",
             name="test_job",
@@ -167,12 +240,13 @@ class TestSGEScheduler:
 
         script = scheduler.generate_script(job)
 
-        assert '# Prepend to environment variables' in script
-        assert 'export PATH="/new/bin${PATH:+:$PATH}"' in script
+        assert not _missing(
+            script,
+            ["# Prepend to environment variables", 'export PATH="/new/bin${PATH:+:$PATH}"'],
+        )
 
-    def test_generate_script_env_append(self):
+    def test_generate_script_env_append(self, scheduler):
         """Test script generation with env_append."""
-        scheduler = SGEScheduler()
         job = Job(
             command="echo hello",
             name="test_job",
@@ -181,12 +255,16 @@ class TestSGEScheduler:
 
         script = scheduler.generate_script(job)
 
-        assert '# Append to environment variables' in script
-        assert 'export PYTHONPATH="${PYTHONPATH:+$PYTHONPATH:}/extra/lib"' in script
+        assert not _missing(
+            script,
+            [
+                "# Append to environment variables",
+                'export PYTHONPATH="${PYTHONPATH:+$PYTHONPATH:}/extra/lib"',
+            ],
+        )
 
-    def test_generate_script_all_env_types(self):
+    def test_generate_script_all_env_types(self, scheduler):
         """Test script with env_vars, env_prepend, and env_append together."""
-        scheduler = SGEScheduler()
         job = Job(
             command="echo hello",
             name="test_job",
@@ -198,19 +276,27 @@ class TestSGEScheduler:
         script = scheduler.generate_script(job)
 
         # All three sections should be present
-        assert 'export PATH="/cocotb/bin${PATH:+:$PATH}"' in script
-        assert 'export PYTHONPATH="${PYTHONPATH:+$PYTHONPATH:}/extra/lib"' in script
-        assert 'export COCOTB_TOPLEVEL="counter"' in script
+        assert not _missing(
+            script,
+            [
+                'export PATH="/cocotb/bin${PATH:+:$PATH}"',
+                'export PYTHONPATH="${PYTHONPATH:+$PYTHONPATH:}/extra/lib"',
+                'export COCOTB_TOPLEVEL="counter"',
+            ],
+        )
 
         # Prepend/append should come before env_vars (full overwrite)
-        prepend_pos = script.index("Prepend to environment variables")
-        append_pos = script.index("Append to environment variables")
-        vars_pos = script.index("Set custom environment variables")
-        assert prepend_pos < append_pos < vars_pos
-
-    def test_generate_script_env_vars_unchanged(self):
+        pos = 0
+        for marker in (
+            "Prepend to environment variables",
+            "Append to environment variables",
+            "Set custom environment variables",
+        ):
+            pos = script.find(marker, pos)
+            assert pos != -1, f"{marker!r} missing or out of order"
+
+    def test_generate_script_env_vars_unchanged(self, scheduler):
         """Test that existing env_vars behavior is unchanged."""
-        scheduler = SGEScheduler()
         job = Job(
             command="echo hello",
             name="test_job",
@@ -219,8 +305,7 @@ class TestSGEScheduler:
 
         script = scheduler.generate_script(job)
 
-        assert 'export FOO="bar"' in script
-        assert 'export BAZ="qux"' in script
+        assert not _missing(script, ['export FOO="bar"', 'export BAZ="qux"'])
 
     def test_configurable_pe_name(self):
         """Test that PE name is configurable."""
@@ -234,9 +319,8 @@ class TestSGEScheduler:
             assert scheduler.pe_name == "mpi"
             assert scheduler.mem_resource == "h_vmem"
 
-    def test_list_active_jobs(self, mock_sge_commands):
+    def test_list_active_jobs(self, scheduler, mock_sge_commands):
         """Test listing active jobs."""
-        scheduler = SGEScheduler()
         jobs = scheduler.list_active_jobs()
 
         # Should return 3 jobs from mock XML
@@ -255,10 +339,8 @@ class TestSGEScheduler:
         pending_jobs = [j for j in jobs if j.status == JobStatus.PENDING]
         assert len(pending_jobs) == 2
 
-    def test_list_active_jobs_filter_by_status(self, mock_sge_commands):
+    def test_list_active_jobs_filter_by_status(self, scheduler, mock_sge_commands):
         """Test filtering jobs by status."""
-        scheduler = SGEScheduler()
-
         # Only running jobs
         running = scheduler.list_active_jobs(status={JobStatus.RUNNING})
         assert len(running) == 1
@@ -268,10 +350,8 @@ class TestSGEScheduler:
         pending = scheduler.list_active_jobs(status={JobStatus.PENDING})
         assert len(pending) == 2
 
-    def test_list_active_jobs_filter_by_queue(self, mock_sge_commands):
+    def test_list_active_jobs_filter_by_queue(self, scheduler, mock_sge_commands):
         """Test filtering jobs by queue."""
-        scheduler = SGEScheduler()
-
         # Filter by batch.q
         batch_jobs = scheduler.list_active_jobs(queue="batch.q")
         assert len(batch_jobs) == 1
@@ -283,26 +363,13 @@ class TestSGEScheduler:
         assert gpu_jobs[0].job_id == "12347"
 
 
+@pytest.mark.parser
 class TestSGEParserXML:
     """Tests for qstat XML parsing."""
 
     def test_parse_qstat_xml_running_job(self):
         """Test parsing running job from XML."""
-        xml = """<?xml version='1.0'?>
-<job_info>
-  <queue_info>
-    <job_list state="running">
-      <JB_job_number>99999</JB_job_number>
-      <JB_name>my_job</JB_name>
-      <JB_owner>alice</JB_owner>
-      <state>r</state>
-      <queue_name>compute.q@node5</queue_name>
-      <slots>8</slots>
-    </job_list>
-  </queue_info>
-</job_info>
-"""
-        jobs = parse_qstat_xml(xml)
+        jobs = parse_qstat_xml(_XML_RUNNING)
 
         assert "99999" in jobs
         job = jobs["99999"]
@@ -314,20 +381,7 @@ class TestSGEParserXML:
 
     def test_parse_qstat_xml_pending_job(self):
         """Test parsing pending job from XML."""
-        xml = """<?xml version='1.0'?>
-<job_info>
-  <job_info>
-    <job_list state="pending">
-      <JB_job_number>88888</JB_job_number>
-      <JB_name>waiting_job</JB_name>
-      <JB_owner>bob</JB_owner>
-      <state>qw</state>
-      <slots>1</slots>
-    </job_list>
-  </job_info>
-</job_info>
-"""
-        jobs = parse_qstat_xml(xml)
+        jobs = parse_qstat_xml(_XML_PENDING)
 
         assert "88888" in jobs
         job = jobs["88888"]
@@ -336,37 +390,28 @@ class TestSGEParserXML:
 
     def test_parse_qstat_xml_empty(self):
         """Test parsing empty qstat XML output."""
-        xml = """<?xml version='1.0'?>
-<job_info>
-  <queue_info>
-  </queue_info>
-  <job_info>
-  </job_info>
-</job_info>
-"""
-        jobs = parse_qstat_xml(xml)
+        jobs = parse_qstat_xml(_XML_EMPTY)
         assert len(jobs) == 0
 
     def test_parse_qstat_xml_with_timestamps(self):
         """Test parsing jobs with submission/start times."""
-        xml = """<?xml version='1.0'?>
-<job_info>
-  <queue_info>
-    <job_list state="running">
-      <JB_job_number>77777</JB_job_number>
-      <JB_name>timed_job</JB_name>
-      <JB_owner>charlie</JB_owner>
-      <state>r</state>
-      <slots>2</slots>
-      <JB_submission_time>1704110400</JB_submission_time>
-      <JAT_start_time>1704110460</JAT_start_time>
-    </job_list>
-  </queue_info>
-</job_info>
-"""
-        jobs = parse_qstat_xml(xml)
+        jobs = parse_qstat_xml(_XML_TIMESTAMPS)
 
         assert "77777" in jobs
         job = jobs["77777"]
         assert job["submit_time"] == 1704110400
         assert job["start_time"] == 1704110460
+
+    def test_parse_qstat_xml_default_namespace(self):
+        """Tags under a default namespace are matched by their local names."""
+        xml = _XML_RUNNING.replace("<job_info>", '<job_info xmlns="urn:sge">', 1)
+        jobs = parse_qstat_xml(xml)
+
+        assert jobs["99999"]["name"] == "my_job"
+
+    def test_parse_qstat_xml_namespace_below_root(self):
+        """A namespace declared on a descendant element is stripped too."""
+        xml = _XML_RUNNING.replace("<queue_info>", '<queue_info xmlns="urn:sge">', 1)
+        jobs = parse_qstat_xml(xml)
+
+        assert jobs["99999"]["name"] == "my_job"
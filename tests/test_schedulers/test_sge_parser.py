@@ -2,14 +2,15 @@
 
 from datetime import datetime, timedelta
 
+import pytest
+
 from hpc_runner.core.result import JobStatus
 from hpc_runner.schedulers.sge.parser import parse_qacct_records, qacct_to_job_info
 
+# qacct prints a line of 62 '=' before every record
+_SEPARATOR = "=" * 62
 
-class TestParseQacctRecords:
-    """Tests for parse_qacct_records()."""
-
-    SINGLE_RECORD = """\
+_SINGLE_RECORD = """\
 ==============================================================
 qname        all.q
 hostname     node1
@@ -24,7 +25,7 @@ start_time   Mon Feb 23 10:00:05 2026
 end_time     Mon Feb 23 10:02:08 2026
 """
 
-    TWO_RECORDS = """\
+_TWO_RECORDS = """\
 ==============================================================
 qname        all.q
 hostname     node1
@@ -51,15 +52,20 @@ start_time   Mon Feb 23 11:00:10 2026
 end_time     Mon Feb 23 11:05:10 2026
 """
 
+
+@pytest.mark.parser
+class TestParseQacctRecords:
+    """Tests for parse_qacct_records()."""
+
     def test_single_record(self):
-        records = parse_qacct_records(self.SINGLE_RECORD)
+        records = parse_qacct_records(_SINGLE_RECORD)
         assert len(records) == 1
         assert records[0]["jobnumber"] == "10001"
         assert records[0]["jobname"] == "sim_run"
         assert records[0]["exit_status"] == "0"
 
     def test_two_records(self):
-        records = parse_qacct_records(self.TWO_RECORDS)
+        records = parse_qacct_records(_TWO_RECORDS)
         assert len(records) == 2
         assert records[0]["jobnumber"] == "10001"
         assert records[1]["jobnumber"] == "10002"
@@ -69,10 +75,20 @@ end_time     Mon Feb 23 11:05:10 2026
         assert records == []
 
     def test_separator_only(self):
-        records = parse_qacct_records("=" * 62)
+        records = parse_qacct_records(_SEPARATOR)
         assert records == []
 
 
+# Minimal qacct record (required fields only); tests layer overrides on with |
+_BASE_RECORD = {
+    "jobnumber": "10003",
+    "jobname": "minimal",
+    "owner": "charlie",
+    "exit_status": "0",
+}
+
+
+@pytest.mark.parser
 class TestQacctToJobInfo:
     """Tests for qacct_to_job_info()."""
 
@@ -105,30 +121,21 @@ class TestQacctToJobInfo:
         assert info.start_time == datetime(2026, 2, 23, 10, 0, 5)
         assert info.end_time == datetime(2026, 2, 23, 10, 2, 8)
 
-    def test_failed_job(self):
-        record = {
-            "jobnumber": "10002",
-            "jobname": "bad_run",
-            "owner": "bob",
-            "exit_status": "137",
-            "qname": "gpu.q",
-            "hostname": "node2",
-            "slots": "1",
-            "ru_wallclock": "5.0",
-        }
-        info = qacct_to_job_info(record)
+    @pytest.mark.parametrize(
+        ("exit_status", "expected_status", "expected_code"),
+        [
+            ("0", JobStatus.COMPLETED, 0),
+            ("137", JobStatus.FAILED, 137),
+        ],
+    )
+    def test_exit_status(self, exit_status, expected_status, expected_code):
+        info = qacct_to_job_info(_BASE_RECORD | {"exit_status": exit_status})
 
-        assert info.status == JobStatus.FAILED
-        assert info.exit_code == 137
+        assert info.status == expected_status
+        assert info.exit_code == expected_code
 
     def test_missing_optional_fields(self):
-        record = {
-            "jobnumber": "10003",
-            "jobname": "minimal",
-            "owner": "charlie",
-            "exit_status": "0",
-        }
-        info = qacct_to_job_info(record)
+        info = qacct_to_job_info(_BASE_RECORD)
 
         assert info.job_id == "10003"
         assert info.status == JobStatus.COMPLETED
@@ -139,11 +146,7 @@ class TestQacctToJobInfo:
         assert info.submit_time is None
 
     def test_timestamps_parsed(self):
-        record = {
-            "jobnumber": "10004",
-            "jobname": "timed",
-            "owner": "dave",
-            "exit_status": "0",
+        record = _BASE_RECORD | {
             "qsub_time": "Sun Feb 22 23:59:59 2026",
             "start_time": "Mon Feb 23 00:00:01 2026",
             "end_time": "Mon Feb 23 01:30:00 2026",
@@ -0,0 +1,30 @@
+"""Shared helpers for TUI tests."""
+
+from functools import lru_cache
+
+from hpc_runner.core.job_info import JobInfo
+from hpc_runner.core.result import JobStatus
+
+
+@lru_cache(maxsize=256)
+def make_job(
+    job_id: str = "12345",
+    name: str = "test_job",
+    user: str = "testuser",
+    status: JobStatus = JobStatus.RUNNING,
+    queue: str | None = "batch.q",
+    cpu: int | None = 4,
+) -> JobInfo:
+    """Helper to create JobInfo objects for testing.
+
+    Identical arguments return the same cached instance, so tests must not
+    mutate the result; use dataclasses.replace() to vary a field.
+    """
+    return JobInfo(
+        job_id=job_id,
+        name=name,
+        user=user,
+        status=status,
+        queue=queue,
+        cpu=cpu,
+    )
@@ -0,0 +1,13 @@
+"""Fixtures for TUI tests."""
+
+import asyncio
+
+import pytest_asyncio
+
+
+@pytest_asyncio.fixture(scope="module", autouse=True)
+async def _no_leaked_tasks():
+    """Fail the module if it leaves tasks running on the shared event loop."""
+    yield
+    leaked = asyncio.all_tasks() - {asyncio.current_task()}
+    assert not leaked, f"tasks still pending after module: {leaked}"
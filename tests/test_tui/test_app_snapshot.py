@@ -1,20 +1,19 @@
 """Tests for HPC Monitor TUI."""
 
-import pytest
 from textual.color import Color
-from hpc_runner.tui.app import HpcMonitorApp, HPC_MONITOR_THEME
+from textual.containers import HorizontalGroup
+from textual.widgets import Header, Tab, TabbedContent, TabPane
+
+from hpc_runner.tui.app import HPC_MONITOR_THEME, HpcMonitorApp
 
 
 class TestHpcMonitorApp:
     """Tests for the HPC Monitor TUI application."""
 
-    @pytest.mark.asyncio
     async def test_app_renders(self):
         """Basic test that the app renders without error."""
         app = HpcMonitorApp()
         async with app.run_test(size=(80, 24)) as pilot:
-            from textual.widgets import Tab
-
             # Check tabs exist
             tabs = app.query(Tab)
             assert len(tabs) == 2
@@ -24,7 +23,6 @@ class TestHpcMonitorApp:
             assert "Active" in tab_labels
             assert "Completed" in tab_labels
 
-    @pytest.mark.asyncio
     async def test_app_theme_applied(self):
         """Test that custom theme is applied."""
         app = HpcMonitorApp()
@@ -32,7 +30,6 @@ class TestHpcMonitorApp:
             # Theme should be applied
             assert app.theme == "hpc-monitor"
 
-    @pytest.mark.asyncio
     async def test_active_tab_uses_theme_primary(self):
         """Test that active tab uses a teal-ish primary color from theme.
 
@@ -41,8 +38,6 @@ class TestHpcMonitorApp:
         """
         app = HpcMonitorApp()
         async with app.run_test(size=(80, 24)) as pilot:
-            from textual.widgets import Tab
-
             # Find the active tab
             active_tabs = [t for t in app.query(Tab) if t.has_class("-active")]
             assert len(active_tabs) == 1
@@ -81,20 +76,16 @@ class TestTransparentBackgrounds:
             return True
         return False
 
-    @pytest.mark.asyncio
     async def test_header_background_transparent(self):
         """Header should have transparent background."""
         app = HpcMonitorApp()
         async with app.run_test(size=(80, 24)) as pilot:
-            from textual.widgets import Header
-
             header = app.query_one(Header)
             bg = header.styles.background
             assert self._is_transparent(bg), (
                 f"Header background should be transparent, got {bg}"
             )
 
-    @pytest.mark.asyncio
     async def test_footer_background_transparent(self):
         """Footer should have transparent background.
 
@@ -104,8 +95,6 @@ class TestTransparentBackgrounds:
         """
         app = HpcMonitorApp()
         async with app.run_test(size=(80, 24)) as pilot:
-            from textual.containers import HorizontalGroup
-
             # Custom footer is a HorizontalGroup with id="footer"
             footer = app.query_one("#footer", HorizontalGroup)
             bg = footer.styles.background
@@ -120,26 +109,20 @@ class TestTransparentBackgrounds:
                     f"Footer child background should be transparent, got {child_bg}"
                 )
 
-    @pytest.mark.asyncio
     async def test_tabbed_content_background_transparent(self):
         """TabbedContent container should have transparent background."""
         app = HpcMonitorApp()
         async with app.run_test(size=(80, 24)) as pilot:
-            from textual.widgets import TabbedContent
-
             tabbed = app.query_one(TabbedContent)
             bg = tabbed.styles.background
             assert self._is_transparent(bg), (
                 f"TabbedContent background should be transparent, got {bg}"
             )
 
-    @pytest.mark.asyncio
     async def test_tab_pane_background_transparent(self):
         """TabPane content areas should have transparent background."""
         app = HpcMonitorApp()
         async with app.run_test(size=(80, 24)) as pilot:
-            from textual.widgets import TabPane
-
             panes = app.query(TabPane)
             for pane in panes:
                 bg = pane.styles.background
@@ -147,13 +130,10 @@ class TestTransparentBackgrounds:
                     f"TabPane '{pane.id}' background should be transparent, got {bg}"
                 )
 
-    @pytest.mark.asyncio
     async def test_inactive_tab_background_transparent(self):
         """Inactive tabs should have transparent background."""
         app = HpcMonitorApp()
         async with app.run_test(size=(80, 24)) as pilot:
-            from textual.widgets import Tab
-
             inactive_tabs = [t for t in app.query(Tab) if not t.has_class("-active")]
             assert len(inactive_tabs) > 0, "Should have at least one inactive tab"
 
@@ -164,7 +144,6 @@ class TestTransparentBackgrounds:
                     f"transparent, got {bg}"
                 )
 
-    @pytest.mark.asyncio
     async def test_screen_background_not_solid(self):
         """Screen (root container) should not have a solid background.
 
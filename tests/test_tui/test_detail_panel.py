@@ -1,150 +1,119 @@
 """Tests for DetailPanel and ButtonBar components."""
 
+from dataclasses import replace
+
 import pytest
+import pytest_asyncio
+from textual.app import App, ComposeResult
+from textual.message import Message
+from textual.widgets import Button
 
-from hpc_runner.core.job_info import JobInfo
 from hpc_runner.core.result import JobStatus
 from hpc_runner.tui.components.detail_panel import ButtonBar, DetailPanel
-from textual.app import App, ComposeResult
-from textual.widgets import Button
 
+from ._helpers import make_job
+
+# Screen size for these apps; they only check focus, classes and messages
+_APP_SIZE = (40, 10)
+
+
+class ButtonBarApp(App[None]):
+    """App hosting a ButtonBar of ``count`` buttons with ids btn-1..btn-N."""
+
+    def __init__(self, count: int, disabled: tuple[int, ...] = ()) -> None:
+        super().__init__()
+        self._count = count
+        self._disabled = disabled
+
+    def compose(self) -> ComposeResult:
+        with ButtonBar(id="buttons"):
+            for i in range(1, self._count + 1):
+                yield Button(f"Button {i}", id=f"btn-{i}", disabled=i in self._disabled)
+
+
+class DetailPanelApp(App[None]):
+    """App hosting a single DetailPanel and recording the messages it posts."""
 
-def make_job(
-    job_id: str = "12345",
-    name: str = "test_job",
-    status: JobStatus = JobStatus.RUNNING,
-) -> JobInfo:
-    """Helper to create JobInfo objects for testing."""
-    return JobInfo(
-        job_id=job_id,
-        name=name,
-        user="testuser",
-        status=status,
-    )
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages: list[Message] = []
 
+    def compose(self) -> ComposeResult:
+        yield DetailPanel(id="detail")
 
+    def on_detail_panel_view_logs(self, event: DetailPanel.ViewLogs) -> None:
+        self.messages.append(event)
+
+    def on_detail_panel_cancel_job(self, event: DetailPanel.CancelJob) -> None:
+        self.messages.append(event)
+
+
+@pytest.fixture
+async def panel_app():
+    """Yield (app, pilot, panel) for a running DetailPanelApp."""
+    app = DetailPanelApp()
+    async with app.run_test(size=_APP_SIZE) as pilot:
+        yield app, pilot, app.query_one(DetailPanel)
+
+
+@pytest_asyncio.fixture(scope="class", loop_scope="class")
+async def bar_app():
+    """One running three-button app shared by a test class.
+
+    Every test focuses its own starting button, so no state carries over.
+    """
+    app = ButtonBarApp(3)
+    async with app.run_test(size=_APP_SIZE) as pilot:
+        yield app, pilot
+
+
+@pytest.mark.asyncio(loop_scope="class")
 class TestButtonBar:
     """Tests for ButtonBar arrow key navigation."""
 
-    @pytest.mark.asyncio
-    async def test_right_arrow_moves_focus_forward(self):
-        """Test that right arrow moves focus to next button."""
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                with ButtonBar(id="buttons"):
-                    yield Button("First", id="btn-1")
-                    yield Button("Second", id="btn-2")
-                    yield Button("Third", id="btn-3")
-
-        app = TestApp()
-        async with app.run_test() as pilot:
-            # Focus first button
-            btn1 = app.query_one("#btn-1", Button)
-            btn1.focus()
-            await pilot.pause()
-            assert app.focused == btn1
+    async def _press_from(self, bar_app, start: str, key: str) -> Button | None:
+        """Focus button ``start``, press ``key`` and return the focused widget."""
+        app, pilot = bar_app
+        app.query_one(start, Button).focus()
+        await pilot.pause(0)
+        assert app.focused == app.query_one(start, Button)
 
-            # Press right arrow
-            await pilot.press("right")
-            await pilot.pause()
+        await pilot.press(key)
+        await pilot.pause(0)
+        return app.focused
 
-            # Focus should be on second button
-            btn2 = app.query_one("#btn-2", Button)
-            assert app.focused == btn2
+    async def test_right_arrow_moves_focus_forward(self, bar_app):
+        """Test that right arrow moves focus to next button."""
+        focused = await self._press_from(bar_app, "#btn-1", "right")
+        assert focused == bar_app[0].query_one("#btn-2", Button)
 
-    @pytest.mark.asyncio
-    async def test_left_arrow_moves_focus_backward(self):
+    async def test_left_arrow_moves_focus_backward(self, bar_app):
         """Test that left arrow moves focus to previous button."""
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                with ButtonBar(id="buttons"):
-                    yield Button("First", id="btn-1")
-                    yield Button("Second", id="btn-2")
-                    yield Button("Third", id="btn-3")
-
-        app = TestApp()
-        async with app.run_test() as pilot:
-            # Focus second button
-            btn2 = app.query_one("#btn-2", Button)
-            btn2.focus()
-            await pilot.pause()
-
-            # Press left arrow
-            await pilot.press("left")
-            await pilot.pause()
-
-            # Focus should be on first button
-            btn1 = app.query_one("#btn-1", Button)
-            assert app.focused == btn1
+        focused = await self._press_from(bar_app, "#btn-2", "left")
+        assert focused == bar_app[0].query_one("#btn-1", Button)
 
-    @pytest.mark.asyncio
-    async def test_right_arrow_wraps_around(self):
+    async def test_right_arrow_wraps_around(self, bar_app):
         """Test that right arrow wraps from last to first button."""
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                with ButtonBar(id="buttons"):
-                    yield Button("First", id="btn-1")
-                    yield Button("Second", id="btn-2")
-
-        app = TestApp()
-        async with app.run_test() as pilot:
-            # Focus last button
-            btn2 = app.query_one("#btn-2", Button)
-            btn2.focus()
-            await pilot.pause()
-
-            # Press right arrow
-            await pilot.press("right")
-            await pilot.pause()
+        focused = await self._press_from(bar_app, "#btn-3", "right")
+        assert focused == bar_app[0].query_one("#btn-1", Button)
 
-            # Focus should wrap to first button
-            btn1 = app.query_one("#btn-1", Button)
-            assert app.focused == btn1
-
-    @pytest.mark.asyncio
-    async def test_left_arrow_wraps_around(self):
+    async def test_left_arrow_wraps_around(self, bar_app):
         """Test that left arrow wraps from first to last button."""
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                with ButtonBar(id="buttons"):
-                    yield Button("First", id="btn-1")
-                    yield Button("Second", id="btn-2")
-
-        app = TestApp()
-        async with app.run_test() as pilot:
-            # Focus first button
-            btn1 = app.query_one("#btn-1", Button)
-            btn1.focus()
-            await pilot.pause()
-
-            # Press left arrow
-            await pilot.press("left")
-            await pilot.pause()
+        focused = await self._press_from(bar_app, "#btn-1", "left")
+        assert focused == bar_app[0].query_one("#btn-3", Button)
 
-            # Focus should wrap to last button
-            btn2 = app.query_one("#btn-2", Button)
-            assert app.focused == btn2
-
-    @pytest.mark.asyncio
     async def test_skips_disabled_buttons(self):
         """Test that arrow navigation skips disabled buttons."""
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                with ButtonBar(id="buttons"):
-                    yield Button("First", id="btn-1")
-                    yield Button("Second", id="btn-2", disabled=True)
-                    yield Button("Third", id="btn-3")
-
-        app = TestApp()
-        async with app.run_test() as pilot:
+        app = ButtonBarApp(3, disabled=(2,))
+        async with app.run_test(size=_APP_SIZE) as pilot:
             # Focus first button
             btn1 = app.query_one("#btn-1", Button)
             btn1.focus()
-            await pilot.pause()
+            await pilot.pause(0)
 
             # Press right arrow - should skip disabled btn-2
             await pilot.press("right")
-            await pilot.pause()
+            await pilot.pause(0)
 
             # Focus should be on third button (skipping disabled second)
             btn3 = app.query_one("#btn-3", Button)
@@ -154,167 +123,91 @@ class TestButtonBar:
 class TestDetailPanel:
     """Tests for DetailPanel widget."""
 
-    @pytest.mark.asyncio
-    async def test_panel_renders(self):
+    async def test_panel_renders(self, panel_app):
         """Test that panel renders without error."""
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                yield DetailPanel(id="detail")
-
-        app = TestApp()
-        async with app.run_test() as pilot:
-            panel = app.query_one(DetailPanel)
-            assert panel is not None
+        _, _, panel = panel_app
+        assert panel is not None
 
-    @pytest.mark.asyncio
-    async def test_no_selection_message_shown_initially(self):
+    async def test_no_selection_message_shown_initially(self, panel_app):
         """Test that 'no selection' message is shown when no job selected."""
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                yield DetailPanel(id="detail")
-
-        app = TestApp()
-        async with app.run_test() as pilot:
-            panel = app.query_one(DetailPanel)
-            no_selection = panel.query_one("#no-selection")
-            assert "hidden" not in no_selection.classes
-
-    @pytest.mark.asyncio
-    async def test_update_job_shows_details(self):
+        _, _, panel = panel_app
+        no_selection = panel.query_one("#no-selection")
+        assert "hidden" not in no_selection.classes
+
+    async def test_update_job_shows_details(self, panel_app):
         """Test that update_job shows job details."""
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                yield DetailPanel(id="detail")
-
-        app = TestApp()
-        async with app.run_test() as pilot:
-            panel = app.query_one(DetailPanel)
-            job = make_job("12345", "my_test_job")
-            panel.update_job(job)
-            await pilot.pause()
-
-            # No selection should be hidden
-            no_selection = panel.query_one("#no-selection")
-            assert "hidden" in no_selection.classes
-
-            # Detail content should be visible
-            detail_content = panel.query_one("#detail-content")
-            assert "hidden" not in detail_content.classes
-
-    @pytest.mark.asyncio
-    async def test_update_job_none_shows_no_selection(self):
-        """Test that update_job(None) shows no selection message."""
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                yield DetailPanel(id="detail")
+        _, _, panel = panel_app
+        job = make_job("12345", "my_test_job")
+        panel.update_job(job)
+
+        # No selection should be hidden
+        no_selection = panel.query_one("#no-selection")
+        assert "hidden" in no_selection.classes
 
-        app = TestApp()
-        async with app.run_test() as pilot:
-            panel = app.query_one(DetailPanel)
+        # Detail content should be visible
+        detail_content = panel.query_one("#detail-content")
+        assert "hidden" not in detail_content.classes
 
-            # First set a job
-            panel.update_job(make_job())
-            await pilot.pause()
+    async def test_update_job_none_shows_no_selection(self, panel_app):
+        """Test that update_job(None) shows no selection message."""
+        _, _, panel = panel_app
 
-            # Then clear it
-            panel.update_job(None)
-            await pilot.pause()
+        # First set a job
+        panel.update_job(make_job())
 
-            # No selection should be visible again
-            no_selection = panel.query_one("#no-selection")
-            assert "hidden" not in no_selection.classes
+        # Then clear it
+        panel.update_job(None)
 
-    @pytest.mark.asyncio
-    async def test_cancel_button_disabled_for_completed_job(self):
+        # No selection should be visible again
+        no_selection = panel.query_one("#no-selection")
+        assert "hidden" not in no_selection.classes
+
+    async def test_cancel_button_disabled_for_completed_job(self, panel_app):
         """Test that cancel button is disabled for completed jobs."""
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                yield DetailPanel(id="detail")
-
-        app = TestApp()
-        async with app.run_test() as pilot:
-            panel = app.query_one(DetailPanel)
-            job = make_job(status=JobStatus.COMPLETED)
-            panel.update_job(job)
-            await pilot.pause()
-
-            btn_cancel = panel.query_one("#btn-cancel", Button)
-            assert btn_cancel.disabled
-
-    @pytest.mark.asyncio
-    async def test_cancel_button_enabled_for_running_job(self):
+        _, _, panel = panel_app
+        job = make_job(status=JobStatus.COMPLETED)
+        panel.update_job(job)
+
+        btn_cancel = panel.query_one("#btn-cancel", Button)
+        assert btn_cancel.disabled
+
+    async def test_cancel_button_enabled_for_running_job(self, panel_app):
         """Test that cancel button is enabled for running jobs."""
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                yield DetailPanel(id="detail")
-
-        app = TestApp()
-        async with app.run_test() as pilot:
-            panel = app.query_one(DetailPanel)
-            job = make_job(status=JobStatus.RUNNING)
-            panel.update_job(job)
-            await pilot.pause()
-
-            btn_cancel = panel.query_one("#btn-cancel", Button)
-            assert not btn_cancel.disabled
-
-    @pytest.mark.asyncio
-    async def test_view_logs_message_emitted(self):
+        _, _, panel = panel_app
+        job = make_job(status=JobStatus.RUNNING)
+        panel.update_job(job)
+
+        btn_cancel = panel.query_one("#btn-cancel", Button)
+        assert not btn_cancel.disabled
+
+    async def test_view_logs_message_emitted(self, panel_app):
         """Test that ViewLogs message is emitted when button clicked."""
-        messages_received = []
-
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                yield DetailPanel(id="detail")
-
-            def on_detail_panel_view_logs(
-                self, event: DetailPanel.ViewLogs
-            ) -> None:
-                messages_received.append(event)
-
-        app = TestApp()
-        async with app.run_test() as pilot:
-            panel = app.query_one(DetailPanel)
-            job = make_job()
-            # Set stdout_path so button is enabled
-            job.stdout_path = "/tmp/test.out"
-            panel.update_job(job)
-            await pilot.pause()
-
-            # Click stdout button
-            btn_stdout = panel.query_one("#btn-stdout", Button)
-            btn_stdout.press()
-            await pilot.pause()
-
-            assert len(messages_received) == 1
-            assert messages_received[0].stream == "stdout"
-            assert messages_received[0].job.job_id == "12345"
-
-    @pytest.mark.asyncio
-    async def test_cancel_job_message_emitted(self):
+        app, pilot, panel = panel_app
+        # Set stdout_path so button is enabled
+        job = replace(make_job(), stdout_path="/tmp/test.out")
+        panel.update_job(job)
+
+        # Click stdout button
+        btn_stdout = panel.query_one("#btn-stdout", Button)
+        btn_stdout.press()
+        await pilot.pause()  # let the message bubble up to the app
+
+        assert len(app.messages) == 1
+        assert isinstance(app.messages[0], DetailPanel.ViewLogs)
+        assert app.messages[0].stream == "stdout"
+        assert app.messages[0].job.job_id == "12345"
+
+    async def test_cancel_job_message_emitted(self, panel_app):
         """Test that CancelJob message is emitted when button clicked."""
-        messages_received = []
-
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                yield DetailPanel(id="detail")
-
-            def on_detail_panel_cancel_job(
-                self, event: DetailPanel.CancelJob
-            ) -> None:
-                messages_received.append(event)
-
-        app = TestApp()
-        async with app.run_test() as pilot:
-            panel = app.query_one(DetailPanel)
-            job = make_job(status=JobStatus.RUNNING)
-            panel.update_job(job)
-            await pilot.pause()
-
-            # Click cancel button
-            btn_cancel = panel.query_one("#btn-cancel", Button)
-            btn_cancel.press()
-            await pilot.pause()
-
-            assert len(messages_received) == 1
-            assert messages_received[0].job.job_id == "12345"
+        app, pilot, panel = panel_app
+        job = make_job(status=JobStatus.RUNNING)
+        panel.update_job(job)
+
+        # Click cancel button
+        btn_cancel = panel.query_one("#btn-cancel", Button)
+        btn_cancel.press()
+        await pilot.pause()  # let the message bubble up to the app
+
+        assert len(app.messages) == 1
+        assert isinstance(app.messages[0], DetailPanel.CancelJob)
+        assert app.messages[0].job.job_id == "12345"
@@ -0,0 +1,152 @@
+"""Tests for JobProvider."""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+from hpc_runner.core.job_info import JobInfo
+from hpc_runner.core.result import JobStatus
+from hpc_runner.tui.providers.jobs import JobProvider, _LogFollower
+
+
+def make_scheduler(release: threading.Event) -> MagicMock:
+    """Create a mock scheduler whose list_active_jobs blocks until released."""
+    scheduler = MagicMock()
+    scheduler.name = "mock"
+
+    def list_active_jobs(**kwargs):
+        release.wait(timeout=5)
+        return [JobInfo(job_id="1", name="job", user="me", status=JobStatus.RUNNING)]
+
+    scheduler.list_active_jobs.side_effect = list_active_jobs
+    return scheduler
+
+
+class TestJobProvider:
+    """Tests for JobProvider."""
+
+    async def test_concurrent_identical_queries_are_coalesced(self):
+        """Test that overlapping identical queries share one scheduler call."""
+        release = threading.Event()
+        scheduler = make_scheduler(release)
+        provider = JobProvider(scheduler)
+
+        first = asyncio.ensure_future(provider.get_active_jobs())
+        second = asyncio.ensure_future(provider.get_active_jobs())
+        await asyncio.sleep(0.05)
+        release.set()
+        results = await asyncio.gather(first, second)
+
+        assert scheduler.list_active_jobs.call_count == 1
+        assert results[0] == results[1]
+        assert results[0][0].job_id == "1"
+
+    async def test_different_queries_are_not_coalesced(self):
+        """Test that queries with different filters each hit the scheduler."""
+        release = threading.Event()
+        release.set()
+        scheduler = make_scheduler(release)
+        provider = JobProvider(scheduler)
+
+        await asyncio.gather(
+            provider.get_active_jobs(user_filter="me"),
+            provider.get_active_jobs(user_filter="all"),
+        )
+
+        assert scheduler.list_active_jobs.call_count == 2
+
+    async def test_has_accounting_is_cached(self):
+        """Test that the scheduler is only asked about accounting once."""
+        scheduler = MagicMock()
+        scheduler.has_accounting.return_value = True
+        provider = JobProvider(scheduler)
+
+        assert await provider.has_accounting() is True
+        assert await provider.has_accounting() is True
+        assert scheduler.has_accounting.call_count == 1
+
+    async def test_has_accounting_error_not_cached(self):
+        """Test that a failed accounting check is retried on the next call."""
+        scheduler = MagicMock()
+        scheduler.has_accounting.side_effect = [RuntimeError("boom"), True]
+        provider = JobProvider(scheduler)
+
+        assert await provider.has_accounting() is False
+        assert await provider.has_accounting() is True
+        assert scheduler.has_accounting.call_count == 2
+
+    async def test_completed_jobs_cached_until_cancel(self):
+        """Test that repeat history queries are served from cache."""
+        scheduler = MagicMock()
+        scheduler.list_completed_jobs.return_value = [
+            JobInfo(job_id="1", name="job", user="me", status=JobStatus.COMPLETED)
+        ]
+        scheduler.cancel.return_value = True
+        provider = JobProvider(scheduler)
+
+        await provider.get_completed_jobs(limit=10)
+        await provider.get_completed_jobs(limit=10)
+        assert scheduler.list_completed_jobs.call_count == 1
+
+        # A different query is not served from cache
+        await provider.get_completed_jobs(limit=20)
+        assert scheduler.list_completed_jobs.call_count == 2
+
+        # Cancelling a job invalidates the cache
+        await provider.cancel_job("2")
+        await provider.get_completed_jobs(limit=10)
+        assert scheduler.list_completed_jobs.call_count == 3
+
+    async def test_watch_log_shares_one_reader(self, tmp_path, monkeypatch):
+        """Test that log subscribers share a reader and receive appended lines."""
+        monkeypatch.setattr("hpc_runner.tui.providers.jobs.LOG_POLL_INTERVAL", 0.01)
+        log = tmp_path / "job.out"
+        log.write_text("old\n")
+        provider = JobProvider(MagicMock())
+
+        first = provider.watch_log(log, offset=log.stat().st_size)
+        second = provider.watch_log(log)
+        assert len(provider._log_followers) == 1
+
+        with log.open("a") as f:
+            f.write("new line\npartial")
+        assert await asyncio.wait_for(first.get(), timeout=2) == "new line"
+        assert await asyncio.wait_for(second.get(), timeout=2) == "new line"
+        assert first.empty()
+
+        provider.unwatch_log(log, first)
+        assert log in provider._log_followers
+        provider.unwatch_log(log, second)
+        assert log not in provider._log_followers
+
+    async def test_log_follower_closes_file_opened_after_stop(self, tmp_path, monkeypatch):
+        """Test that stopping mid-read closes the file once the read finishes."""
+        log = tmp_path / "job.out"
+        log.write_text("line\n")
+        opened = []
+        entered = threading.Event()
+        release = threading.Event()
+
+        def slow_open(*args, **kwargs):
+            entered.set()
+            release.wait(timeout=5)
+            f = open(*args, **kwargs)
+            opened.append(f)
+            return f
+
+        monkeypatch.setattr("hpc_runner.tui.providers.jobs.open", slow_open, raising=False)
+        follower = _LogFollower(log, 0)
+        follower.start()
+        assert await asyncio.to_thread(entered.wait, 5)
+
+        # Stop while the first read is still opening the file
+        follower.stop()
+        await asyncio.sleep(0)
+        release.set()
+
+        for _ in range(200):
+            if opened and opened[0].closed:
+                break
+            await asyncio.sleep(0.01)
+        assert len(opened) == 1
+        assert opened[0].closed
@@ -1,201 +1,162 @@
 """Tests for JobTable component."""
 
+from dataclasses import replace
+from datetime import timedelta
+
 import pytest
+from textual.app import App, ComposeResult
 
-from hpc_runner.core.job_info import JobInfo
 from hpc_runner.core.result import JobStatus
 from hpc_runner.tui.components.job_table import JobTable
 
+from ._helpers import make_job
 
-def make_job(
-    job_id: str,
-    name: str = "test_job",
-    user: str = "testuser",
-    status: JobStatus = JobStatus.RUNNING,
-    queue: str | None = "batch.q",
-    cpu: int | None = 4,
-) -> JobInfo:
-    """Helper to create JobInfo objects for testing."""
-    return JobInfo(
-        job_id=job_id,
-        name=name,
-        user=user,
-        status=status,
-        queue=queue,
-        cpu=cpu,
-    )
-
-
-class TestJobTable:
-    """Tests for JobTable widget."""
-
-    @pytest.mark.asyncio
-    async def test_table_renders(self):
-        """Test that table renders without error."""
-        from textual.app import App, ComposeResult
+# Above the table's 101-column minimum so the name column can expand
+_APP_SIZE = (120, 25)
 
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                yield JobTable(id="jobs")
 
-        app = TestApp()
-        async with app.run_test() as pilot:
-            table = app.query_one(JobTable)
-            assert table is not None
-            assert table.is_empty
+class JobTableApp(App[None]):
+    """App hosting a single JobTable and recording its JobSelected messages."""
 
-    @pytest.mark.asyncio
-    async def test_table_columns(self):
-        """Test that table has correct columns."""
-        from textual.app import App, ComposeResult
-
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                yield JobTable(id="jobs")
-
-        app = TestApp()
-        async with app.run_test() as pilot:
-            table = app.query_one(JobTable)
-
-            # Check column count
-            assert len(table.columns) == 7
-
-            # Check column keys
-            column_keys = [col.key for col in table.columns.values()]
-            assert "job_id" in column_keys
-            assert "name" in column_keys
-            assert "user" in column_keys
-            assert "queue" in column_keys
-            assert "status" in column_keys
-            assert "runtime" in column_keys
-            assert "slots" in column_keys
-
-    @pytest.mark.asyncio
-    async def test_update_jobs(self):
-        """Test updating table with jobs."""
-        from textual.app import App, ComposeResult
+    def __init__(self) -> None:
+        super().__init__()
+        self.selected: list[JobTable.JobSelected] = []
 
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                yield JobTable(id="jobs")
+    def compose(self) -> ComposeResult:
+        yield JobTable(id="jobs")
 
-        app = TestApp()
-        async with app.run_test() as pilot:
-            table = app.query_one(JobTable)
+    def on_job_table_job_selected(self, event: JobTable.JobSelected) -> None:
+        self.selected.append(event)
 
-            # Add some jobs
-            jobs = [
-                make_job("12345", "job1", status=JobStatus.RUNNING),
-                make_job("12346", "job2", status=JobStatus.PENDING),
-                make_job("12347", "job3", status=JobStatus.COMPLETED),
-            ]
-            table.update_jobs(jobs)
 
-            assert table.job_count == 3
-            assert not table.is_empty
-            assert table.row_count == 3
+@pytest.fixture
+async def table_app():
+    """Yield (app, pilot, table) for a running JobTableApp."""
+    app = JobTableApp()
+    async with app.run_test(size=_APP_SIZE) as pilot:
+        yield app, pilot, app.query_one(JobTable)
 
-    @pytest.mark.asyncio
-    async def test_update_jobs_clears_previous(self):
-        """Test that update_jobs clears previous data."""
-        from textual.app import App, ComposeResult
 
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                yield JobTable(id="jobs")
+class TestJobTable:
+    """Tests for JobTable widget."""
 
-        app = TestApp()
-        async with app.run_test() as pilot:
-            table = app.query_one(JobTable)
+    async def test_table_renders(self, table_app):
+        """Test that table renders without error."""
+        _, _, table = table_app
+        assert table is not None
+        assert table.is_empty
 
-            # Add initial jobs
-            table.update_jobs([make_job("111"), make_job("222")])
-            assert table.job_count == 2
+    async def test_table_columns(self, table_app):
+        """Test that table has correct columns."""
+        _, _, table = table_app
+
+        # Check column count
+        assert len(table.columns) == 7
+
+        # Check column keys
+        column_keys = [col.key for col in table.columns.values()]
+        assert "job_id" in column_keys
+        assert "name" in column_keys
+        assert "user" in column_keys
+        assert "queue" in column_keys
+        assert "status" in column_keys
+        assert "runtime" in column_keys
+        assert "slots" in column_keys
+
+    async def test_update_jobs(self, table_app):
+        """Test updating table with jobs."""
+        _, _, table = table_app
 
-            # Update with new jobs
-            table.update_jobs([make_job("333")])
-            assert table.job_count == 1
+        # Add some jobs
+        jobs = [
+            make_job("12345", "job1", status=JobStatus.RUNNING),
+            make_job("12346", "job2", status=JobStatus.PENDING),
+            make_job("12347", "job3", status=JobStatus.COMPLETED),
+        ]
+        table.update_jobs(jobs)
 
-    @pytest.mark.asyncio
-    async def test_job_selected_message(self):
-        """Test that JobSelected message is emitted on row highlight."""
-        from textual.app import App, ComposeResult
+        assert table.job_count == 3
+        assert not table.is_empty
+        assert table.row_count == 3
 
-        messages_received = []
+    async def test_update_jobs_clears_previous(self, table_app):
+        """Test that update_jobs clears previous data."""
+        _, _, table = table_app
 
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                yield JobTable(id="jobs")
+        # Add initial jobs
+        table.update_jobs([make_job("111"), make_job("222")])
+        assert table.job_count == 2
 
-            def on_job_table_job_selected(
-                self, event: JobTable.JobSelected
-            ) -> None:
-                messages_received.append(event)
+        # Update with new jobs
+        table.update_jobs([make_job("333")])
+        assert table.job_count == 1
 
-        app = TestApp()
-        async with app.run_test() as pilot:
-            table = app.query_one(JobTable)
-            table.update_jobs([
+    async def test_job_selected_message(self, table_app):
+        """Test that JobSelected message is emitted on row highlight."""
+        app, pilot, table = table_app
+        table.update_jobs(
+            [
                 make_job("12345", "first_job"),
                 make_job("12346", "second_job"),
-            ])
+            ]
+        )
 
-            # Focus and navigate
-            table.focus()
-            await pilot.pause()
+        # Focus and navigate
+        table.focus()
+        await pilot.pause(0)
 
-            # Move down to trigger highlight
-            await pilot.press("down")
-            await pilot.pause()
+        # Move down to trigger highlight (JobSelected is debounced)
+        await pilot.press("down")
+        await pilot.pause(table.SELECT_DEBOUNCE * 2)
 
-            # Should have received at least one message
-            assert len(messages_received) >= 1
-            # Last message should be for second job
-            assert messages_received[-1].job_id == "12346"
+        # Should have received at least one message
+        assert len(app.selected) >= 1
+        # Last message should be for second job
+        assert app.selected[-1].job_id == "12346"
 
-    @pytest.mark.asyncio
-    async def test_status_formatting(self):
+    async def test_status_formatting(self, table_app):
         """Test that status values are formatted correctly."""
-        from textual.app import App, ComposeResult
-
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                yield JobTable(id="jobs")
-
-        app = TestApp()
-        async with app.run_test() as pilot:
-            table = app.query_one(JobTable)
-
-            # Check status formatting
-            assert table._format_status(JobStatus.RUNNING) == "RUNNING"
-            assert table._format_status(JobStatus.PENDING) == "PENDING"
-            assert table._format_status(JobStatus.COMPLETED) == "COMPLETE"
-            assert table._format_status(JobStatus.FAILED) == "FAILED"
-            assert table._format_status(JobStatus.CANCELLED) == "CANCEL"
+        _, _, table = table_app
+        statuses = [
+            JobStatus.RUNNING,
+            JobStatus.PENDING,
+            JobStatus.COMPLETED,
+            JobStatus.FAILED,
+            JobStatus.CANCELLED,
+        ]
+        table.update_jobs([make_job(str(i), status=s) for i, s in enumerate(statuses)])
+
+        # Status is the fifth column
+        displayed = [table.get_row_at(i)[4] for i in range(len(statuses))]
+        assert displayed == ["RUNNING", "PENDING", "COMPLETE", "FAILED", "CANCEL"]
+
+    @pytest.mark.parametrize(
+        ("runtime", "expected"),
+        [
+            (None, "—"),
+            (timedelta(seconds=59.9), "59s"),
+            (timedelta(minutes=5), "5m"),
+            (timedelta(hours=2, minutes=15), "2h 15m"),
+            (timedelta(days=1, hours=3), "1d 3h"),
+        ],
+    )
+    def test_runtime_formatting(self, runtime, expected):
+        """Test that runtimes are formatted in whole seconds."""
+        assert replace(make_job("12345"), runtime=runtime).runtime_display == expected
 
-    @pytest.mark.asyncio
-    async def test_empty_queue_displayed_as_dash(self):
+    async def test_empty_queue_displayed_as_dash(self, table_app):
         """Test that None queue is displayed as dash."""
-        from textual.app import App, ComposeResult
-
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                yield JobTable(id="jobs")
+        _, _, table = table_app
 
-        app = TestApp()
-        async with app.run_test() as pilot:
-            table = app.query_one(JobTable)
+        # Add job with no queue
+        job = make_job("12345", queue=None)
+        table.update_jobs([job])
 
-            # Add job with no queue
-            job = make_job("12345", queue=None)
-            table.update_jobs([job])
+        # Get row data - queue column (index 3, after user) should be "—"
+        row = table.get_row_at(0)
+        assert row[3] == "—"
 
-            # Get row data - queue column (index 3, after user) should be "—"
-            row = table.get_row_at(0)
-            assert row[3] == "—"
-
-    @pytest.mark.asyncio
-    async def test_no_horizontal_scrollbar_at_sufficient_width(self):
+    async def test_no_horizontal_scrollbar_at_sufficient_width(self, table_app):
         """Test that no horizontal scrollbar appears when terminal is wide enough.
 
         The minimum width is calculated as:
@@ -205,66 +166,96 @@ class TestJobTable:
         - Container overhead: 8 chars
         Total minimum: 64 + 15 + 14 + 8 = 101 chars
         """
-        from textual.app import App, ComposeResult
-
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                yield JobTable(id="jobs")
+        _, pilot, table = table_app
 
-        # Test at various widths above minimum (101)
-        for width in [120, 160, 200]:
-            app = TestApp()
-            async with app.run_test(size=(width, 25)) as pilot:
-                table = app.query_one(JobTable)
+        # Add a job to ensure table has content
+        table.update_jobs([make_job("12345", "test_job")])
 
-                # Add a job to ensure table has content
-                table.update_jobs([make_job("12345", "test_job")])
-                await pilot.pause()
+        # Widths above the minimum (101), reached by resizing one app
+        for width in (120, 160, 200):
+            await pilot.resize_terminal(width, _APP_SIZE[1])
+            await pilot.pause()
 
-                # Check no horizontal scrollbar
-                assert not table.show_horizontal_scrollbar, (
-                    f"Unexpected horizontal scrollbar at width {width}"
-                )
+            assert not table.show_horizontal_scrollbar, f"scrollbar at width {width}"
 
-    @pytest.mark.asyncio
-    async def test_name_column_width_calculation(self):
+    async def test_name_column_width_calculation(self, table_app):
         """Test that name column width expands beyond the minimum."""
-        from textual.app import App, ComposeResult
-
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                yield JobTable(id="jobs")
-
         # At width 120, name should expand beyond its minimum width
-        app = TestApp()
-        async with app.run_test(size=(120, 25)) as pilot:
-            table = app.query_one(JobTable)
-            await pilot.pause()
+        _, pilot, table = table_app
+        await pilot.pause()
 
-            assert table._name_col_width >= table.NAME_COL_MIN
+        assert table._name_col_width >= table.NAME_COL_MIN
 
-    @pytest.mark.asyncio
-    async def test_long_job_name_truncated(self):
+    async def test_long_job_name_truncated(self, table_app):
         """Test that long job names are truncated with ellipsis."""
-        from textual.app import App, ComposeResult
-
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                yield JobTable(id="jobs")
-
-        app = TestApp()
-        async with app.run_test(size=(120, 25)) as pilot:
-            table = app.query_one(JobTable)
-
-            # Create a job with a very long name
-            long_name = "a" * 100
-            table.update_jobs([make_job("12345", long_name)])
-
-            # Get the displayed name from the row
-            row = table.get_row_at(0)
-            displayed_name = row[1]  # Name is second column
-
-            # Should be truncated (shorter than original)
-            assert len(displayed_name) < len(long_name)
-            # Should end with ellipsis
-            assert displayed_name.endswith("…")
+        _, _, table = table_app
+
+        # Create a job with a very long name
+        long_name = "a" * 100
+        table.update_jobs([make_job("12345", long_name)])
+
+        # Get the displayed name from the row
+        row = table.get_row_at(0)
+        displayed_name = row[1]  # Name is second column
+
+        # Should be truncated (shorter than original)
+        assert len(displayed_name) < len(long_name)
+        # Should end with ellipsis
+        assert displayed_name.endswith("…")
+
+    async def test_selection_preserved_across_update(self, table_app):
+        """Test that the selected job stays selected when rows are reordered."""
+        _, pilot, table = table_app
+        table.update_jobs([make_job("111"), make_job("222"), make_job("333")])
+        table.move_cursor(row=1)
+        await pilot.pause(0)
+
+        # Same jobs in a different order - cursor should follow job 222
+        table.update_jobs([make_job("333"), make_job("111"), make_job("222")])
+        await pilot.pause(0)
+
+        assert table._get_row_index("222") == 2
+        assert table.cursor_row == 2
+        assert table.get_selected_job().job_id == "222"
+
+    async def test_update_jobs_updates_changed_cells(self, table_app):
+        """Test that a status change is applied in place without re-adding rows."""
+        _, _, table = table_app
+        table.update_jobs([make_job("111"), make_job("222", status=JobStatus.PENDING)])
+        row_keys = list(table.rows)
+
+        table.update_jobs([make_job("111"), make_job("222", status=JobStatus.RUNNING)])
+
+        assert list(table.rows) == row_keys
+        assert table.get_row_at(1)[4] == "RUNNING"
+        assert table.job_count == 2
+
+    async def test_update_jobs_adds_and_removes_rows(self, table_app):
+        """Test that vanished jobs are removed and new jobs appended."""
+        _, _, table = table_app
+        table.update_jobs([make_job("111"), make_job("222"), make_job("333")])
+
+        table.update_jobs([make_job("111"), make_job("333"), make_job("444")])
+
+        assert [table.get_row_at(i)[0] for i in range(table.row_count)] == [
+            "111",
+            "333",
+            "444",
+        ]
+        assert table._get_row_index("444") == 2
+        assert table._get_row_index("222") is None
+
+    async def test_job_selected_debounced(self, table_app):
+        """Test that rapid cursor movement emits JobSelected only once."""
+        app, pilot, table = table_app
+        table.update_jobs([make_job("1"), make_job("2"), make_job("3")])
+        table.focus()
+        await pilot.pause(table.SELECT_DEBOUNCE * 2)
+        app.selected.clear()
+
+        # Two cursor moves within the debounce window
+        table.move_cursor(row=1)
+        table.move_cursor(row=2)
+        await pilot.pause(table.SELECT_DEBOUNCE * 2)
+
+        assert [m.job_id for m in app.selected] == ["3"]
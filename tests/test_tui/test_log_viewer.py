@@ -0,0 +1,24 @@
+"""Tests for LogViewerScreen."""
+
+from textual.app import App
+from textual.widgets import RichLog
+
+from hpc_runner.tui.screens.log_viewer import VIEW_MAX_LINES, LogViewerScreen
+
+
+async def test_log_widget_is_bounded(tmp_path):
+    """Lines appended past the cap drop the oldest ones."""
+    log_file = tmp_path / "job.out"
+    log_file.write_text("first\n")
+
+    app: App[None] = App()
+    async with app.run_test(size=(80, 24)) as pilot:
+        await app.push_screen(LogViewerScreen(log_file))
+        await pilot.pause()
+        log_view = app.screen.query_one("#log-viewer-content", RichLog)
+
+        for i in range(VIEW_MAX_LINES + 10):
+            log_view.write(f"line {i}")
+
+        assert log_view.max_lines == VIEW_MAX_LINES
+        assert len(log_view.lines) == VIEW_MAX_LINES
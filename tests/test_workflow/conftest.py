@@ -1,19 +1,22 @@
 """Test fixtures for workflow tests."""
 
-from unittest.mock import patch
-
 import pytest
 
 from hpc_runner.core.config import HPCConfig
 
+# One config shared by every workflow test. Job() only ever sees deep copies
+# of its job config lookups, so nothing a test does reaches this instance.
+_DEFAULT_CFG = HPCConfig()
+
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="package", autouse=True)
 def _isolate_config():
     """Prevent pipeline tests from reading real config files.
 
-    Job() calls get_config() internally.  Patching it here ensures
-    pipeline tests are deterministic regardless of the user's local
-    configuration files.
+    Job() calls get_config() internally.  Patching it once for the whole
+    package ensures pipeline tests are deterministic regardless of the
+    user's local configuration files.
     """
-    with patch("hpc_runner.core.config.get_config", return_value=HPCConfig()):
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("hpc_runner.core.config.get_config", lambda: _DEFAULT_CFG)
         yield
@@ -1,13 +1,70 @@
 """Tests for Pipeline API."""
 
+import threading
+from collections.abc import Collection
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from hpc_runner.core.config import HPCConfig
+from hpc_runner.core.job import Job
 from hpc_runner.workflow import DependencyType, Pipeline
 
 
+class _StubResult:
+    """Submitted-job stand-in that logs status polls and waits to its scheduler."""
+
+    def __init__(self, job_id: str, events: list[str], done: bool = True) -> None:
+        self.job_id = job_id
+        self.done = done
+        self.poll_interval: float | None = None
+        self._events = events
+
+    @property
+    def is_complete(self) -> bool:
+        self._events.append(f"poll {self.job_id}")
+        return self.done
+
+    def wait(self, poll_interval: float = 5.0) -> None:
+        self.poll_interval = poll_interval
+        self._events.append(f"wait {self.job_id}")
+
+
+class _StubScheduler:
+    """Scheduler stand-in that records submissions (cheaper than MagicMock).
+
+    Each submit() takes the next of ``outcomes``: a job ID to return or an
+    exception to raise.  With no outcomes the job's own name is its ID, and
+    jobs named in ``fail`` raise instead.  Results of jobs named in ``stuck``
+    never complete.
+    """
+
+    def __init__(
+        self,
+        *outcomes: str | Exception,
+        fail: Collection[str] = (),
+        stuck: Collection[str] = (),
+    ) -> None:
+        self._outcomes = iter(outcomes) if outcomes else None
+        self._fail = fail
+        self._stuck = stuck
+        # Jobs in one level are submitted from worker threads
+        self._lock = threading.Lock()
+        self.submitted: list[Job] = []
+        self.events: list[str] = []
+
+    def submit(self, job: Job) -> _StubResult:
+        with self._lock:
+            self.submitted.append(job)
+            outcome = job.name if self._outcomes is None else next(self._outcomes)
+            if job.name in self._fail:
+                outcome = RuntimeError("submit failed")
+            if isinstance(outcome, Exception):
+                raise outcome
+            self.events.append(f"submit {job.name}")
+            return _StubResult(outcome, self.events, done=job.name not in self._stuck)
+
+
 class TestPipeline:
     """Tests for Pipeline class."""
 
@@ -91,6 +148,30 @@ class TestPipeline:
         assert step1_idx < step2_idx
         assert step3_idx < step2_idx
 
+    def test_topological_sort_cached_until_add(self):
+        """Sorted order is reused until a job is added."""
+        p = Pipeline()
+        p.add("echo step1", name="step1")
+
+        first = p._topological_sort()
+        assert p._topological_sort() is first
+
+        p.add("echo step2", name="step2", depends_on=["step1"])
+        second = p._topological_sort()
+        assert second is not first
+        assert [j.name for j in second] == ["step1", "step2"]
+
+    def test_dependency_from_other_pipeline_raises(self):
+        """Depending on a job owned by another pipeline is rejected."""
+        other = Pipeline("other")
+        foreign = other.add("echo foreign", name="foreign")
+
+        p = Pipeline()
+        p.add("echo local", name="local", depends_on=[foreign])
+
+        with pytest.raises(ValueError, match="not part of this pipeline"):
+            p._topological_sort()
+
     def test_circular_dependency_raises(self):
         """Test that circular dependencies raise error."""
         p = Pipeline()
@@ -115,14 +196,13 @@ class TestPipeline:
 
     def test_context_manager_auto_submits(self):
         """Context manager auto-submits on clean exit."""
-        mock_scheduler = MagicMock()
-        mock_scheduler.submit.return_value = MagicMock(job_id="1")
+        scheduler = _StubScheduler("1")
 
-        with Pipeline("test", scheduler=mock_scheduler) as p:
+        with Pipeline("test", scheduler=scheduler) as p:
             p.add("echo hello", name="step1")
 
         assert len(p) == 1
-        mock_scheduler.submit.assert_called_once()
+        assert len(scheduler.submitted) == 1
         assert p.results["step1"].job_id == "1"
 
     def test_context_manager_skips_submit_on_exception(self):
@@ -161,23 +241,15 @@ class TestPipeline:
         p.add("echo step1", name="step1")
         p.add("echo step2", name="step2", depends_on=["step1"])
 
-        # Create mock scheduler
-        mock_scheduler = MagicMock()
-        mock_result1 = MagicMock()
-        mock_result1.job_id = "123"
-        mock_result2 = MagicMock()
-        mock_result2.job_id = "456"
-
-        mock_scheduler.submit.side_effect = [mock_result1, mock_result2]
+        scheduler = _StubScheduler("123", "456")
 
-        p.submit(scheduler=mock_scheduler)
+        p.submit(scheduler=scheduler)
 
         # Check that step2's job has step1's result as dependency
-        calls = mock_scheduler.submit.call_args_list
-        assert len(calls) == 2
+        assert len(scheduler.submitted) == 2
 
         # The second job should have dependencies set
-        second_job = calls[1][0][0]
+        second_job = scheduler.submitted[1]
         assert len(second_job.dependencies) == 1
         assert second_job.dependencies[0].job_id == "123"
 
@@ -190,27 +262,29 @@ class TestPipeline:
         # Before submission — empty
         assert p.results == {}
 
-        mock_scheduler = MagicMock()
-        mock_scheduler.submit.side_effect = [
-            MagicMock(job_id="1"),
-            MagicMock(job_id="2"),
-        ]
-        p.submit(scheduler=mock_scheduler)
+        p.submit(scheduler=_StubScheduler())
 
         assert len(p.results) == 2
-        assert p.results["step1"].job_id == "1"
-        assert p.results["step2"].job_id == "2"
+        assert p.results["step1"].job_id == "pipeline_step1"
+        assert p.results["step2"].job_id == "pipeline_step2"
 
     def test_constructor_scheduler_used_by_submit(self):
         """Scheduler passed to __init__ is used by submit()."""
-        mock_scheduler = MagicMock()
-        mock_scheduler.submit.return_value = MagicMock(job_id="1")
+        scheduler = _StubScheduler("1")
 
-        p = Pipeline("test", scheduler=mock_scheduler)
+        p = Pipeline("test", scheduler=scheduler)
         p.add("echo hello", name="step1")
         p.submit()
 
-        mock_scheduler.submit.assert_called_once()
+        assert len(scheduler.submitted) == 1
+
+    def test_reexports_share_one_implementation(self):
+        """Top-level and workflow re-exports resolve to the same classes."""
+        import hpc_runner
+        from hpc_runner.workflow import pipeline
+
+        assert hpc_runner.Pipeline is pipeline.Pipeline is Pipeline
+        assert hpc_runner.PipelineJob is pipeline.PipelineJob
 
 
 class TestPipelineConfig:
@@ -304,12 +378,11 @@ class TestPipelinePerJobDependencyType:
             dependency_type=DependencyType.AFTERANY,
         )
 
-        mock_scheduler = MagicMock()
-        mock_scheduler.submit.side_effect = [MagicMock(job_id="1"), MagicMock(job_id="2")]
+        scheduler = _StubScheduler("1", "2")
 
-        p.submit(scheduler=mock_scheduler)
+        p.submit(scheduler=scheduler)
 
-        second_job = mock_scheduler.submit.call_args_list[1][0][0]
+        second_job = scheduler.submitted[1]
         assert second_job.dependency_type == "afterany"
 
     def test_mixed_dependency_types(self):
@@ -329,15 +402,14 @@ class TestPipelinePerJobDependencyType:
             dependency_type=DependencyType.AFTERANY,
         )
 
-        mock_scheduler = MagicMock()
-        results = [MagicMock(job_id=str(i)) for i in range(3)]
-        mock_scheduler.submit.side_effect = results
+        scheduler = _StubScheduler()
 
-        p.submit(scheduler=mock_scheduler)
+        p.submit(scheduler=scheduler)
 
-        calls = mock_scheduler.submit.call_args_list
-        assert calls[1][0][0].dependency_type == "afterok"
-        assert calls[2][0][0].dependency_type == "afterany"
+        # step2 and cleanup share a level and may be submitted in any order
+        submitted = {job.name: job for job in scheduler.submitted}
+        assert submitted["pipeline_step2"].dependency_type == "afterok"
+        assert submitted["pipeline_cleanup"].dependency_type == "afterany"
 
 
 class TestPipelinePartialSubmission:
@@ -348,19 +420,18 @@ class TestPipelinePartialSubmission:
         p = Pipeline()
 
         with pytest.raises(RuntimeError, match="no jobs to submit"):
-            p.submit(scheduler=MagicMock())
+            p.submit(scheduler=_StubScheduler())
 
     def test_submit_already_submitted_raises(self):
         """Submitting a fully-submitted pipeline raises."""
         p = Pipeline()
         p.add("echo hello", name="step1")
 
-        mock_scheduler = MagicMock()
-        mock_scheduler.submit.return_value = MagicMock(job_id="1")
-        p.submit(scheduler=mock_scheduler)
+        scheduler = _StubScheduler()
+        p.submit(scheduler=scheduler)
 
         with pytest.raises(RuntimeError, match="already been submitted"):
-            p.submit(scheduler=mock_scheduler)
+            p.submit(scheduler=scheduler)
 
     def test_partial_failure_can_retry(self):
         """After a partial failure, submit() retries only unsubmitted jobs."""
@@ -369,14 +440,9 @@ class TestPipelinePartialSubmission:
         p.add("echo step2", name="step2", depends_on=["step1"])
         p.add("echo step3", name="step3", depends_on=["step2"])
 
-        mock_scheduler = MagicMock()
-        mock_result1 = MagicMock(job_id="1")
-
         # First submit: step1 succeeds, step2 fails
-        mock_scheduler.submit.side_effect = [mock_result1, RuntimeError("submit failed")]
-
         with pytest.raises(RuntimeError, match="submit failed"):
-            p.submit(scheduler=mock_scheduler)
+            p.submit(scheduler=_StubScheduler("1", RuntimeError("submit failed")))
 
         # step1 has a result, step2 and step3 do not
         assert p.get_job("step1").result is not None
@@ -384,15 +450,61 @@ class TestPipelinePartialSubmission:
         assert p.get_job("step3").result is None
 
         # Retry: step1 is skipped, step2 and step3 are submitted
-        mock_result2 = MagicMock(job_id="2")
-        mock_result3 = MagicMock(job_id="3")
-        mock_scheduler.submit.side_effect = [mock_result2, mock_result3]
-        mock_scheduler.submit.reset_mock()
+        scheduler = _StubScheduler("2", "3")
 
-        results = p.submit(scheduler=mock_scheduler)
+        results = p.submit(scheduler=scheduler)
 
         assert len(results) == 3
-        assert mock_scheduler.submit.call_count == 2  # only step2 and step3
+        assert len(scheduler.submitted) == 2  # only step2 and step3
+
+    def test_failure_in_level_keeps_sibling_results(self):
+        """Siblings submitted alongside a failing job keep their results."""
+        p = Pipeline()
+        p.add("echo ok", name="ok")
+        p.add("echo bad", name="bad")
+        p.add("echo after", name="after", depends_on=["ok", "bad"])
+
+        scheduler = _StubScheduler(fail={"pipeline_bad"})
+
+        with pytest.raises(RuntimeError, match="submit failed"):
+            p.submit(scheduler=scheduler, max_workers=2)
+
+        assert p.get_job("ok").result is not None
+        assert p.get_job("bad").result is None
+        assert p.get_job("after").result is None
+        assert len(scheduler.submitted) == 2
+
+    def test_default_submits_sequentially_in_job_order(self):
+        """By default jobs are submitted in add() order from the calling thread."""
+        p = Pipeline()
+        p.add("echo a", name="a")
+        p.add("echo b", name="b", depends_on=["a"])
+        p.add("echo c", name="c")
+
+        threads = []
+
+        class ThreadRecordingScheduler(_StubScheduler):
+            def submit(self, job: Job) -> _StubResult:
+                threads.append(threading.current_thread())
+                return super().submit(job)
+
+        scheduler = ThreadRecordingScheduler()
+        p.submit(scheduler=scheduler)
+
+        assert [job.name for job in scheduler.submitted] == [
+            "pipeline_a",
+            "pipeline_b",
+            "pipeline_c",
+        ]
+        assert threads == [threading.current_thread()] * 3
+
+    def test_max_workers_below_one_raises(self):
+        """submit() rejects a max_workers below 1."""
+        p = Pipeline()
+        p.add("echo hello", name="step1")
+
+        with pytest.raises(ValueError, match="max_workers"):
+            p.submit(scheduler=_StubScheduler(), max_workers=0)
 
     def test_wait_raises_on_no_submission(self):
         """wait() raises if nothing was submitted."""
@@ -408,15 +520,110 @@ class TestPipelinePartialSubmission:
         p.add("echo step1", name="step1")
         p.add("echo step2", name="step2", depends_on=["step1"])
 
-        mock_scheduler = MagicMock()
-        mock_scheduler.submit.side_effect = [MagicMock(job_id="1"), RuntimeError("fail")]
-
         with pytest.raises(RuntimeError):
-            p.submit(scheduler=mock_scheduler)
+            p.submit(scheduler=_StubScheduler("1", RuntimeError("fail")))
 
         with pytest.raises(RuntimeError, match="partial failure"):
             p.wait()
 
+    async def test_wait_async_waits_on_every_job(self):
+        """wait_async() waits on each submitted result."""
+        p = Pipeline()
+        p.add("echo step1", name="step1")
+        p.add("echo step2", name="step2")
+
+        scheduler = _StubScheduler()
+        p.submit(scheduler=scheduler)
+
+        results = await p.wait_async(poll_interval=0.1)
+
+        assert set(results) == {"step1", "step2"}
+        assert sorted(e for e in scheduler.events if e.startswith("wait")) == [
+            "wait pipeline_step1",
+            "wait pipeline_step2",
+        ]
+        for result in results.values():
+            assert result.poll_interval == 0.1
+
+
+class TestPipelineMaxInFlight:
+    """Tests for capping unfinished jobs during submit()."""
+
+    def test_polls_for_a_free_slot_when_full(self):
+        """Once the cap is reached, unfinished jobs are polled before submitting more."""
+        scheduler = _StubScheduler()
+        p = Pipeline("p")
+        p.add("echo a", name="a")
+        p.add("echo b", name="b")
+        p.add("echo c", name="c", depends_on=["a"])
+
+        p.submit(scheduler=scheduler, max_in_flight=2)
+
+        assert scheduler.events == [
+            "submit p_a",
+            "submit p_b",
+            "poll p_a",
+            "poll p_b",
+            "submit p_c",
+        ]
+
+    def test_stuck_job_does_not_block_a_freed_slot(self):
+        """A later job finishing frees a slot even if the oldest is stuck."""
+        scheduler = _StubScheduler(stuck={"p_a"})
+        p = Pipeline("p")
+        for name in ("a", "b", "c"):
+            p.add(f"echo {name}", name=name)
+
+        p.submit(scheduler=scheduler, max_in_flight=2, poll_interval=0)
+
+        assert [job.name for job in scheduler.submitted] == ["p_a", "p_b", "p_c"]
+
+    def test_times_out_when_no_job_finishes(self):
+        """submit() raises TimeoutError and can resume once a slot frees."""
+        scheduler = _StubScheduler(stuck={"p_a", "p_b"})
+        p = Pipeline("p")
+        for name in ("a", "b", "c"):
+            p.add(f"echo {name}", name=name)
+
+        with pytest.raises(TimeoutError, match="No submitted job finished"):
+            p.submit(scheduler=scheduler, max_in_flight=2, poll_interval=0, timeout=0)
+
+        assert p.get_job("c").result is None
+
+        p.get_job("a").result.done = True
+        p.submit(scheduler=scheduler, max_in_flight=2)
+        assert p.get_job("c").result is not None
+
+    def test_constructor_cap_used_by_submit(self):
+        """max_in_flight given to the constructor applies to submit()."""
+        scheduler = _StubScheduler()
+        p = Pipeline("p", max_in_flight=1)
+        p.add("echo a", name="a")
+        p.add("echo b", name="b")
+
+        p.submit(scheduler=scheduler)
+
+        assert scheduler.events == ["submit p_a", "poll p_a", "submit p_b"]
+
+    def test_no_cap_never_polls(self):
+        """Without a cap, submit() never checks on a job."""
+        scheduler = _StubScheduler()
+        p = Pipeline("p")
+        p.add("echo a", name="a")
+        p.add("echo b", name="b", depends_on=["a"])
+
+        p.submit(scheduler=scheduler)
+
+        assert scheduler.events == ["submit p_a", "submit p_b"]
+
+    def test_cap_below_one_raises(self):
+        """submit() rejects a max_in_flight below 1."""
+        p = Pipeline(max_in_flight=0)
+        p.add("echo hello", name="step1")
+
+        with pytest.raises(ValueError, match="max_in_flight"):
+            p.submit(scheduler=_StubScheduler())
+
 
 class TestDependencyType:
     """Tests for DependencyType enum."""